@@ -4,38 +4,74 @@ Fetches ENGLISH tafsir from QuranAPI community wrapper (Tazkirul Quran)
 Tazkirul Quran is naturally concise (700-1500 chars) - returns FULL content
 """
 
-import requests
-import json
 import os
 import re
 from typing import Optional, Dict
+from json_cache import open_json_cache
+from config import TAFSIR_SETTINGS
+from tafsir_store import TafsirStore
+from verse_store import VerseStoreError
+import http_pool
+
+
+TAFSIR_API = "https://quranapi.pages.dev/api"
+
+
+def extract_tafsir(data: Dict, author: str = None) -> Optional[str]:
+    """
+    Pull one author's tafsir out of a /tafsir/SURAH_AYAH.json document
+
+    Each document carries every author; only the matching entry is kept.
+
+    Args:
+        data: Parsed API response ({"tafsirs": [{"author": ..., "content": ...}, ...]})
+        author: Substring of the author name (default: TAFSIR_SETTINGS['author'])
+
+    Returns:
+        Cleaned text (HTML stripped, whitespace collapsed) or None if the author has none
+    """
+    author = author or TAFSIR_SETTINGS['author']
+    tafsirs = data.get("tafsirs", [])
+    entry = next((t for t in tafsirs if author in t.get('author', '')), None)
+    if not entry:
+        return None
+
+    tafsir_text = entry.get("content", "")
+    # Clean HTML tags if any
+    tafsir_text = re.sub(r'<[^>]+>', '', tafsir_text)
+    # Clean extra whitespace
+    tafsir_text = re.sub(r'\s+', ' ', tafsir_text)
+    return tafsir_text.strip() or None
 
 
 class AutoTafsirFetcher:
     def __init__(self):
         # Community wrapper API - has English Ibn Kathir tafsir
-        self.base_url = "https://quranapi.pages.dev/api"
+        self.base_url = TAFSIR_API
         
         self.cache_file = "tafsir_cache.json"
         self.cache = self.load_cache()
+        self.store = self.load_store()
     
     def load_cache(self):
-        """Load cached tafsir to avoid repeated API calls"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        """Load cached tafsir to avoid repeated API calls (shared, write-behind)"""
+        return open_json_cache(self.cache_file)
     
-    def save_cache(self):
-        """Save cache to file"""
+    def load_store(self):
+        """Prefetched tafsir corpus (tafsir_prefetch.py) - None if it hasn't been built"""
+        store_file = TAFSIR_SETTINGS['store']
+        if not os.path.exists(store_file):
+            return None
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"⚠️  Could not save tafsir cache: {e}")
+            return TafsirStore(store_file)
+        except VerseStoreError as e:
+            print(f"⚠️  Ignoring tafsir store: {e}")
+            return None
+    
+    def save_cache(self):
+        """Write unsaved tafsir now (otherwise flushed in batches and at exit)"""
+        if not self.cache.flush():
+            print(f"⚠️  Could not save tafsir cache")
     
     def fetch_tafsir(self, surah: int, ayah: int) -> Optional[str]:
         """
@@ -54,7 +90,14 @@ class AutoTafsirFetcher:
         """
         cache_key = f"{surah}:{ayah}"
         
-        # Check cache first
+        # Prefetched corpus first ('' = the author has no tafsir for this ayah)
+        if self.store is not None:
+            stored = self.store.get(surah, ayah)
+            if stored is not None:
+                print(f"📚 Using stored tafsir for {cache_key}")
+                return stored or None
+        
+        # Then the JSON cache
         if cache_key in self.cache:
             print(f"📚 Using cached tafsir for {cache_key}")
             return self.cache[cache_key]
@@ -65,34 +108,21 @@ class AutoTafsirFetcher:
             # Format: https://quranapi.pages.dev/api/tafsir/SURAH_AYAH.json
             url = f"{self.base_url}/tafsir/{surah}_{ayah}.json"
             
-            response = requests.get(url, timeout=15)
+            response = http_pool.get(url, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
-            
             # Find Tazkirul Quran tafsir (naturally concise, perfect for Instagram)
-            tafsirs = data.get("tafsirs", [])
-            tazkirul = next((t for t in tafsirs if 'Tazkirul' in t.get('author', '')), None)
+            tafsir_text = extract_tafsir(response.json())
             
-            if tazkirul:
-                tafsir_text = tazkirul.get("content", "")
+            if tafsir_text:
+                # NO SUMMARIZATION - Tazkirul Quran is naturally concise (700-1500 chars)
+                # Perfect for 1-2 Instagram slides with FULL authentic content
+                
+                # Cache it (persisted write-behind)
+                self.cache[cache_key] = tafsir_text
                 
-                if tafsir_text:
-                    # Clean HTML tags if any
-                    tafsir_text = re.sub(r'<[^>]+>', '', tafsir_text)
-                    # Clean extra whitespace
-                    tafsir_text = re.sub(r'\s+', ' ', tafsir_text)
-                    tafsir_text = tafsir_text.strip()
-                    
-                    # NO SUMMARIZATION - Tazkirul Quran is naturally concise (700-1500 chars)
-                    # Perfect for 1-2 Instagram slides with FULL authentic content
-                    
-                    # Cache it
-                    self.cache[cache_key] = tafsir_text
-                    self.save_cache()
-                    
-                    print(f"✅ Tazkirul Quran (FULL content): {len(tafsir_text)} chars")
-                    return tafsir_text
+                print(f"✅ Tazkirul Quran (FULL content): {len(tafsir_text)} chars")
+                return tafsir_text
             
             print(f"⚠️  No Tazkirul Quran tafsir found for {cache_key}")
             return None
@@ -0,0 +1,159 @@
+"""
+Background Engine - NumPy-backed slide backgrounds
+✅ Whole gradient built in ONE broadcast (no per-row ImageDraw.line calls)
+✅ Memoized per (theme colors, width, height) - a carousel pays for it once
+✅ Grain from a pre-computed bank of uint8 noise tiles (blend, not random draw)
+"""
+
+import numpy as np
+from PIL import Image
+
+
+# Process-wide gradient cache: (bg_colors, width, height) -> PIL Image
+# Shared by every generator instance so batch runs pay once per theme
+_GRADIENT_CACHE = {}
+
+# Process-wide grain banks: (noise, tiles, tile_size, seed) -> GrainTextureBank
+_GRAIN_BANKS = {}
+
+
+def hex_to_rgb(hex_color):
+    """Convert hex color to RGB tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def build_gradient_array(color1, color2, width, height):
+    """
+    Build a vertical gradient as a (height, width, 3) uint8 array
+
+    Same math as the old per-row loop (linear blend, truncated to int),
+    but computed for every row at once and broadcast across the width.
+
+    Args:
+        color1: Top RGB tuple
+        color2: Bottom RGB tuple
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        C-contiguous numpy array of shape (height, width, 3)
+    """
+    factor = (np.arange(height, dtype=np.float64) / height)[:, np.newaxis]
+    top = np.asarray(color1, dtype=np.float64)
+    bottom = np.asarray(color2, dtype=np.float64)
+
+    # One RGB value per row, truncated like int() did
+    rows = (top * (1 - factor) + bottom * factor).astype(np.uint8)
+
+    return np.ascontiguousarray(np.broadcast_to(rows[:, np.newaxis, :], (height, width, 3)))
+
+
+def get_gradient_background(bg_colors, width, height):
+    """
+    Get gradient background image for a theme (memoized)
+
+    Args:
+        bg_colors: Theme 'bg_colors' pair of hex strings (top, bottom)
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        New RGB PIL Image (a copy - callers may draw on it freely)
+    """
+    key = (tuple(bg_colors), width, height)
+
+    gradient = _GRADIENT_CACHE.get(key)
+    if gradient is None:
+        color1 = hex_to_rgb(bg_colors[0])
+        color2 = hex_to_rgb(bg_colors[1])
+        gradient = Image.fromarray(build_gradient_array(color1, color2, width, height))
+        _GRADIENT_CACHE[key] = gradient
+
+    return gradient.copy()
+
+
+def clear_gradient_cache():
+    """Drop all memoized gradients (e.g. after editing THEMES at runtime)"""
+    _GRADIENT_CACHE.clear()
+
+
+class GrainTextureBank:
+    """
+    Small bank of pre-generated uint8 noise tiles for film grain
+
+    The gaussian draw happens ONCE per bank (tiles x tile_size² x 3 bytes),
+    not once per slide. Each slide picks a tile and a random offset, wraps
+    the tile across the frame by modular indexing and blends it in with 8.8
+    fixed-point integer math. Only the uint8 tiles are kept in memory.
+    """
+
+    def __init__(self, noise=25, tiles=4, tile_size=256, seed=None):
+        """
+        Args:
+            noise: Standard deviation of the grain around mid-gray (128)
+            tiles: Number of distinct noise tiles in the bank
+            tile_size: Edge length of each square tile in pixels
+            seed: Optional seed - same seed gives byte-identical grain
+        """
+        self.noise = noise
+        self.tile_size = tile_size
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
+        grain = self.rng.normal(128, noise, (tiles, tile_size, tile_size, 3))
+        self.tiles = np.clip(np.rint(grain), 0, 255).astype(np.uint8)
+
+    def grain_frame(self, tile_index, dy, dx, width, height):
+        """
+        One noise tile wrapped over a width x height frame, starting at offset (dy, dx)
+
+        Returns:
+            uint8 array of shape (height, width, 3)
+        """
+        rows = (np.arange(height) + dy) % self.tile_size
+        cols = (np.arange(width) + dx) % self.tile_size
+        return self.tiles[tile_index][rows[:, np.newaxis], cols[np.newaxis, :]]
+
+    def apply(self, img, intensity, rng=None):
+        """
+        Blend grain into an RGB image
+
+        Equivalent to Image.blend(img, grain, intensity) but in integer math:
+        out = (img * (256 - a) + grain * a + 128) >> 8, with a = intensity * 256
+
+        Args:
+            img: RGB PIL Image
+            intensity: Grain strength 0.0-1.0 (GRAIN_INTENSITY)
+            rng: Optional numpy Generator for tile/offset choice (defaults to bank RNG)
+
+        Returns:
+            New RGB PIL Image
+        """
+        weight = int(round(intensity * 256))
+        if weight <= 0:
+            return img.copy()
+
+        rng = rng if rng is not None else self.rng
+        width, height = img.size
+
+        tile_index = int(rng.integers(len(self.tiles)))
+        dy = int(rng.integers(self.tile_size))
+        dx = int(rng.integers(self.tile_size))
+        grain = self.grain_frame(tile_index, dy, dx, width, height)
+
+        # grain * a + img * (256 - a) + 128 (rounding term) fits in uint16: 255*256 + 128 < 65536
+        base = np.asarray(img.convert('RGB'), dtype=np.uint16)
+        blended = (base * (256 - weight) + grain.astype(np.uint16) * weight + 128) >> 8
+
+        return Image.fromarray(blended.astype(np.uint8))
+
+
+def get_grain_bank(noise=25, tiles=4, tile_size=256, seed=None):
+    """Get the shared grain bank for these settings (built on first use)"""
+    key = (noise, tiles, tile_size, seed)
+    bank = _GRAIN_BANKS.get(key)
+    if bank is None:
+        bank = GrainTextureBank(noise=noise, tiles=tiles, tile_size=tile_size, seed=seed)
+        _GRAIN_BANKS[key] = bank
+    return bank
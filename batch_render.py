@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Batch Renderer - pre-render carousels for a whole range of verses
+✅ Any surah/ayah range (up to all 6,236 verses) in one run
+✅ Verses fanned out across all cores (one render process per core)
+✅ Finished carousels streamed to disk as they complete
+✅ Resumable - each verse is published atomically, finished verses are skipped
+✅ NEVER touches the posting ledger (rendering only, no posting)
+
+Usage:
+    python batch_render.py --from 1:1 --to 114:6
+    python batch_render.py --from 2:1 --to 2:286 --theme rotate --workers 8
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import multiprocessing
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from config import DEFAULT_THEME, ROTATION_THEMES, THEMES, PARALLEL_RENDER, BATCH_RENDER
+from quran_data import get_all_verses
+from verse_store import parse_key
+
+
+MANIFEST_FILE = "manifest.json"
+
+
+def verse_dir(output_dir, surah, ayah):
+    """Final output directory for one verse's carousel"""
+    return os.path.join(output_dir, f"{surah:03d}_{ayah:03d}")
+
+
+def is_done(output_dir, surah, ayah):
+    """A verse is done once its directory (with manifest) has been published"""
+    return os.path.exists(os.path.join(verse_dir(output_dir, surah, ayah), MANIFEST_FILE))
+
+
+def clean_partial_dirs(output_dir):
+    """Remove work-in-progress directories left behind by a crashed run"""
+    if not os.path.isdir(output_dir):
+        return 0
+
+    removed = 0
+    for name in os.listdir(output_dir):
+        if name.startswith('.tmp-'):
+            shutil.rmtree(os.path.join(output_dir, name), ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def pick_theme(theme, index):
+    """Fixed theme, or 'rotate' = same rotation as daily posts (by verse index)"""
+    if theme == 'rotate':
+        return ROTATION_THEMES[index % len(ROTATION_THEMES)]
+    return theme
+
+
+# ===== WORKER PROCESS =====
+# Render-only generators, one per theme, built lazily inside each worker
+
+_WORKER_GENERATORS = {}
+
+
+def _render_verse(verse_data, theme_name, output_dir, compositor, use_cache=True):
+    """
+    Plan, render and publish one verse's carousel (runs in a worker)
+
+    Slides are written into a private .tmp- directory which is renamed into
+    place only after the manifest is written - a crash mid-verse leaves no
+    half-finished carousel that a resumed run would mistake for done.
+
+    Returns:
+        (verse key, slide count, seconds)
+    """
+    from generate_post_cairo import QuranPostGeneratorCairo
+
+    start = time.perf_counter()
+    generator = _WORKER_GENERATORS.get(theme_name)
+    if generator is None:
+        generator = QuranPostGeneratorCairo(theme_name, render_only=True, use_cache=use_cache)
+        _WORKER_GENERATORS[theme_name] = generator
+
+    surah, ayah = verse_data['surah_number'], verse_data['ayah_number']
+    final_dir = verse_dir(output_dir, surah, ayah)
+    tmp_dir = os.path.join(output_dir, f".tmp-{surah:03d}_{ayah:03d}-{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    specs = generator.plan_slides(verse_data)  # Seeded like the verse's first-cycle post
+    slides = []
+    for i, spec in enumerate(specs, 1):
+        filename = f"slide{i}.png"
+        # Navigation arrows on all slides EXCEPT the last (CTA) slide
+        generator.render_slide_to_file(spec, i < len(specs), os.path.join(tmp_dir, filename), compositor)
+        slides.append(filename)
+
+    manifest = {
+        'surah_number': surah,
+        'ayah_number': ayah,
+        'surah_name': verse_data.get('surah_name'),
+        'theme': theme_name,
+        'slides': slides
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    # Re-render of a finished verse (e.g. --force): replace the old carousel
+    if os.path.exists(final_dir):
+        shutil.rmtree(final_dir)
+    os.replace(tmp_dir, final_dir)
+
+    return f"{surah}:{ayah}", len(slides), time.perf_counter() - start
+
+
+# ===== DRIVER =====
+
+def batch_render(start_key="1:1", end_key="114:6", theme=DEFAULT_THEME, workers=None,
+                 output_dir=None, compositor=None, force=False, use_cache=True):
+    """
+    Render carousels for every verse in [start_key, end_key] (inclusive)
+
+    Verse data is fetched in THIS process (single writer for the API/tafsir
+    caches), several verses at a time, while worker processes render -
+    fetching overlaps rendering, and at most in_flight_per_worker verses
+    per worker are queued at a time.
+
+    Args:
+        start_key: First verse, "surah:ayah"
+        end_key: Last verse, "surah:ayah"
+        theme: Theme name, or 'rotate' to follow ROTATION_THEMES by verse index
+        workers: Render processes (default: one per CPU core)
+        output_dir: Root directory for <surah>_<ayah>/ carousels
+        compositor: 'pil' or 'cairo' (default: PARALLEL_RENDER['compositor'])
+        force: Re-render verses that are already done
+        use_cache: Reuse finished slides from the render cache (False = render every slide)
+
+    Returns:
+        dict with rendered / skipped / failed counts and posts_per_minute
+    """
+    from generate_post_cairo import QuranPostGeneratorCairo
+
+    output_dir = output_dir or BATCH_RENDER['output_dir']
+    compositor = compositor or PARALLEL_RENDER['compositor']
+    workers = workers or os.cpu_count() or 1
+    start, end = parse_key(start_key), parse_key(end_key)
+
+    os.makedirs(output_dir, exist_ok=True)
+    removed = clean_partial_dirs(output_dir)
+    if removed:
+        print(f"🧹 Removed {removed} partial carousel(s) from an interrupted run")
+
+    # Work list: verses in range that aren't published yet
+    todo = []
+    skipped = 0
+    for index, meta in enumerate(get_all_verses()):
+        if not start <= (meta['surah'], meta['ayah']) <= end:
+            continue
+        if not force and is_done(output_dir, meta['surah'], meta['ayah']):
+            skipped += 1
+            continue
+        todo.append((index, meta))
+
+    print(f"📚 {len(todo)} verses to render, {skipped} already done ({start_key} → {end_key})")
+    if not todo:
+        return {'rendered': 0, 'skipped': skipped, 'failed': 0, 'posts_per_minute': 0.0}
+
+    # Parent generator: data fetching only (the posting ledger is never written)
+    fetcher = QuranPostGeneratorCairo(theme if theme != 'rotate' else DEFAULT_THEME)
+
+    # Render + persist static sprites once, so workers only ever read the sprite cache
+    themes = ROTATION_THEMES if theme == 'rotate' else [theme]
+    for theme_name in themes:
+        QuranPostGeneratorCairo(theme_name, render_only=True).warm_static_layers()
+
+    rendered = failed = 0
+    max_in_flight = workers * BATCH_RENDER['in_flight_per_worker']
+    batch_start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        pending = {}
+        queue = iter(todo)
+
+        while True:
+            # Keep the pool fed: fetch the verses for the free slots concurrently
+            while len(pending) < max_in_flight:
+                batch = list(islice(queue, max_in_flight - len(pending)))
+                if not batch:
+                    break
+                verses = fetcher.fetch_many_verse_data([meta for _, meta in batch])
+                for (index, meta), verse_data in zip(batch, verses):
+                    if not verse_data:
+                        print(f"⚠️  Could not fetch {meta['surah']}:{meta['ayah']}, skipping")
+                        failed += 1
+                        continue
+                    future = pool.submit(_render_verse, verse_data, pick_theme(theme, index),
+                                         output_dir, compositor, use_cache)
+                    pending[future] = f"{meta['surah']}:{meta['ayah']}"
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    _, slide_count, seconds = future.result()
+                except Exception as e:
+                    print(f"❌ {key} failed: {type(e).__name__}: {e}")
+                    failed += 1
+                    continue
+
+                rendered += 1
+                elapsed = time.perf_counter() - batch_start
+                rate = rendered / elapsed * 60
+                print(f"✅ {key}: {slide_count} slides ({seconds:.1f}s) "
+                      f"[{rendered + failed}/{len(todo)}, {rate:.1f} posts/min]")
+
+    elapsed = time.perf_counter() - batch_start
+    posts_per_minute = rendered / elapsed * 60 if elapsed > 0 else 0.0
+    print(f"\n🎉 Rendered {rendered} carousels in {elapsed:.1f}s on {workers} workers "
+          f"({posts_per_minute:.1f} posts/min), {failed} failed, {skipped} skipped")
+
+    return {'rendered': rendered, 'skipped': skipped, 'failed': failed,
+            'posts_per_minute': posts_per_minute}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render carousels for a range of verses")
+    parser.add_argument('--from', dest='start', default="1:1", help='First verse "surah:ayah" (default 1:1)')
+    parser.add_argument('--to', dest='end', default="114:6", help='Last verse "surah:ayah" (default 114:6)')
+    parser.add_argument('--theme', default=DEFAULT_THEME,
+                        help=f"Theme name ({', '.join(THEMES)}) or 'rotate'")
+    parser.add_argument('--workers', type=int, default=None, help='Render processes (default: CPU cores)')
+    parser.add_argument('--output', default=None, help=f"Output directory (default: {BATCH_RENDER['output_dir']})")
+    parser.add_argument('--compositor', choices=['pil', 'cairo'], default=None,
+                        help=f"Slide compositor (default: {PARALLEL_RENDER['compositor']})")
+    parser.add_argument('--force', action='store_true', help='Re-render verses that are already done')
+    parser.add_argument('--no-cache', action='store_true', help='Render every slide (skip the render cache)')
+    args = parser.parse_args()
+
+    if args.theme != 'rotate' and args.theme not in THEMES:
+        parser.error(f"Unknown theme '{args.theme}'")
+
+    result = batch_render(args.start, args.end, theme=args.theme, workers=args.workers,
+                          output_dir=args.output, compositor=args.compositor, force=args.force,
+                          use_cache=not args.no_cache)
+    sys.exit(1 if result['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
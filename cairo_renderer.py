@@ -36,6 +36,72 @@ import pangocffi as pango
 import pangocairocffi
 from PIL import Image
 import io
+import math
+from collections import namedtuple, OrderedDict
+from render_rng import PostRNG
+
+
+# Tight ink-extent text layer: Cairo ARGB32 surface + its top-left position on the slide
+TextSprite = namedtuple('TextSprite', ['surface', 'x', 'y'])
+
+# Extra pixels around the ink box so antialiased edges are never clipped
+SPRITE_PADDING = 2
+
+# Measured layout: total height (px) + per line (start char index, top px, bottom px)
+LayoutMetrics = namedtuple('LayoutMetrics', ['height', 'lines'])
+
+# Max layouts kept in the measurement LRU (per renderer)
+MEASURE_CACHE_SIZE = 512
+
+# Process-wide font description cache: "Family Size[unit]" -> pango.FontDescription
+_FONT_DESCRIPTIONS = {}
+_FONT_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+# Process-wide PangoContext on the default PangoCairo font map, shared by every layout
+_PANGO_CONTEXT = None
+
+
+def get_font_description(font_family, font_size, unit=''):
+    """
+    Get the FontDescription for "Family Size[unit]" (parsed once per process)
+    
+    Args:
+        font_family: Font family name (e.g. "Montserrat")
+        font_size: Size in points, or in pixels with unit='px'
+        unit: '' for points, 'px' for absolute pixel size
+    """
+    font_desc_str = f"{font_family} {font_size}{unit}"
+    font_description = _FONT_DESCRIPTIONS.get(font_desc_str)
+    if font_description is None:
+        _FONT_CACHE_STATS['misses'] += 1
+        font_description = pango.FontDescription(
+            pango.pango.pango_font_description_from_string(font_desc_str.encode('utf-8'))
+        )
+        _FONT_DESCRIPTIONS[font_desc_str] = font_description
+    else:
+        _FONT_CACHE_STATS['hits'] += 1
+    return font_description
+
+
+def get_pango_context():
+    """
+    Get the shared PangoContext for all layouts in this process
+    
+    pangocairocffi.create_layout() makes a fresh context per call, which drops
+    the fontset cache - so every layout re-resolved its fonts. One context keeps
+    resolved fonts warm across headings, references, watermarks and bodies.
+    """
+    global _PANGO_CONTEXT
+    if _PANGO_CONTEXT is None:
+        # Only the font options / identity matrix of a plain context are needed
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1)
+        _PANGO_CONTEXT = pangocairocffi.create_context(cairo.Context(surface))
+    return _PANGO_CONTEXT
+
+
+def font_cache_stats():
+    """Font description cache counters: {'hits', 'misses', 'size'}"""
+    return {**_FONT_CACHE_STATS, 'size': len(_FONT_DESCRIPTIONS)}
 
 
 class CairoArabicRenderer:
@@ -44,6 +110,8 @@ class CairoArabicRenderer:
     def __init__(self, width=1080, height=1350):
         self.width = width
         self.height = height
+        self._measure_cache = OrderedDict()  # (text, font, size, width, line_height) -> LayoutMetrics
+        self._measure_layout = None          # Reused for every measurement
         self._verify_fonts()
     
     def _verify_fonts(self):
@@ -63,6 +131,30 @@ class CairoArabicRenderer:
         except:
             print("⚠️  Could not verify fonts (fc-list not available)")
     
+    def _configure_layout(self, layout, font_family, font_size, max_width, alignment, line_height):
+        """Set width, alignment, spacing and font on a (new or reused) Pango layout"""
+        layout._set_width(pango.units_from_double(max_width))
+        
+        # Set alignment
+        if alignment == 'right':
+            layout._set_alignment(pango.Alignment.RIGHT)
+        elif alignment == 'center':
+            layout._set_alignment(pango.Alignment.CENTER)
+        else:
+            layout._set_alignment(pango.Alignment.LEFT)
+        
+        # Set line spacing
+        layout._set_spacing(pango.units_from_double(font_size * (line_height - 1)))
+        
+        # Set font with proper OpenType features
+        layout._set_font_description(get_font_description(font_family, font_size))
+    
+    def _create_layout(self, font_family, font_size, max_width, alignment, line_height):
+        """Create a Pango layout (on the shared context) with width, alignment, spacing and font set"""
+        layout = pango.Layout(get_pango_context())
+        self._configure_layout(layout, font_family, font_size, max_width, alignment, line_height)
+        return layout
+    
     def render_arabic_verse(self, text, font_family="Amiri", font_size=50, 
                           bg_color=(245, 242, 237), text_color=(80, 60, 40),
                           max_width=900, line_height=1.5, align='right', transparent_bg=False):
@@ -93,23 +185,7 @@ class CairoArabicRenderer:
             context.paint()
         
         # Create Pango layout
-        layout = pangocairocffi.create_layout(context)
-        layout._set_width(pango.units_from_double(max_width))
-        
-        # Set alignment
-        if align == 'right':
-            layout._set_alignment(pango.Alignment.RIGHT)
-        elif align == 'center':
-            layout._set_alignment(pango.Alignment.CENTER)
-        else:
-            layout._set_alignment(pango.Alignment.LEFT)
-        
-        layout._set_spacing(pango.units_from_double(font_size * (line_height - 1)))
-        
-        # Set font with proper OpenType features
-        font_desc_str = f"{font_family} {font_size}"
-        font_description = pango.pango.pango_font_description_from_string(font_desc_str.encode('utf-8'))
-        layout._set_font_description(pango.FontDescription(font_description))
+        layout = self._create_layout(font_family, font_size, max_width, align, line_height)
         
         # Set text
         layout._set_text(text)
@@ -144,15 +220,19 @@ class CairoArabicRenderer:
         # Convert Cairo surface to PIL Image
         return self._surface_to_pil(surface)
     
-    def highlight_random_words(self, text, theme_color="#FFD700", max_words=4):
+    def highlight_random_words(self, text, theme_color="#FFD700", max_words=4, rng=None):
         """
         Randomly highlight words in text for visual interest
         Highlights up to max_words important words (default 4)
         Returns text with Pango markup for bold and colored highlights
         
         NOTE: Text must NOT contain existing markup - this function adds markup
+        
+        Args:
+            rng: random.Random that picks the words (default: the global random module)
         """
         import random
+        rng = rng or random
         
         # Split into words, preserving punctuation
         words = text.split()
@@ -198,7 +278,7 @@ class CairoArabicRenderer:
         # Random selection - ensure we don't try to highlight more words than available
         # If we have fewer highlightable words, use what we have (min 1, max available)
         num_to_highlight = max(1, min(num_to_highlight, len(highlightable_indices)))
-        selected_indices = random.sample(highlightable_indices, num_to_highlight)
+        selected_indices = rng.sample(highlightable_indices, num_to_highlight)
         
         # Build highlighted text
         result = []
@@ -238,58 +318,13 @@ class CairoArabicRenderer:
         
         return ' '.join(result)
     
-    def render_english_text(self, text, font_family="Product Sans", font_size=40,
-                          bg_color=(245, 242, 237), text_color=(80, 60, 40),
-                          max_width=900, alignment="left", transparent_bg=False, line_height=1.6,
-                          highlight_keywords=False, accent_color="#FFD700", 
-                          add_opening_quote=False, add_closing_quote=False):
+    def _prepare_english_text(self, text, highlight_keywords, accent_color,
+                              add_opening_quote, add_closing_quote, highlight_seed=None):
         """
-        Render English text (for translations, tafsir, examples)
-        
-        Args:
-            text: English text
-            font_family: Font name
-            font_size: Font size
-            bg_color: Background RGB tuple
-            text_color: Text RGB tuple
-            max_width: Maximum text width
-            alignment: 'left', 'center', or 'right'
-            line_height: Line spacing multiplier (default 1.6)
-            highlight_keywords: If True, highlight important Islamic keywords
-            accent_color: Color for highlights (uses theme accent color)
+        Apply keyword highlighting and quote marks - returns plain text or Pango markup
         
-        Returns:
-            PIL Image with rendered text
+        highlight_seed: Post seed (render_rng) - same seed + text = same highlighted words
         """
-        # Create Cairo surface
-        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.width, self.height)
-        context = cairo.Context(surface)
-        
-        # Fill background or transparent
-        if not transparent_bg:
-            context.set_source_rgb(bg_color[0]/255, bg_color[1]/255, bg_color[2]/255)
-            context.paint()
-        
-        # Create Pango layout
-        layout = pangocairocffi.create_layout(context)
-        layout._set_width(pango.units_from_double(max_width))
-        
-        # Set alignment
-        if alignment == "center":
-            layout._set_alignment(pango.Alignment.CENTER)
-        elif alignment == "right":
-            layout._set_alignment(pango.Alignment.RIGHT)
-        else:
-            layout._set_alignment(pango.Alignment.LEFT)
-        
-        # Set line spacing
-        layout._set_spacing(pango.units_from_double(font_size * (line_height - 1)))
-        
-        # Set font
-        font_desc_str = f"{font_family} {font_size}"
-        font_description = pango.pango.pango_font_description_from_string(font_desc_str.encode('utf-8'))
-        layout._set_font_description(pango.FontDescription(font_description))
-        
         # Apply random word highlighting FIRST (before adding quotes)
         # This avoids escaping issues with markup
         if highlight_keywords:
@@ -299,7 +334,9 @@ class CairoArabicRenderer:
             if ENABLE_HIGHLIGHTING:
                 # Use theme accent color or always gold based on config
                 highlight_color = accent_color if USE_ACCENT_COLOR_FOR_HIGHLIGHTS else "#FFD700"
-                text = self.highlight_random_words(text, theme_color=highlight_color, max_words=HIGHLIGHT_MAX_WORDS)
+                rng = PostRNG(highlight_seed).random('highlight', text) if highlight_seed is not None else None
+                text = self.highlight_random_words(text, theme_color=highlight_color,
+                                                   max_words=HIGHLIGHT_MAX_WORDS, rng=rng)
                 # Now text has highlighting markup
         
         # Add quotes AFTER highlighting (so quotes aren't highlighted)
@@ -330,6 +367,10 @@ class CairoArabicRenderer:
                 # Regular quotes (same size as text)
                 text = f'{text}{close_quote}'
         
+        return text
+    
+    def _set_layout_text(self, layout, text):
+        """Set layout text, parsing Pango markup only when present"""
         # Check if we have any markup to render
         has_markup = '<span' in text or '<b>' in text or '<i>' in text
         
@@ -338,6 +379,47 @@ class CairoArabicRenderer:
             pango.pango.pango_layout_set_markup(layout._pointer, text.encode('utf-8'), -1)
         else:
             layout._set_text(text)
+    
+    def render_english_text(self, text, font_family="Product Sans", font_size=40,
+                          bg_color=(245, 242, 237), text_color=(80, 60, 40),
+                          max_width=900, alignment="left", transparent_bg=False, line_height=1.6,
+                          highlight_keywords=False, accent_color="#FFD700", 
+                          add_opening_quote=False, add_closing_quote=False, highlight_seed=None):
+        """
+        Render English text (for translations, tafsir, examples)
+        
+        Args:
+            text: English text
+            font_family: Font name
+            font_size: Font size
+            bg_color: Background RGB tuple
+            text_color: Text RGB tuple
+            max_width: Maximum text width
+            alignment: 'left', 'center', or 'right'
+            line_height: Line spacing multiplier (default 1.6)
+            highlight_keywords: If True, highlight important Islamic keywords
+            accent_color: Color for highlights (uses theme accent color)
+            highlight_seed: Post seed for the highlighted words (None = random)
+        
+        Returns:
+            PIL Image with rendered text
+        """
+        # Create Cairo surface
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.width, self.height)
+        context = cairo.Context(surface)
+        
+        # Fill background or transparent
+        if not transparent_bg:
+            context.set_source_rgb(bg_color[0]/255, bg_color[1]/255, bg_color[2]/255)
+            context.paint()
+        
+        # Create Pango layout
+        layout = self._create_layout(font_family, font_size, max_width, alignment, line_height)
+        
+        # Highlighting + quote marks (may turn text into Pango markup)
+        text = self._prepare_english_text(text, highlight_keywords, accent_color,
+                                          add_opening_quote, add_closing_quote, highlight_seed)
+        self._set_layout_text(layout, text)
         
         layout._set_wrap(pango.WrapMode.WORD)
         
@@ -360,6 +442,242 @@ class CairoArabicRenderer:
         # Convert to PIL Image
         return self._surface_to_pil(surface)
     
+    def _english_layout(self, text, font_family, font_size, max_width, alignment,
+                        line_height, highlight_keywords, accent_color,
+                        add_opening_quote, add_closing_quote, highlight_seed=None):
+        """Build a wrapped English layout - returns (layout, box_x)"""
+        layout = self._create_layout(font_family, font_size, max_width, alignment, line_height)
+        text = self._prepare_english_text(text, highlight_keywords, accent_color,
+                                          add_opening_quote, add_closing_quote, highlight_seed)
+        self._set_layout_text(layout, text)
+        layout._set_wrap(pango.WrapMode.WORD)
+        
+        return layout, (self.width - max_width) / 2  # Center the max_width box
+    
+    def _arabic_layout(self, text, font_family, font_size, max_width, line_height, align):
+        """Build an Arabic layout - returns (layout, box_x)"""
+        layout = self._create_layout(font_family, font_size, max_width, align, line_height)
+        layout._set_text(text)
+        
+        # Right-aligned Arabic hugs the right edge (20px), others center the box
+        if align == 'right':
+            box_x = self.width - max_width - 20
+        else:
+            box_x = (self.width - max_width) / 2
+        return layout, box_x
+    
+    def render_english_sprite(self, text, font_family="Product Sans", font_size=40,
+                              text_color=(80, 60, 40), max_width=900, alignment="left",
+                              line_height=1.6, highlight_keywords=False, accent_color="#FFD700",
+                              add_opening_quote=False, add_closing_quote=False, center_y=None,
+                              highlight_seed=None):
+        """
+        Render English text into a tight ink-extent sprite
+        
+        Same layout and placement as render_english_text (transparent_bg=True),
+        but only the pixels the glyphs actually cover are allocated.
+        
+        Args:
+            (same as render_english_text)
+            center_y: Vertical center of the text block on the slide (default: slide center)
+        
+        Returns:
+            TextSprite(surface, x, y) or None if the text has no ink
+        """
+        layout, box_x = self._english_layout(
+            text, font_family, font_size, max_width, alignment,
+            line_height, highlight_keywords, accent_color, add_opening_quote, add_closing_quote,
+            highlight_seed
+        )
+        return self._render_sprite(layout, box_x, self._block_top(layout, center_y), text_color)
+    
+    def render_arabic_sprite(self, text, font_family="Amiri", font_size=50,
+                             text_color=(80, 60, 40), max_width=900, line_height=1.5,
+                             align='right', center_y=None):
+        """
+        Render Arabic text into a tight ink-extent sprite
+        
+        Same layout and placement as render_arabic_verse (transparent_bg=True).
+        
+        Returns:
+            TextSprite(surface, x, y) or None if the text has no ink
+        """
+        layout, box_x = self._arabic_layout(
+            text, font_family, font_size, max_width, line_height, align
+        )
+        return self._render_sprite(layout, box_x, self._block_top(layout, center_y), text_color)
+    
+    # ===== SINGLE-SURFACE CANVAS =====
+    # A slide is drawn onto ONE RGB24 surface (background + every text layer)
+    # and converted to PIL once, instead of one PIL layer per text block.
+    
+    def pil_to_surface(self, img):
+        """
+        Copy an RGB PIL Image into a new Cairo RGB24 surface
+        
+        Used once per cached base plate, not per slide.
+        """
+        width, height = img.size
+        surface = cairo.ImageSurface(cairo.FORMAT_RGB24, width, height)
+        
+        # Cairo RGB24 = 32-bit little-endian xRGB, i.e. bytes B, G, R, x
+        stride = surface.get_stride()
+        surface.get_data()[:] = img.convert('RGBA').tobytes('raw', 'BGRA', stride)
+        surface.mark_dirty()
+        
+        return surface
+    
+    def create_canvas(self, background):
+        """
+        Start a slide canvas with a background surface painted in
+        
+        Args:
+            background: Cairo surface of slide size (e.g. from pil_to_surface)
+        
+        Returns:
+            (surface, context) to draw the slide's text layers onto
+        """
+        surface = cairo.ImageSurface(cairo.FORMAT_RGB24, self.width, self.height)
+        context = cairo.Context(surface)
+        context.set_source_surface(background, 0, 0)
+        context.paint()
+        return surface, context
+    
+    def draw_english_text(self, context, text, font_family="Product Sans", font_size=40,
+                          text_color=(80, 60, 40), max_width=900, alignment="left",
+                          line_height=1.6, highlight_keywords=False, accent_color="#FFD700",
+                          add_opening_quote=False, add_closing_quote=False, center_y=None,
+                          highlight_seed=None):
+        """Draw English text straight onto a canvas context (args as render_english_sprite)"""
+        layout, box_x = self._english_layout(
+            text, font_family, font_size, max_width, alignment,
+            line_height, highlight_keywords, accent_color, add_opening_quote, add_closing_quote,
+            highlight_seed
+        )
+        self._show_layout(context, layout, box_x, center_y, text_color)
+    
+    def draw_arabic_text(self, context, text, font_family="Amiri", font_size=50,
+                         text_color=(80, 60, 40), max_width=900, line_height=1.5,
+                         align='right', center_y=None):
+        """Draw Arabic text straight onto a canvas context (args as render_arabic_sprite)"""
+        layout, box_x = self._arabic_layout(
+            text, font_family, font_size, max_width, line_height, align
+        )
+        self._show_layout(context, layout, box_x, center_y, text_color)
+    
+    def render_corner_label_sprite(self, text, font_family="Product Sans", font_size=32,
+                                   text_color=(80, 60, 40), opacity=255, padding=50):
+        """
+        Render a single-line label for the bottom-right corner (e.g. "Swipe →")
+        
+        Args:
+            font_size: Size in pixels (same units as PIL's ImageFont.truetype)
+            opacity: Alpha 0-255
+            padding: Distance from the right and bottom edges in pixels
+        
+        Returns:
+            TextSprite(surface, x, y) or None if the text has no ink
+        """
+        layout = pango.Layout(get_pango_context())
+        layout._set_font_description(get_font_description(font_family, font_size, unit='px'))
+        layout._set_text(text)
+        
+        # Place by ink box, like PIL's textbbox-based positioning
+        ink_rect, _ = layout.get_extents()
+        x = self.width - pango.units_to_double(ink_rect.x + ink_rect.width) - padding
+        y = self.height - pango.units_to_double(ink_rect.y + ink_rect.height) - padding
+        
+        return self._render_sprite(layout, x, y, text_color, opacity)
+    
+    def paint_sprite(self, context, sprite):
+        """Paint a TextSprite onto a canvas context at its placement offset"""
+        if sprite is None:
+            return
+        
+        context.set_source_surface(sprite.surface, sprite.x, sprite.y)
+        context.paint()
+    
+    def _show_layout(self, context, layout, box_x, center_y, text_color):
+        """Show a layout with its block vertically centered on center_y"""
+        context.set_source_rgb(text_color[0]/255, text_color[1]/255, text_color[2]/255)
+        context.move_to(box_x, self._block_top(layout, center_y))
+        pangocairocffi.show_layout(context, layout)
+    
+    def canvas_to_pil(self, surface):
+        """
+        Convert a finished canvas to an RGB PIL Image - the ONE conversion per slide
+        
+        Copies the pixels, so the Cairo surface can be freed afterwards.
+        """
+        surface.flush()
+        return Image.frombytes(
+            "RGB",
+            (surface.get_width(), surface.get_height()),
+            bytes(surface.get_data()),
+            "raw",
+            "BGRX",
+            surface.get_stride()
+        )
+    
+    def _block_top(self, layout, center_y):
+        """Top of a layout block vertically centered on center_y (default: slide center)"""
+        if center_y is None:
+            center_y = self.height / 2
+        
+        _, text_height = layout.get_size()
+        return center_y - pango.units_to_double(text_height) / 2
+    
+    def _render_sprite(self, layout, origin_x, origin_y, text_color, opacity=255):
+        """
+        Rasterize a layout into a surface sized to its ink extents
+        
+        The layout origin keeps the exact (sub-pixel) position it would have on
+        a full-slide surface; only the sprite's integer top-left is snapped.
+        """
+        ink_rect, _ = layout.get_extents()
+        if ink_rect.width <= 0 or ink_rect.height <= 0:
+            return None
+        
+        left = math.floor(origin_x + pango.units_to_double(ink_rect.x)) - SPRITE_PADDING
+        top = math.floor(origin_y + pango.units_to_double(ink_rect.y)) - SPRITE_PADDING
+        right = math.ceil(origin_x + pango.units_to_double(ink_rect.x + ink_rect.width)) + SPRITE_PADDING
+        bottom = math.ceil(origin_y + pango.units_to_double(ink_rect.y + ink_rect.height)) + SPRITE_PADDING
+        
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, right - left, bottom - top)
+        context = cairo.Context(surface)
+        
+        context.set_source_rgba(text_color[0]/255, text_color[1]/255, text_color[2]/255, opacity/255)
+        context.move_to(origin_x - left, origin_y - top)
+        pangocairocffi.show_layout(context, layout)
+        surface.flush()
+        
+        return TextSprite(surface, left, top)
+    
+    def sprite_to_pil(self, sprite):
+        """Convert a TextSprite's surface to an RGBA PIL Image"""
+        return self._surface_to_pil(sprite.surface)
+    
+    def composite_sprite(self, img, sprite):
+        """
+        Blit a TextSprite onto a slide at its placement offset
+        
+        Pastes with the sprite's own alpha as mask, so only the sprite's
+        rectangle is touched - no full-frame layers or RGB↔RGBA round-trips.
+        
+        Args:
+            img: RGB PIL Image (modified in place)
+            sprite: TextSprite or None
+        
+        Returns:
+            The same image, for chaining
+        """
+        if sprite is None:
+            return img
+        
+        layer = self.sprite_to_pil(sprite)
+        img.paste(layer, (sprite.x, sprite.y), layer)
+        return img
+    
     def _surface_to_pil(self, surface):
         """Convert Cairo surface to PIL Image"""
         # Get raw image data
@@ -368,17 +686,61 @@ class CairoArabicRenderer:
         # Create PIL Image from buffer (Cairo uses BGRA format)
         img = Image.frombuffer(
             "RGBA",
-            (self.width, self.height),
+            (surface.get_width(), surface.get_height()),
             buf,
             "raw",
             "BGRA",
-            0,
+            surface.get_stride(),
             1
         )
         
         # Return RGBA to preserve transparency for compositing
         return img
     
+    def layout_metrics(self, text, font_family="Amiri", font_size=50, max_width=900, line_height=1.5):
+        """
+        Lay text out ONCE and read every line's position from the layout
+        
+        Results are kept in an LRU keyed by (text, font, size, width, line_height),
+        so re-measuring the same block (e.g. measure then paginate) is free.
+        
+        Returns:
+            LayoutMetrics(height, lines) - lines are (start char index, top, bottom) in px
+        """
+        key = (text, font_family, font_size, max_width, line_height)
+        metrics = self._measure_cache.get(key)
+        if metrics is not None:
+            self._measure_cache.move_to_end(key)
+            return metrics
+        
+        # One layout reused for every measurement - only shaping is paid per call
+        if self._measure_layout is None:
+            self._measure_layout = pango.Layout(get_pango_context())
+        layout = self._measure_layout
+        self._configure_layout(layout, font_family, font_size, max_width, 'left', line_height)
+        layout._set_text(text)
+        
+        _, text_height = layout.get_size()
+        
+        # Pango reports line starts as UTF-8 byte offsets - map them to str indices
+        encoded = text.encode('utf-8')
+        lines = []
+        layout_iter = layout.get_iter()
+        while True:
+            _, logical = layout_iter.get_line_extents()
+            start = len(encoded[:layout_iter.get_index()].decode('utf-8', errors='ignore'))
+            top = pango.units_to_double(logical.y)
+            lines.append((start, top, top + pango.units_to_double(logical.height)))
+            if not layout_iter.next_line():
+                break
+        
+        metrics = LayoutMetrics(pango.units_to_double(text_height), lines)
+        self._measure_cache[key] = metrics
+        if len(self._measure_cache) > MEASURE_CACHE_SIZE:
+            self._measure_cache.popitem(last=False)
+        
+        return metrics
+    
     def measure_text_height(self, text, font_family="Amiri", font_size=50, max_width=900, line_height=1.5):
         """
         Measure the height that rendered text will occupy
@@ -386,29 +748,63 @@ class CairoArabicRenderer:
         Returns:
             int: Height in pixels
         """
-        # Create temporary surface for measurement
-        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.width, self.height)
-        context = cairo.Context(surface)
+        return int(self.layout_metrics(text, font_family, font_size, max_width, line_height).height)
+    
+    def measure_many(self, items):
+        """
+        Measure several text blocks in one call
         
-        # Create Pango layout
-        layout = pangocairocffi.create_layout(context)
-        layout._set_width(pango.units_from_double(max_width))
-        layout._set_spacing(pango.units_from_double(font_size * (line_height - 1)))
+        Args:
+            items: Iterable of (text, font_family, font_size, max_width, line_height)
+        
+        Returns:
+            list of int heights in pixels, in the same order
+        """
+        return [self.measure_text_height(*item) for item in items]
+    
+    def paginate_text(self, text, max_height, font_family="Amiri", font_size=50,
+                      max_width=900, line_height=1.5):
+        """
+        Split text into pages that each fit within max_height
         
-        # Set font
-        font_desc_str = f"{font_family} {font_size}"
-        font_description = pango.pango.pango_font_description_from_string(font_desc_str.encode('utf-8'))
-        layout._set_font_description(pango.FontDescription(font_description))
+        One layout per page instead of one per word: the remaining text is laid
+        out, whole lines are taken while the block still fits, and the page is
+        cut at the first line that doesn't. Same result as growing the page one
+        word at a time and re-measuring, since word wrapping is greedy.
         
-        # Set text
-        layout._set_text(text)
+        Args:
+            text: Text to paginate (whitespace is normalized to single spaces)
+            max_height: Maximum block height per page in pixels
         
-        # Get dimensions
-        text_width, text_height = layout.get_size()
-        text_height = pango.units_to_double(text_height)
+        Returns:
+            list of page texts (at least one line per page)
+        """
+        remaining = ' '.join(text.split())
+        pages = []
         
-        return int(text_height)
-
+        while remaining:
+            lines = self.layout_metrics(remaining, font_family, font_size, max_width, line_height).lines
+            
+            # Lines that fit, measured like measure_text_height (block top to line bottom)
+            fit = 1
+            while fit < len(lines) and int(lines[fit][2] - lines[0][1]) <= max_height:
+                fit += 1
+            
+            if fit >= len(lines):
+                pages.append(remaining)
+                break
+            
+            cut = lines[fit][0]
+            # Pango may also break after hyphens/slashes - only ever cut between words
+            if remaining[cut - 1] != ' ':
+                space = remaining.rfind(' ', 0, cut)
+                if space > 0:
+                    cut = space + 1
+            
+            pages.append(remaining[:cut].strip())
+            remaining = remaining[cut:].strip()
+        
+        return pages
 
 def test_cairo_renderer():
     """Test the Cairo renderer with real Quranic verse"""
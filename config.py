@@ -130,6 +130,12 @@ CAIRO_FONTS = {
         "size": 25,           # 💧 WATERMARK - smaller, less intrusive
         "family": "Montserrat",  # Montserrat for consistency
         "weight": "normal"    # Regular weight
+    },
+    "swipe": {
+        "size": 32,           # 👉 "Swipe →" hint size in px (cairo render mode)
+        "family": "Product Sans",
+        "opacity": 120,       # Subtle transparency (0-255)
+        "padding": 50         # Distance from bottom-right corner
     }
 }
 
@@ -150,10 +156,113 @@ CAIRO_LAYOUT = {
     "vertical_center_offset": 50         # Slight offset for visual balance
 }
 
+# ===== RENDERING =====
+# 'pil'   = base plate + one tight text sprite per layer, composited in PIL
+# 'cairo' = whole slide drawn on ONE Cairo surface, converted to PIL once
+# 'parallel' = all slides of a carousel rendered concurrently (see PARALLEL_RENDER)
+RENDER_MODE = 'pil'
+
+# render_mode='parallel': slides rendered + encoded concurrently in a process pool
+PARALLEL_RENDER = {
+    'workers': None,          # None = one per CPU core (capped at the slide count)
+    'compositor': 'cairo'     # Compositor each worker uses ('pil' or 'cairo')
+}
+
+# batch_render.py: pre-render carousels for a verse range (never touches the posting ledger)
+BATCH_RENDER = {
+    'output_dir': 'batch_output',   # One <surah>_<ayah>/ directory per finished carousel
+    'in_flight_per_worker': 2       # Verses queued per worker while the next ones are fetched
+}
+
+# Posted-verse tracking (posting_ledger.py) - committed to git after each post
+POSTING_LEDGER = {
+    'file': 'posting_ledger.json',         # Bitset + next-verse cursor + cycle / post counters
+    'legacy_file': 'posted_verses.json'    # Old index list, imported when the ledger is first created
+}
+
+# Render-ahead queue (render_queue.py) - next carousels pre-rendered so a post only uploads
+RENDER_QUEUE = {
+    'dir': 'render_queue',   # One <index>/ directory per queued carousel (cached between workflow runs)
+    'depth': 4               # Carousels kept ready (same order as get_next_verse)
+}
+
+# Verse providers (multi_api_quran.py)
+API_SETTINGS = {
+    'mode': 'hedged',          # 'hedged' = providers raced with staggered starts, 'sequential' = one after another
+    'hedge_delay': 1.5,        # Seconds before the next provider is started if the previous hasn't answered
+    'deadline': 20,            # Max seconds one hedged round may take before giving up on it
+    'request_timeout': 30,     # Per-HTTP-request timeout (seconds)
+    'cycle_delay': 2,          # Seconds between hedged rounds
+    'pipeline_concurrency': 4  # Ayahs fetched at once by verse_pipeline.py (verse + tafsir each)
+}
+
+# Provider health + circuit breaker (provider_health.py) - persisted between runs
+PROVIDER_HEALTH = {
+    'file': 'provider_health.json',  # Rolling outcomes + breaker state per provider (cached between workflow runs)
+    'window': 50,                    # Outcomes kept per provider for success rate / p50 / p95
+    'failure_threshold': 3,          # Consecutive failures that trip (open) the breaker
+    'min_success_rate': 0.5,         # Also trip when the rolling success rate drops below this...
+    'min_samples': 10,               # ...once at least this many outcomes are known
+    'cooldown': 900                  # Seconds a tripped provider is skipped before one trial request (half-open)
+}
+
+# Shared keep-alive HTTP sessions (http_pool.py) - used by every API client
+HTTP_POOL = {
+    'pool_connections': 4,     # Hosts kept per session adapter
+    'pool_maxsize': 8,         # Open connections kept per host (>= concurrent requests to one host)
+    'retries': 2,              # Retries for connection errors / retryable statuses
+    'backoff_factor': 0.5,     # Retry waits: 0.5s, 1s, ...
+    'status_forcelist': [429, 500, 502, 503, 504],
+    'user_agent': 'NectarFromQuran/1.0'
+}
+
+# JSON caches (tafsir_cache.json, legacy quran_cache.json) - written behind, in batches
+CACHE_PERSISTENCE = {
+    'flush_interval': 5.0,   # Seconds after the first unsaved entry before the file is rewritten (0 = every insert)
+    'max_dirty': 50,         # Unsaved entries that force an immediate write
+    'indent': 2              # Keeps the git-tracked cache files diffable (None = compact)
+}
+
+# Binary verse cache (verse_store.py) - replaces quran_cache.json, mmap'd O(1) lookups
+VERSE_STORE = {
+    'file': 'quran_store.bin',               # Cached between workflow runs
+    'legacy_cache': 'quran_cache.json'       # Imported automatically when the store is first created
+}
+
+# Whole-Quran download (quran_corpus.py) - fills the verse store so posts never wait on the network
+QURAN_CORPUS = {
+    'arabic_edition': 'quran-uthmani',       # AlQuran.cloud edition for the Arabic text
+    'translation_edition': 'en.sahih'        # AlQuran.cloud edition for the translation
+}
+
+# Compressed tafsir corpus (tafsir_store.bin) filled in bulk by tafsir_prefetch.py
+TAFSIR_SETTINGS = {
+    'author': 'Tazkirul',          # Only this author's entry is kept from each /tafsir document
+    'store': 'tafsir_store.bin',   # zlib-compressed per-ayah records, mmap'd index (cached between workflow runs)
+    'workers': 8,                  # Tafsir documents downloaded at once by the prefetch job
+    'batch_size': 50               # Records written (one fsync pair) per batch
+}
+
+# Pre-rasterized static text (headings, watermark, attribution, CTA, swipe hint)
+SPRITE_CACHE = {
+    'dir': 'sprite_cache',   # PNG sprites + index.json (cached between workflow runs)
+    'persist': True          # False = keep sprites in memory only
+}
+
+# Finished slides keyed by a hash of their content + render config (render_cache.py)
+RENDER_CACHE = {
+    'dir': 'render_cache',   # <hash>.png per slide (cached between workflow runs)
+    'max_mb': 200,           # Least recently used slides are deleted beyond this size
+    'enabled': True          # False (or --no-cache) = always render
+}
+
 # ===== VISUAL EFFECTS - ADJUST TO YOUR PREFERENCE =====
 PATTERN_SETTINGS = {
     'grain_intensity': 0.3,   # 🎨 Grainy texture intensity (0.0 = none, 0.3 = very grainy) - INCREASED
     'grain_noise': 40,         # Grain noise amount (15-40) - INCREASED for more visible grain
+    'grain_tiles': 4,          # Pre-generated noise tiles in the grain bank (more = less repetition)
+    'grain_tile_size': 256,    # Noise tile edge in pixels
+    'grain_seed': 42,          # Grain noise seed - fixed so slides render byte-identically (None = random each run)
     'glass_opacity': 0.85,     # Glassmorphism opacity (0.0-1.0) - not used by default
     'blur_amount': 15          # Blur for glass effect (5-30) - not used by default
 }
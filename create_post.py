@@ -3,12 +3,14 @@ Create and post Quranic verse to Instagram
 ✅ Auto-fetches authentic tafsir from APIs (NEVER makes up content)
 ✅ Multi-API fallback system (Quran.com → AlQuran.cloud → Quran-API.ir)
 ✅ Posts to feed + shares to story with "New Post" text
+✅ Random "human" delay overlaps fetching/rendering - upload fires when it expires
 ✅ Auto-cleanup of old files (7 days)
 ✅ Dynamic captions with trendy hashtags
 """
 
 from generate_post_cairo import QuranPostGeneratorCairo
 from instagram_poster import InstagramPoster
+from render_queue import RenderQueue
 from config import DEFAULT_THEME, POSTING_SCHEDULE
 import os
 import sys
@@ -174,31 +176,58 @@ def main():
     print("🕌 NectarFromQuran - Daily Quran Post Generator")
     print("=" * 60)
     
-    # Add random delay to mimic human behavior (30-180 seconds)
+    # Random delay to mimic human behavior (30-180 seconds) - used as a deadline:
+    # the post is fetched, rendered and converted meanwhile, the upload waits for it
     delay = random.randint(30, 180)
-    print(f"\n⏳ Random delay: {delay}s (mimics human behavior, avoids automation detection)")
-    time.sleep(delay)
+    upload_at = time.monotonic() + delay
+    print(f"\n⏳ Random delay: {delay}s (mimics human behavior, avoids automation detection) - preparing the post meanwhile")
     
     try:
-        # Initialize generator
-        generator = QuranPostGeneratorCairo(DEFAULT_THEME)
+        # Pre-rendered carousel for the next verse (render_queue.py --refill), if one is ready
+        queued = RenderQueue().dequeue()
         
-        # Generate carousel slides
-        print(f"\n📝 Generating post...")
-        slide_paths = generator.generate_post()
+        if queued:
+            slide_paths = queued['slides']
+            verse_info = queued['verse_data']
+            caption = queued['caption'] or generate_dynamic_caption(verse_info)
+            print(f"\n📦 Using pre-rendered carousel for {verse_info['surah_number']}:{verse_info['ayah_number']} "
+                  f"({len(slide_paths)} slides, {queued['theme']})")
+        else:
+            # Queue miss - generate inline
+            generator = QuranPostGeneratorCairo(DEFAULT_THEME)
+            
+            # Generate carousel slides
+            print(f"\n📝 Generating post...")
+            slide_paths = generator.generate_post()
+            
+            print(f"\n✅ Generated {len(slide_paths)} slides successfully!")
+            
+            # Generate dynamic caption based on verse theme
+            verse_info = generator.get_verse_info()
+            caption = generate_dynamic_caption(verse_info)
         
-        print(f"\n✅ Generated {len(slide_paths)} slides successfully!")
+        # Upload-ready files: carousel JPGs and the story image (local work, no login needed)
+        jpg_paths = InstagramPoster.prepare_carousel(slide_paths)
+        try:
+            story_path = InstagramPoster.prepare_story_image(slide_paths[0])
+        except Exception as e:
+            print(f"⚠️  Story image not prepared ({e}) - will retry when sharing")
+            story_path = None
         
-        # Post to Instagram
-        print("\n📸 Posting to Instagram...")
+        print("\n📸 Logging in to Instagram...")
         poster = InstagramPoster()
         
-        # Generate dynamic caption based on verse theme
-        verse_info = generator.get_verse_info()
-        caption = generate_dynamic_caption(verse_info)
+        # Upload when the random delay expires (right away if preparing took longer)
+        remaining = upload_at - time.monotonic()
+        if remaining > 0:
+            print(f"\n⏳ Post ready - uploading in {remaining:.0f}s")
+            time.sleep(remaining)
+        else:
+            print(f"\n⏱️  Preparing took {-remaining:.0f}s longer than the delay - uploading now")
         
         # Post carousel to feed
-        media_code = poster.post_carousel(slide_paths, caption)
+        print("\n📸 Posting to Instagram...")
+        media_code = poster.post_carousel(slide_paths, caption, jpg_paths=jpg_paths)
         
         if media_code:
             print(f"\n✅ Successfully posted to feed!")
@@ -207,7 +236,7 @@ def main():
             # Share to story with "New Post" text
             print(f"\n📤 Sharing to story...")
             post_url = f"https://www.instagram.com/p/{media_code}/"
-            story_pk = poster.share_to_story(slide_paths[0], post_url)
+            story_pk = poster.share_to_story(slide_paths[0], post_url, story_path=story_path)
             
             if story_pk:
                 print(f"✅ Shared to story!")
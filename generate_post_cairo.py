@@ -8,16 +8,26 @@ Quranic Verse Post Generator with Cairo Rendering
 """
 
 import os
-import sys
-import json
+import time
+import argparse
 import platform
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import numpy as np
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PIL import ImageFilter
 from config import *
 from quran_data import get_all_verses
+from surah_metadata import get_surah
 from multi_api_quran import QuranAPI
-from cairo_renderer import CairoArabicRenderer
+from auto_tafsir_fetcher import AutoTafsirFetcher
+from verse_pipeline import VersePipeline
+from posting_ledger import PostingLedger
+from cairo_renderer import CairoArabicRenderer, font_cache_stats
+from http_pool import pool_stats
+from background_engine import get_gradient_background, get_grain_bank
+from sprite_cache import SpriteCache
+from render_cache import RenderCache
+from render_rng import PostRNG, post_seed
 
 # Set library paths for Cairo/Pango based on OS
 if platform.system() == "Darwin":  # macOS
@@ -39,39 +49,100 @@ elif platform.system() == "Linux":  # Linux/GitHub Actions
     os.environ['LD_LIBRARY_PATH'] = "/usr/lib/x86_64-linux-gnu:/usr/local/lib:" + os.environ.get('LD_LIBRARY_PATH', '')
 
 
+# Static layers per slide kind: heading (HEADING_TEXTS key, fallback text, theme color key)
+# and optional attribution line at reference_y. Body text is the only dynamic layer.
+BASE_PLATE_LAYERS = {
+    'arabic': {
+        'heading': ('arabic_slide', 'Verse of Reflection', 'source_color'),  # source_color so Arabic text pops
+        'attribution': None
+    },
+    'translation': {
+        'heading': ('translation_slide', 'English Translation', 'heading_color'),
+        'attribution': 'Sahih International'
+    },
+    'tafsir': {
+        'heading': ('tafsir_slide', 'Tafsir Ibn Kathir', 'heading_color'),
+        'attribution': None
+    },
+    'example': {
+        'heading': ('example_slide', 'How to Apply This Today', 'heading_color'),
+        'attribution': None
+    },
+    'cta': {
+        'heading': None,
+        'attribution': None
+    }
+}
+
+# Process-wide base plate cache: (theme_name, slide kind) -> composited RGB PIL Image
+_BASE_PLATE_CACHE = {}
+
+# Same plates as Cairo RGB24 surfaces, for render_mode='cairo'
+_BASE_SURFACE_CACHE = {}
+
+# Grain seed for this run when PATTERN_SETTINGS['grain_seed'] is None (parallel workers get the parent's)
+_RUN_GRAIN_SEED = None
+
+
+def run_grain_seed():
+    """
+    Seed for the base plate grain - PATTERN_SETTINGS['grain_seed'], or one random seed per run
+    
+    Plates are seeded per (theme, kind) from it, so every process rendering
+    slides of the same carousel draws byte-identical grain.
+    """
+    global _RUN_GRAIN_SEED
+    seed = PATTERN_SETTINGS.get('grain_seed')
+    if seed is not None:
+        return seed
+    if _RUN_GRAIN_SEED is None:
+        _RUN_GRAIN_SEED = int.from_bytes(os.urandom(4), 'big')
+    return _RUN_GRAIN_SEED
+
+
 class QuranPostGeneratorCairo:
     """Generate Instagram carousel posts with perfect Arabic rendering"""
     
-    def __init__(self, theme_name=None):
-        # Initialize posted_file first for theme rotation
-        self.posted_file = "posted_verses.json"
+    def __init__(self, theme_name=None, render_only=False, use_cache=True):
+        """
+        Args:
+            theme_name: Theme from THEMES (default: rotation / DEFAULT_THEME)
+            render_only: Skip verse list, API client and posted-verse tracking -
+                         for render workers that only turn slide specs into images
+            use_cache: Reuse finished slides from the render cache (False = always render)
+        """
+        # Posting ledger - read once, for theme rotation and the next verse
+        self.ledger = None
         
         # Theme rotation logic
         if theme_name is None:
             from config import ENABLE_THEME_ROTATION, ROTATION_THEMES, DEFAULT_THEME as DEFAULT
             if ENABLE_THEME_ROTATION:
-                # Get current theme based on number of posted verses (rotation)
+                # Get current theme based on number of posts made so far (rotation)
                 posted_count = self.get_posted_count_for_rotation()
-                theme_index = len(posted_count) % len(ROTATION_THEMES)
+                theme_index = posted_count % len(ROTATION_THEMES)
                 theme_name = ROTATION_THEMES[theme_index]
-                print(f"🎨 Theme rotation enabled: Using '{theme_name}' (post #{len(posted_count)+1}, rotation index {theme_index})")
+                print(f"🎨 Theme rotation enabled: Using '{theme_name}' (post #{posted_count+1}, rotation index {theme_index})")
             else:
                 theme_name = DEFAULT
         
         self.theme = THEMES.get(theme_name, THEMES[DEFAULT_THEME])
         self.theme_name = theme_name
-        self.verses_data = get_all_verses()
-        self.api = QuranAPI()
         self.cairo_renderer = CairoArabicRenderer(width=IMAGE_WIDTH, height=IMAGE_HEIGHT)
-        self.load_posted_verses()
+        self.sprite_cache = SpriteCache(SPRITE_CACHE['dir'], persist=SPRITE_CACHE['persist'])
+        self.render_cache = RenderCache(enabled=RENDER_CACHE['enabled'] and use_cache)
         self.current_verse_info = None  # Store current verse for caption generation
+        
+        if not render_only:
+            self.verses_data = get_all_verses()
+            self.api = QuranAPI()
+            self.tafsir_fetcher = AutoTafsirFetcher()  # One instance (and one tafsir_cache.json load) per generator
+            self.pipeline = VersePipeline(self.api, self.tafsir_fetcher)
     
     def get_posted_count_for_rotation(self):
-        """Get posted verses list for theme rotation (called before load_posted_verses)"""
-        if os.path.exists(self.posted_file):
-            with open(self.posted_file, 'r') as f:
-                return json.load(f)
-        return []
+        """Number of posts made so far (theme rotation) - one counter from the ledger"""
+        self.load_posted_verses()
+        return self.ledger.posted_count
     
     def hex_to_rgb(self, hex_color):
         """Convert hex color to RGB tuple"""
@@ -79,59 +150,162 @@ class QuranPostGeneratorCairo:
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
     
     def create_gradient_background(self):
-        """Create gradient background"""
-        img = Image.new('RGB', (IMAGE_WIDTH, IMAGE_HEIGHT))
-        draw = ImageDraw.Draw(img)
+        """Create gradient background (NumPy-built, memoized per theme)"""
+        return get_gradient_background(self.theme['bg_colors'], IMAGE_WIDTH, IMAGE_HEIGHT)
+    
+    def add_grain_texture(self, img, rng=None):
+        """
+        Add grainy film texture - blended from the shared noise tile bank
         
-        color1 = self.hex_to_rgb(self.theme['bg_colors'][0])
-        color2 = self.hex_to_rgb(self.theme['bg_colors'][1])
+        Args:
+            rng: numpy Generator for the tile/offset choice (default: the bank's own)
+        """
+        grain_bank = get_grain_bank(
+            noise=PATTERN_SETTINGS.get('grain_noise', 25),
+            tiles=PATTERN_SETTINGS.get('grain_tiles', 4),
+            tile_size=PATTERN_SETTINGS.get('grain_tile_size', 256),
+            seed=run_grain_seed()
+        )
         
-        for y in range(IMAGE_HEIGHT):
-            factor = y / IMAGE_HEIGHT
-            r = int(color1[0] * (1 - factor) + color2[0] * factor)
-            g = int(color1[1] * (1 - factor) + color2[1] * factor)
-            b = int(color1[2] * (1 - factor) + color2[2] * factor)
-            draw.line([(0, y), (IMAGE_WIDTH, y)], fill=(r, g, b))
+        # Blend with configurable intensity
+        return grain_bank.apply(img, GRAIN_INTENSITY, rng)
+    
+    def heading_layer(self, heading_text, color_key='heading_color'):
+        """Text layer kwargs for a slide heading centered on heading_y"""
+        heading_config = CAIRO_FONTS['heading']
+        return {
+            'text': heading_text,
+            'font_family': heading_config.get('family', 'DejaVu Sans'),
+            'font_size': heading_config['size'],
+            'text_color': self.hex_to_rgb(self.theme[color_key]),
+            'max_width': IMAGE_WIDTH - 100,
+            'alignment': "center",
+            'center_y': CAIRO_LAYOUT['heading_y']
+        }
+    
+    def reference_layer(self, ref_text):
+        """Text layer kwargs for a reference/attribution line centered on reference_y"""
+        ref_config = CAIRO_FONTS['reference']
+        return {
+            'text': ref_text,
+            'font_family': ref_config.get('family', 'DejaVu Sans'),
+            'font_size': ref_config['size'],
+            'text_color': self.hex_to_rgb(self.theme['source_color']),
+            'max_width': IMAGE_WIDTH - 100,
+            'alignment': "center",
+            'highlight_keywords': False,
+            'center_y': CAIRO_LAYOUT['reference_y']
+        }
+    
+    def watermark_layer(self):
+        """Text layer kwargs for the watermark centered on watermark_y"""
+        watermark_config = CAIRO_FONTS['watermark']
+        return {
+            'text': WATERMARK,
+            'font_family': watermark_config.get('family', 'DejaVu Sans'),
+            'font_size': watermark_config['size'],
+            'text_color': self.hex_to_rgb(self.theme['source_color']),
+            'max_width': IMAGE_WIDTH - 100,
+            'alignment': "center",
+            'center_y': CAIRO_LAYOUT['watermark_y']
+        }
+    
+    def swipe_layer(self):
+        """Corner label kwargs for the subtle "Swipe →" hint"""
+        swipe_config = CAIRO_FONTS['swipe']
+        return {
+            'text': "Swipe →",
+            'font_family': swipe_config['family'],
+            'font_size': swipe_config['size'],
+            'text_color': self.hex_to_rgb(self.theme['source_color']),
+            'opacity': swipe_config['opacity'],
+            'padding': swipe_config['padding']
+        }
+    
+    def static_sprite(self, layer, kind='english'):
+        """
+        Get the sprite for text that is identical on every post (sprite cache)
         
-        return img
+        Args:
+            layer: Renderer kwargs - must not use random highlighting
+            kind: 'english' (render_english_sprite) or 'corner_label' (render_corner_label_sprite)
+        """
+        key = SpriteCache.make_key(kind, layer, IMAGE_WIDTH, IMAGE_HEIGHT)
+        if kind == 'corner_label':
+            render = lambda: self.cairo_renderer.render_corner_label_sprite(**layer)
+        else:
+            render = lambda: self.cairo_renderer.render_english_sprite(**layer)
+        return self.sprite_cache.get(key, render)
+    
+    def add_heading(self, img, heading_text, color_key='heading_color'):
+        """Add slide heading centered on heading_y using Cairo for consistent sizing"""
+        heading_sprite = self.static_sprite(self.heading_layer(heading_text, color_key))
+        return self.cairo_renderer.composite_sprite(img, heading_sprite)
     
-    def add_grain_texture(self, img):
-        """Add grainy film texture - matching original aesthetic"""
-        # Create noise centered around 128 (gray) for better blending
-        grain_noise = PATTERN_SETTINGS.get('grain_noise', 25)
-        grain = np.random.normal(128, grain_noise, (IMAGE_HEIGHT, IMAGE_WIDTH, 3))
-        grain = np.clip(grain, 0, 255).astype('uint8')
-        grain_img = Image.fromarray(grain, mode='RGB')
+    def add_reference(self, img, ref_text):
+        """Add attribution line (e.g. "Sahih International") centered on reference_y"""
+        ref_sprite = self.static_sprite(self.reference_layer(ref_text))
+        return self.cairo_renderer.composite_sprite(img, ref_sprite)
+    
+    def add_watermark(self, img):
+        """Add watermark centered on watermark_y using Cairo for consistent sizing"""
+        watermark_sprite = self.static_sprite(self.watermark_layer())
+        return self.cairo_renderer.composite_sprite(img, watermark_sprite)
+    
+    def get_base_plate(self, kind):
+        """
+        Get the static layers for a slide kind, composited once per theme
         
-        # Blend with configurable intensity
-        intensity = GRAIN_INTENSITY
-        blended = Image.blend(img, grain_img, intensity)
+        A base plate = gradient + grain + heading + attribution + watermark.
+        Within a carousel only the body text differs, so every slide of the
+        same kind (and every post with the same theme) reuses the plate.
+        
+        Args:
+            kind: 'arabic', 'translation', 'tafsir', 'example' or 'cta'
         
-        return blended
+        Returns:
+            New RGB PIL Image (a copy - safe to composite onto)
+        """
+        key = (self.theme_name, kind)
+        plate = _BASE_PLATE_CACHE.get(key)
+        
+        if plate is None:
+            layers = BASE_PLATE_LAYERS[kind]
+            
+            # Grain seeded per theme and kind (not per post) - plates stay shared between posts
+            # and identical in every parallel worker
+            rng = PostRNG(run_grain_seed()).numpy('grain', self.theme_name, kind)
+            
+            plate = self.create_gradient_background()
+            plate = self.add_grain_texture(plate, rng)
+            
+            if layers['heading']:
+                heading_key, default_text, color_key = layers['heading']
+                plate = self.add_heading(plate, HEADING_TEXTS.get(heading_key, default_text), color_key)
+            
+            if layers['attribution']:
+                plate = self.add_reference(plate, layers['attribution'])
+            
+            plate = self.add_watermark(plate)
+            _BASE_PLATE_CACHE[key] = plate
+        
+        return plate.copy()
     
-    def add_watermark(self, img):
-        """Add watermark using Cairo for consistent sizing"""
-        watermark_config = CAIRO_FONTS['watermark']
+    def get_base_surface(self, kind):
+        """
+        Get the base plate for a slide kind as a Cairo surface (single-surface mode)
         
-        watermark_layer = self.cairo_renderer.render_english_text(
-            text=WATERMARK,
-            font_family=watermark_config.get('family', 'DejaVu Sans'),
-            font_size=watermark_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['source_color']),
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            transparent_bg=True
-        )
+        Converted from the PIL plate once per theme and kind, then shared:
+        canvases paint it as their source, they never draw into it.
+        """
+        key = (self.theme_name, kind)
+        surface = _BASE_SURFACE_CACHE.get(key)
         
-        watermark_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        watermark_paste = watermark_layer.convert('RGBA')
-        watermark_crop = watermark_paste.crop((0, (IMAGE_HEIGHT - 100) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 100) // 2))
-        watermark_img.paste(watermark_crop, (0, CAIRO_LAYOUT['watermark_y'] - 50))
+        if surface is None:
+            surface = self.cairo_renderer.pil_to_surface(self.get_base_plate(kind))
+            _BASE_SURFACE_CACHE[key] = surface
         
-        img = img.convert('RGBA')
-        img.alpha_composite(watermark_img)
-        return img.convert('RGB')
+        return surface
     
     def add_glassmorphism_panel(self, img, y_start, y_end, blur=15, opacity=0.10):
         """Add subtle glassmorphism effect panel - much more subtle than before"""
@@ -149,18 +323,14 @@ class QuranPostGeneratorCairo:
         return img_rgba.convert('RGB')
     
     def load_posted_verses(self):
-        """Load posted verse indices"""
-        if os.path.exists(self.posted_file):
-            with open(self.posted_file, 'r') as f:
-                self.posted_indices = json.load(f)
-        else:
-            self.posted_indices = []
+        """Load the posting ledger (once - migrates posted_verses.json the first time)"""
+        if self.ledger is None:
+            self.ledger = PostingLedger()
     
     def save_posted_verse(self, index):
-        """Save posted verse index"""
-        self.posted_indices.append(index)
-        with open(self.posted_file, 'w') as f:
-            json.dump(self.posted_indices, f)
+        """Mark a verse as posted and save the ledger (atomic)"""
+        self.ledger.mark(index)
+        self.ledger.save()
     
     def get_verse_info(self):
         """Get current verse info for caption generation"""
@@ -173,7 +343,8 @@ class QuranPostGeneratorCairo:
         HOW IT WORKS:
         ✅ Posts verses sequentially from Quran (all 6,236 verses in order)
         ✅ Verse order: 1:1 → 1:2 → 1:3 → ... → 114:6
-        ✅ Tracks posted verses in posted_verses.json (committed to git after each post)
+        ✅ Tracks posted verses in posting_ledger.json (committed to git after each post)
+        ✅ Next verse is the ledger's cursor - no scan over the posting history
         ✅ After all verses posted, cycles back to beginning
         
         WHY SEQUENTIAL?
@@ -183,45 +354,49 @@ class QuranPostGeneratorCairo:
         - Easy to track progress (currently at verse X of 6,236)
         
         EXAMPLE PROGRESSION:
-        Post 1: Al-Fatihah 1:1 → posted_verses.json = [0]
-        Post 2: Al-Fatihah 1:2 → posted_verses.json = [0, 1]
-        Post 3: Al-Fatihah 1:3 → posted_verses.json = [0, 1, 2]
+        Post 1: Al-Fatihah 1:1 → bit 0 set, cursor = 1
+        Post 2: Al-Fatihah 1:2 → bit 1 set, cursor = 2
+        Post 3: Al-Fatihah 1:3 → bit 2 set, cursor = 3
         ...continuing through all 6,236 verses
         """
-        available = [i for i in range(len(self.verses_data)) if i not in self.posted_indices]
+        self.load_posted_verses()
+        index = self.ledger.next_index()
         
-        if not available:
+        if index is None:
             print("🎉 All 6,236 verses posted! Starting over from beginning...")
-            self.posted_indices = []
-            available = list(range(len(self.verses_data)))
+            self.ledger.start_new_cycle()
+            index = self.ledger.next_index()
         
-        index = available[0]
-        verse_meta = self.verses_data[index]
-        
-        # Fetch from API with FULL harakat
-        verse_data = self.api.get_verse(verse_meta['surah'], verse_meta['ayah'])
+        verse_data = self.fetch_verse_data(self.verses_data[index])
         
         if not verse_data:
             print(f"⚠️  Skipping verse...")
-            self.posted_indices.append(index)
+            self.ledger.mark(index, post=False)  # Saved with the next posted verse
             return self.get_next_verse()
         
-        # Use API-fetched tafsir (NEVER make up content)
-        from auto_tafsir_fetcher import AutoTafsirFetcher
-        tafsir_fetcher = AutoTafsirFetcher()
-        api_tafsir = tafsir_fetcher.fetch_tafsir(verse_meta['surah'], verse_meta['ayah'])
+        return index, verse_data
+    
+    def fetch_verse_data(self, verse_meta):
+        """
+        Fetch everything a post needs for one verse (Arabic, translation, tafsir, theme)
         
-        # Priority: API tafsir > Manual tafsir from quran_data.py > None
-        if api_tafsir:
-            verse_data['tafsir'] = api_tafsir
-        elif 'tafsir_excerpt' in verse_meta:
-            verse_data['tafsir'] = verse_meta['tafsir_excerpt']
-        else:
-            verse_data['tafsir'] = None
+        Args:
+            verse_meta: Entry from get_all_verses() - {'surah', 'ayah', 'theme', ...}
         
-        verse_data['theme'] = verse_meta['theme']
+        Returns:
+            verse_data dict, or None if the verse could not be fetched
+        """
+        # Verse (FULL harakat) and API tafsir fetched concurrently - NEVER made up
+        return self.pipeline.fetch(verse_meta)
+    
+    def fetch_many_verse_data(self, verse_metas):
+        """
+        Fetch several verses at once (bounded concurrency, see VersePipeline)
         
-        return index, verse_data
+        Returns:
+            List of verse_data dicts (None where a verse could not be fetched), in input order
+        """
+        return self.pipeline.fetch_many(verse_metas)
     
     def split_text_by_height(self, text, max_height, font_family, font_size, max_width, line_height):
         """
@@ -231,25 +406,10 @@ class QuranPostGeneratorCairo:
         Returns:
             list of text chunks
         """
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        
-        for word in words:
-            test_chunk = ' '.join(current_chunk + [word])
-            height = self.cairo_renderer.measure_text_height(
-                test_chunk, font_family, font_size, max_width, line_height
-            )
-            
-            if height <= max_height:
-                current_chunk.append(word)
-            else:
-                if current_chunk:
-                    chunks.append(' '.join(current_chunk))
-                current_chunk = [word]
-        
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        # Page breaks come from one layout per page (see CairoArabicRenderer.paginate_text)
+        chunks = self.cairo_renderer.paginate_text(
+            text, max_height, font_family, font_size, max_width, line_height
+        )
         
         # Balance chunks: if last chunk has very few words (<3) and there are multiple chunks,
         # redistribute words from the previous chunk to balance better
@@ -276,14 +436,8 @@ class QuranPostGeneratorCairo:
         
         return chunks if chunks else [text]
     
-    def create_slide_arabic(self, verse_data, text_override=None):
-        """Slide 1: Arabic text - RIGHT ALIGNED with dynamic overflow handling"""
-        # Create gradient + grain background
-        img = self.create_gradient_background()
-        img = self.add_grain_texture(img)
-        
-        # Get verse reference
-        surah_num = verse_data['surah_number']
+    def format_arabic_verse(self, verse_data):
+        """Full Arabic verse with ۞ start marker, ayah number and sajdah marker ۩"""
         ayah_num = verse_data['ayah_number']
         
         # Format text with markers
@@ -291,311 +445,143 @@ class QuranPostGeneratorCairo:
         arabic_numerals = str(ayah_num).translate(str.maketrans('0123456789', '٠١٢٣٤٥٦٧٨٩'))
         
         # Check if verse has sajdah marker ۩ (U+06E9) at the end
-        has_sajdah = clean_verse.endswith('۩')
-        
-        # Use override text if provided (for continuation slides)
-        if text_override:
-            full_verse = text_override
-        else:
-            # Add beginning marker ۞ and end marker with ayah number
-            # If sajdah verse, keep the sajdah marker visible
-            if has_sajdah:
-                # Remove sajdah marker temporarily, add it back after ayah number
-                clean_verse_no_sajdah = clean_verse[:-1].strip()
-                full_verse = f"۞  {clean_verse_no_sajdah}  ﴿{arabic_numerals}﴾  ۩"
-            else:
-                full_verse = f"۞  {clean_verse}  ﴿{arabic_numerals}﴾"
+        # If sajdah verse, keep the sajdah marker visible after the ayah number
+        if clean_verse.endswith('۩'):
+            clean_verse_no_sajdah = clean_verse[:-1].strip()
+            return f"۞  {clean_verse_no_sajdah}  ﴿{arabic_numerals}﴾  ۩"
         
-        # Get config settings
-        arabic_config = CAIRO_FONTS['arabic_verse']
-        ref_config = CAIRO_FONTS['reference']
-        heading_config = CAIRO_FONTS['heading']
-        
-        # Calculate safe area for text (between heading and reference)
-        heading_bottom = CAIRO_LAYOUT['heading_y'] + 100
-        reference_top = CAIRO_LAYOUT['reference_y'] - 50
-        max_text_height = reference_top - heading_bottom - 100  # 100px safety margin
-        
-        # Render heading with Cairo for consistent sizing
-        # Use source_color for Arabic slide heading so Arabic text pops
-        heading_text = HEADING_TEXTS.get('arabic_slide', 'Verse of Reflection')
-        heading_layer = self.cairo_renderer.render_english_text(
-            text=heading_text,
-            font_family=heading_config.get('family', 'DejaVu Sans'),
-            font_size=heading_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['source_color']),  # Use source_color instead
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            transparent_bg=True
-        )
-        
-        # Composite heading onto background at specific Y position
-        heading_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        heading_paste = heading_layer.convert('RGBA')
-        # Crop to just the heading area and position it
-        heading_crop = heading_paste.crop((0, (IMAGE_HEIGHT - 200) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 200) // 2))
-        heading_img.paste(heading_crop, (0, CAIRO_LAYOUT['heading_y'] - 100))
-        
-        img = img.convert('RGBA')
-        img.alpha_composite(heading_img)
-        img = img.convert('RGB')
-        
-        # Render Arabic with Cairo - transparent background to overlay
-        arabic_layer = self.cairo_renderer.render_arabic_verse(
-            text=full_verse,
-            font_family=arabic_config['family'],
-            font_size=arabic_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['arabic_color']),
-            max_width=arabic_config['max_width'],
-            line_height=arabic_config['line_height'],
-            align='right',  # RIGHT ALIGNED
-            transparent_bg=True
-        )
-        
-        # Composite Arabic layer onto background
-        img = img.convert('RGBA')
-        arabic_layer_rgba = arabic_layer.convert('RGBA')
-        img.alpha_composite(arabic_layer_rgba, (0, 0))
-        img = img.convert('RGB')
-        
-        # Add reference at bottom with Cairo - Format: Az-Zumar (39:53)
-        surah_name = verse_data.get('surah_name', f'Surah {surah_num}')
-        ref_text = f"{surah_name} ({surah_num}:{ayah_num})"
-        
-        ref_layer = self.cairo_renderer.render_english_text(
-            text=ref_text,
-            font_family=ref_config.get('family', 'DejaVu Sans'),
-            font_size=ref_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['source_color']),
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            highlight_keywords=False,
-            transparent_bg=True
-        )
-        
-        # Composite reference at bottom
-        ref_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        ref_paste = ref_layer.convert('RGBA')
-        ref_crop = ref_paste.crop((0, (IMAGE_HEIGHT - 200) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 200) // 2))
-        ref_img.paste(ref_crop, (0, CAIRO_LAYOUT['reference_y'] - 100))
-        
-        img = img.convert('RGBA')
-        img.alpha_composite(ref_img)
-        img = img.convert('RGB')
-        
-        # Add watermark with Cairo
-        watermark_config = CAIRO_FONTS['watermark']
-        watermark_layer = self.cairo_renderer.render_english_text(
-            text=WATERMARK,
-            font_family=watermark_config.get('family', 'DejaVu Sans'),
-            font_size=watermark_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['source_color']),
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            transparent_bg=True
-        )
-        
-        watermark_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        watermark_paste = watermark_layer.convert('RGBA')
-        watermark_crop = watermark_paste.crop((0, (IMAGE_HEIGHT - 100) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 100) // 2))
-        watermark_img.paste(watermark_crop, (0, CAIRO_LAYOUT['watermark_y'] - 50))
-        
-        img = img.convert('RGBA')
-        img.alpha_composite(watermark_img)
-        img = img.convert('RGB')
-        
-        return img
+        return f"۞  {clean_verse}  ﴿{arabic_numerals}﴾"
     
-    def create_slide_translation(self, verse_data):
-        """Slide 2: English translation - LEFT ALIGNED, vertically centered"""
-        # Create gradient + grain background
-        img = self.create_gradient_background()
-        img = self.add_grain_texture(img)
+    def slide_layers(self, spec):
+        """
+        Body text layers for one slide (everything not already on the base plate)
         
-        # Get config settings
-        trans_config = CAIRO_FONTS['translation']
-        heading_config = CAIRO_FONTS['heading']
-        ref_config = CAIRO_FONTS['reference']
+        Args:
+            spec: Slide spec dict from plan_slides() - 'kind' plus 'verse_data',
+                  'text' and 'quotes' as the kind needs
         
-        # Render heading with Cairo for consistent sizing
-        heading_text = HEADING_TEXTS.get('translation_slide', 'English Translation')
-        heading_layer = self.cairo_renderer.render_english_text(
-            text=heading_text,
-            font_family=heading_config.get('family', 'DejaVu Sans'),
-            font_size=heading_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['heading_color']),
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            transparent_bg=True
-        )
+        Returns:
+            List of (script, renderer kwargs) in drawing order - script is 'arabic',
+            'english', or 'static' (English text served from the sprite cache)
+        """
+        kind = spec['kind']
         
-        # Composite heading onto background at specific Y position
-        heading_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        heading_paste = heading_layer.convert('RGBA')
-        heading_crop = heading_paste.crop((0, (IMAGE_HEIGHT - 200) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 200) // 2))
-        heading_img.paste(heading_crop, (0, CAIRO_LAYOUT['heading_y'] - 100))
-        
-        img = img.convert('RGBA')
-        img.alpha_composite(heading_img)
-        img = img.convert('RGB')
-        
-        # Render translation with Cairo - LEFT ALIGNED, vertically centered
-        # Add quote symbols for better presentation
-        translation_text = f'"{verse_data["translation"]}"'
-        translation_layer = self.cairo_renderer.render_english_text(
-            text=translation_text,
-            font_family=trans_config['family'],
-            font_size=trans_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['text_color']),
-            max_width=trans_config['max_width'],
-            alignment="left",  # LEFT ALIGNED
-            transparent_bg=True,
-            line_height=trans_config.get('line_height', 1.6),
-            highlight_keywords=True,
-            accent_color=self.theme['accent_color']  # Use theme accent color
-        )
+        if kind == 'arabic':
+            # Slide 1: Arabic text - RIGHT ALIGNED, reference at the bottom
+            verse_data = spec['verse_data']
+            arabic_config = CAIRO_FONTS['arabic_verse']
+            
+            # Use override text if provided (for continuation slides)
+            arabic_text = spec.get('text') or self.format_arabic_verse(verse_data)
+            
+            # Format: Az-Zumar (39:53)
+            surah_num = verse_data['surah_number']
+            surah_name = verse_data.get('surah_name') or get_surah(surah_num).name
+            ref_text = f"{surah_name} ({surah_num}:{verse_data['ayah_number']})"
+            
+            return [
+                ('arabic', {
+                    'text': arabic_text,
+                    'font_family': arabic_config['family'],
+                    'font_size': arabic_config['size'],
+                    'text_color': self.hex_to_rgb(self.theme['arabic_color']),
+                    'max_width': arabic_config['max_width'],
+                    'line_height': arabic_config['line_height'],
+                    'align': 'right'  # RIGHT ALIGNED
+                }),
+                ('english', self.reference_layer(ref_text))
+            ]
         
-        # Composite onto background
-        img = img.convert('RGBA')
-        translation_rgba = translation_layer.convert('RGBA')
-        img.alpha_composite(translation_rgba, (0, 0))
-        img = img.convert('RGB')
-        
-        # Add attribution with Cairo
-        attr_text = "Sahih International"
-        attr_layer = self.cairo_renderer.render_english_text(
-            text=attr_text,
-            font_family=ref_config.get('family', 'DejaVu Sans'),
-            font_size=ref_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['source_color']),
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            transparent_bg=True
-        )
+        if kind == 'cta':
+            # Final slide: simple, clear message without emoji
+            trans_config = CAIRO_FONTS['translation']
+            return [
+                ('static', {
+                    'text': "If this touched your heart\n\nLike & Follow\n\nFor daily Quranic wisdom",
+                    'font_family': trans_config['family'],
+                    'font_size': 56,  # Larger, cleaner font
+                    'text_color': self.hex_to_rgb(self.theme['text_color']),
+                    'max_width': IMAGE_WIDTH - 200,
+                    'alignment': "center",
+                    'line_height': 1.7,  # More spacing for easier reading
+                    'highlight_keywords': False
+                })
+            ]
         
-        attr_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        attr_paste = attr_layer.convert('RGBA')
-        attr_crop = attr_paste.crop((0, (IMAGE_HEIGHT - 200) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 200) // 2))
-        attr_img.paste(attr_crop, (0, CAIRO_LAYOUT['reference_y'] - 100))
+        # Translation / tafsir / example: LEFT ALIGNED, vertically centered
+        config = CAIRO_FONTS[kind]
+        layer = {
+            'text': spec['text'],
+            'font_family': config['family'],
+            'font_size': config['size'],
+            'text_color': self.hex_to_rgb(self.theme['text_color']),
+            'max_width': config['max_width'],
+            'alignment': "left",  # LEFT ALIGNED
+            'line_height': config.get('line_height', 1.6),
+            'highlight_keywords': kind != 'example',  # No highlighting on example slide
+            'accent_color': self.theme['accent_color']  # Use theme accent color
+        }
+        if layer['highlight_keywords']:
+            layer['highlight_seed'] = spec.get('seed')  # Same post seed = same highlighted words
         
-        img = img.convert('RGBA')
-        img.alpha_composite(attr_img)
-        img = img.convert('RGB')
+        if kind == 'translation':
+            # Add quote symbols for better presentation
+            layer['text'] = f'"{spec["text"]}"'
+        elif kind == 'tafsir':
+            layer['add_opening_quote'], layer['add_closing_quote'] = spec.get('quotes', (True, True))
         
-        # Add watermark
-        img = self.add_watermark(img)
+        return [('english', layer)]
+    
+    def compose_slide(self, spec):
+        """Build a slide as a PIL image: base plate + body text sprites"""
+        img = self.get_base_plate(spec['kind'])
+        
+        for script, layer in self.slide_layers(spec):
+            if script == 'arabic':
+                sprite = self.cairo_renderer.render_arabic_sprite(**layer)
+            elif script == 'static':
+                sprite = self.static_sprite(layer)
+            else:
+                sprite = self.cairo_renderer.render_english_sprite(**layer)
+            img = self.cairo_renderer.composite_sprite(img, sprite)
         
         return img
     
-    def create_slide_tafsir(self, verse_data):
-        """Slide 3: Tafsir - LEFT ALIGNED, vertically centered, just grainy bg no glassmorphism"""
-        # Create gradient + grain background - NO glassmorphism
-        img = self.create_gradient_background()
-        img = self.add_grain_texture(img)
-        
-        # Get config settings
-        tafsir_config = CAIRO_FONTS['tafsir']
-        heading_config = CAIRO_FONTS['heading']
-        
-        # Render heading with Cairo for consistent sizing
-        heading_text = HEADING_TEXTS.get('tafsir_slide', 'Tafsir Ibn Kathir')
-        heading_layer = self.cairo_renderer.render_english_text(
-            text=heading_text,
-            font_family=heading_config.get('family', 'DejaVu Sans'),
-            font_size=heading_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['heading_color']),
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            transparent_bg=True
-        )
+    def compose_slide_cairo(self, spec, swipe_hint=False):
+        """
+        Build a slide on ONE Cairo surface: base plate, body text and swipe hint
         
-        # Composite heading onto background at specific Y position
-        heading_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        heading_paste = heading_layer.convert('RGBA')
-        heading_crop = heading_paste.crop((0, (IMAGE_HEIGHT - 200) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 200) // 2))
-        heading_img.paste(heading_crop, (0, CAIRO_LAYOUT['heading_y'] - 100))
-        
-        img = img.convert('RGBA')
-        img.alpha_composite(heading_img)
-        img = img.convert('RGB')
-        
-        # Render tafsir with Cairo
-        # Handle quote marks for both single and multi-slide cases
-        tafsir_text = verse_data["tafsir"]
-        
-        # Check for quote markers added in generate_post()
-        has_open_marker = '__QUOTE_OPEN__' in tafsir_text
-        has_close_marker = '__QUOTE_CLOSE__' in tafsir_text
-        has_no_quotes_marker = '__NO_QUOTES__' in tafsir_text
-        
-        # Remove ALL markers
-        tafsir_text = tafsir_text.replace('__QUOTE_OPEN__', '')
-        tafsir_text = tafsir_text.replace('__QUOTE_CLOSE__', '')
-        tafsir_text = tafsir_text.replace('__NO_QUOTES__', '')
-        
-        # Determine if we need to add quotes based on markers
-        if has_no_quotes_marker:
-            # MIDDLE SLIDE - explicitly marked to have NO quotes
-            add_opening = False
-            add_closing = False
-        elif has_open_marker:
-            # First slide of multi-slide sequence
-            add_opening = True
-            add_closing = False
-        elif has_close_marker:
-            # Last slide of multi-slide sequence
-            add_opening = False
-            add_closing = True
-        else:
-            # Single slide (complete tafsir) - no markers at all
-            add_opening = True
-            add_closing = True
-        
-        tafsir_layer = self.cairo_renderer.render_english_text(
-            text=tafsir_text,
-            font_family=tafsir_config['family'],
-            font_size=tafsir_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['text_color']),
-            max_width=tafsir_config['max_width'],
-            alignment="left",  # LEFT ALIGNED
-            highlight_keywords=True,
-            transparent_bg=True,
-            line_height=tafsir_config.get('line_height', 1.6),
-            accent_color=self.theme['accent_color'],  # Use theme accent color
-            add_opening_quote=add_opening,  # Pass quote flags
-            add_closing_quote=add_closing
-        )
+        No per-layer PIL images - the surface is converted to PIL once at the end.
+        """
+        surface, context = self.cairo_renderer.create_canvas(self.get_base_surface(spec['kind']))
         
-        # Composite onto background
-        img = img.convert('RGBA')
-        tafsir_rgba = tafsir_layer.convert('RGBA')
-        img.alpha_composite(tafsir_rgba, (0, 0))
-        img = img.convert('RGB')
+        for script, layer in self.slide_layers(spec):
+            if script == 'arabic':
+                self.cairo_renderer.draw_arabic_text(context, **layer)
+            elif script == 'static':
+                self.cairo_renderer.paint_sprite(context, self.static_sprite(layer))
+            else:
+                self.cairo_renderer.draw_english_text(context, **layer)
         
-        # Add watermark
-        img = self.add_watermark(img)
+        if swipe_hint:
+            self.cairo_renderer.paint_sprite(context, self.static_sprite(self.swipe_layer(), 'corner_label'))
         
-        return img
+        return self.cairo_renderer.canvas_to_pil(surface)
     
-    def generate_ayah_specific_example(self, verse_data):
+    def generate_ayah_specific_example(self, verse_data, rng=None):
         """
         Generate ayah-specific practical example based on verse theme
         Expanded to 100+ unique examples covering all themes
-        """
-        import random
         
+        Args:
+            rng: random.Random that picks the example (default: the verse's
+                 cycle-1 post seed, the same stream plan_slides uses)
+        """
         theme = verse_data.get('theme', 'Guidance')
         surah = verse_data.get('surah_number', '')
         ayah = verse_data.get('ayah_number', '')
+        if rng is None:
+            rng = PostRNG(post_seed(surah, ayah)).random('example')
         
         # Comprehensive example database organized by theme (10+ per theme)
         THEME_EXAMPLES = {
@@ -729,166 +715,34 @@ class QuranPostGeneratorCairo:
         ])
         
         # Randomly select one example from the theme
-        return random.choice(theme_examples)
-    
-    def create_slide_example(self, verse_data):
-        """Slide 4: Real-life example - LEFT ALIGNED, vertically centered"""
-        # Create gradient + grain background
-        img = self.create_gradient_background()
-        img = self.add_grain_texture(img)
-        
-        # Check if text override is provided (for split slides)
-        if '_example_text_override' in verse_data:
-            example_text = verse_data['_example_text_override']
-        else:
-            # Generate ayah-specific example
-            example_text = self.generate_ayah_specific_example(verse_data)
-        
-        # Get config settings
-        example_config = CAIRO_FONTS['example']
-        heading_config = CAIRO_FONTS['heading']
-        
-        # Render heading with Cairo for consistent sizing
-        heading_text = HEADING_TEXTS.get('example_slide', 'How to Apply This Today')
-        heading_layer = self.cairo_renderer.render_english_text(
-            text=heading_text,
-            font_family=heading_config.get('family', 'DejaVu Sans'),
-            font_size=heading_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['heading_color']),
-            max_width=IMAGE_WIDTH - 100,
-            alignment="center",
-            transparent_bg=True
-        )
-        
-        # Composite heading onto background at specific Y position
-        heading_img = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        heading_paste = heading_layer.convert('RGBA')
-        heading_crop = heading_paste.crop((0, (IMAGE_HEIGHT - 200) // 2, IMAGE_WIDTH, (IMAGE_HEIGHT + 200) // 2))
-        heading_img.paste(heading_crop, (0, CAIRO_LAYOUT['heading_y'] - 100))
-        
-        img = img.convert('RGBA')
-        img.alpha_composite(heading_img)
-        img = img.convert('RGB')
-        
-        # Render example with Cairo - LEFT ALIGNED, vertically centered
-        example_layer = self.cairo_renderer.render_english_text(
-            text=example_text,
-            font_family=example_config['family'],
-            font_size=example_config['size'],
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['text_color']),
-            max_width=example_config['max_width'],
-            alignment="left",  # LEFT ALIGNED
-            transparent_bg=True,
-            line_height=example_config.get('line_height', 1.6),
-            highlight_keywords=False  # No highlighting on example slide
-        )
-        
-        # Composite onto background
-        img = img.convert('RGBA')
-        example_rgba = example_layer.convert('RGBA')
-        img.alpha_composite(example_rgba, (0, 0))
-        img = img.convert('RGB')
-        
-        # Add watermark
-        img = self.add_watermark(img)
-        
-        return img
-    
-    def create_slide_cta(self):
-        """Final slide: Call to Action - simple and easy to read"""
-        # Create gradient + grain background
-        img = self.create_gradient_background()
-        img = self.add_grain_texture(img)
-        
-        # Get config
-        heading_config = CAIRO_FONTS['heading']
-        trans_config = CAIRO_FONTS['translation']
-        
-        # Simple, clear message without emoji
-        message_text = "If this touched your heart\n\nLike & Follow\n\nFor daily Quranic wisdom"
-        
-        message_layer = self.cairo_renderer.render_english_text(
-            text=message_text,
-            font_family=trans_config['family'],
-            font_size=56,  # Larger, cleaner font
-            bg_color=(0, 0, 0),
-            text_color=self.hex_to_rgb(self.theme['text_color']),
-            max_width=IMAGE_WIDTH - 200,
-            alignment="center",
-            transparent_bg=True,
-            line_height=1.7,  # More spacing for easier reading
-            highlight_keywords=False
-        )
-        
-        # Composite message in center
-        img = img.convert('RGBA')
-        message_rgba = message_layer.convert('RGBA')
-        img.alpha_composite(message_rgba, (0, 0))
-        img = img.convert('RGB')
-        
-        # Add watermark at very bottom (no gold handle in middle - just clean watermark)
-        img = self.add_watermark(img)
-        
-        return img
+        return rng.choice(theme_examples)
     
     def add_navigation_arrow(self, img):
         """
         Add subtle "Swipe →" text to indicate more content
-        Positioned at bottom right corner
+        Positioned at bottom right corner (pre-rasterized once, from the sprite cache)
         """
-        img = img.convert('RGBA')
-        
-        # Create overlay for text
-        overlay = Image.new('RGBA', (IMAGE_WIDTH, IMAGE_HEIGHT), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
-        
-        # Text settings
-        text = "Swipe →"
-        padding = 50
-        
-        # Get theme colors (subtle, semi-transparent)
-        source_rgb = self.hex_to_rgb(self.theme['source_color'])
-        text_color = source_rgb + (120,)  # More subtle transparency
-        
-        # Try to load a nice font
-        try:
-            # Try Product Sans first (modern, clean)
-            font = ImageFont.truetype("fonts/ProductSans-Regular.ttf", 32)
-        except:
-            try:
-                # Fallback to system font
-                font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 32)
-            except:
-                font = ImageFont.load_default()
-        
-        # Get text dimensions
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        # Position at bottom right
-        x = IMAGE_WIDTH - text_width - padding
-        y = IMAGE_HEIGHT - text_height - padding
-        
-        # Draw text
-        draw.text((x, y), text, font=font, fill=text_color)
-        
-        # Composite onto image
-        img.alpha_composite(overlay)
-        return img.convert('RGB')
+        swipe_sprite = self.static_sprite(self.swipe_layer(), 'corner_label')
+        return self.cairo_renderer.composite_sprite(img, swipe_sprite)
     
-    def generate_post(self, verse_data=None):
-        """Generate carousel post with dynamic overflow handling"""
-        if verse_data is None:
-            index, verse_data = self.get_next_verse()
-            self.save_posted_verse(index)
+    def plan_slides(self, verse_data, seed=None):
+        """
+        Measure and split the verse into an ordered list of slide specs
         
-        # Store verse info for caption generation
-        self.current_verse_info = verse_data
+        Pure layout planning - nothing is drawn here, so the same plan can be
+        rendered by either compositor (see generate_post render_mode).
         
-        print(f"\n📖 Generating post for Surah {verse_data['surah_number']}, Ayah {verse_data['ayah_number']}")
+        Args:
+            verse_data: Verse dict to plan
+            seed: Post seed for the example choice and highlighted words
+                  (default: post_seed of the verse in cycle 1)
+        
+        Returns:
+            List of spec dicts for slide_layers(): {'kind', 'verse_data', 'text', 'quotes', 'seed'}
+        """
+        if seed is None:
+            seed = post_seed(verse_data['surah_number'], verse_data['ayah_number'])
+        rng = PostRNG(seed)
         
         # Get config for text measurement
         arabic_config = CAIRO_FONTS['arabic_verse']
@@ -900,19 +754,30 @@ class QuranPostGeneratorCairo:
         reference_top = CAIRO_LAYOUT['reference_y'] - 50
         max_text_height = reference_top - heading_bottom - 100  # 100px safety margin
         
-        slides = []
+        specs = []
         
-        # 1. Arabic slide(s) - check for overflow
         clean_verse = verse_data['arabic'].replace('۞', '').strip()
         ayah_num = verse_data['ayah_number']
         arabic_numerals = str(ayah_num).translate(str.maketrans('0123456789', '٠١٢٣٤٥٦٧٨٩'))
         full_verse = f"۞  {clean_verse}  ﴿{arabic_numerals}﴾"
         
-        arabic_height = self.cairo_renderer.measure_text_height(
-            full_verse, arabic_config['family'], arabic_config['size'], 
-            arabic_config['max_width'], arabic_config['line_height']
-        )
+        # The example is chosen ONCE and the same text is measured and rendered
+        example_text = self.generate_ayah_specific_example(verse_data, rng.random('example'))
+        example_config = CAIRO_FONTS['example']
         
+        # Measure every section in one batch (shared measurement layout)
+        arabic_height, trans_height, tafsir_height, example_height = self.cairo_renderer.measure_many([
+            (full_verse, arabic_config['family'], arabic_config['size'],
+             arabic_config['max_width'], arabic_config['line_height']),
+            (verse_data['translation'], trans_config['family'], trans_config['size'],
+             trans_config['max_width'], trans_config.get('line_height', 1.6)),
+            (verse_data.get('tafsir') or '', tafsir_config['family'], tafsir_config['size'],
+             tafsir_config['max_width'], tafsir_config.get('line_height', 1.6)),
+            (example_text, example_config['family'], example_config['size'],
+             example_config['max_width'], example_config.get('line_height', 1.6))
+        ])
+        
+        # 1. Arabic slide(s) - check for overflow
         if arabic_height > max_text_height:
             print(f"⚠️  Arabic text too long ({arabic_height}px > {max_text_height}px), splitting into multiple slides...")
             chunks = self.split_text_by_height(
@@ -926,17 +791,12 @@ class QuranPostGeneratorCairo:
                     text = f"{chunk}  ﴿{arabic_numerals}﴾"
                 else:
                     text = chunk
-                slides.append(self.create_slide_arabic(verse_data, text_override=text))
-            print(f"✅ Created {len(chunks)} Arabic slides")
+                specs.append({'kind': 'arabic', 'verse_data': verse_data, 'text': text})
+            print(f"✅ Planned {len(chunks)} Arabic slides")
         else:
-            slides.append(self.create_slide_arabic(verse_data))
+            specs.append({'kind': 'arabic', 'verse_data': verse_data, 'text': None})
         
         # 2. Translation slide(s) - check for overflow
-        trans_height = self.cairo_renderer.measure_text_height(
-            verse_data['translation'], trans_config['family'], trans_config['size'],
-            trans_config['max_width'], trans_config.get('line_height', 1.6)
-        )
-        
         if trans_height > max_text_height:
             print(f"⚠️  Translation too long, splitting...")
             chunks = self.split_text_by_height(
@@ -944,53 +804,32 @@ class QuranPostGeneratorCairo:
                 trans_config['size'], trans_config['max_width'], trans_config.get('line_height', 1.6)
             )
             for chunk in chunks:
-                slides.append(self.create_slide_translation({**verse_data, 'translation': chunk}))
-            print(f"✅ Created {len(chunks)} translation slides")
+                specs.append({'kind': 'translation', 'verse_data': verse_data, 'text': chunk})
+            print(f"✅ Planned {len(chunks)} translation slides")
         else:
-            slides.append(self.create_slide_translation(verse_data))
+            specs.append({'kind': 'translation', 'verse_data': verse_data, 'text': verse_data['translation']})
         
         # 3. Tafsir slide(s) - check for overflow (FULL tafsir, may be multiple slides)
         if verse_data.get('tafsir'):
-            tafsir_height = self.cairo_renderer.measure_text_height(
-                verse_data['tafsir'], tafsir_config['family'], tafsir_config['size'],
-                tafsir_config['max_width'], tafsir_config.get('line_height', 1.6)
-            )
-            
             if tafsir_height > max_text_height:
                 print(f"⚠️  Tafsir too long ({len(verse_data['tafsir'])} chars), splitting into multiple slides...")
                 chunks = self.split_text_by_height(
                     verse_data['tafsir'], max_text_height, tafsir_config['family'],
                     tafsir_config['size'], tafsir_config['max_width'], tafsir_config.get('line_height', 1.6)
                 )
-                # Add stylish opening quote to first chunk, closing quote to last chunk
-                # Mark chunks with special prefix so renderer knows to add quotes
+                # Opening quote on the first chunk, closing quote on the last, none in between
                 for i, chunk in enumerate(chunks):
-                    if i == 0:
-                        # First slide: will get opening quote in renderer
-                        formatted_chunk = f'__QUOTE_OPEN__{chunk}'
-                    elif i == len(chunks) - 1:
-                        # Last slide: will get closing quote in renderer
-                        formatted_chunk = f'{chunk}__QUOTE_CLOSE__'
-                    else:
-                        # Middle slides: EXPLICITLY mark as no quotes
-                        formatted_chunk = f'__NO_QUOTES__{chunk}'
-                    slides.append(self.create_slide_tafsir({**verse_data, 'tafsir': formatted_chunk}))
-                print(f"✅ Created {len(chunks)} tafsir slides (showing FULL tafsir)")
+                    quotes = (i == 0, i == len(chunks) - 1)
+                    specs.append({'kind': 'tafsir', 'verse_data': verse_data, 'text': chunk, 'quotes': quotes})
+                print(f"✅ Planned {len(chunks)} tafsir slides (showing FULL tafsir)")
             else:
-                slides.append(self.create_slide_tafsir(verse_data))
-                print(f"✅ Created 1 tafsir slide (complete, {len(verse_data['tafsir'])} chars)")
+                specs.append({'kind': 'tafsir', 'verse_data': verse_data,
+                              'text': verse_data['tafsir'], 'quotes': (True, True)})
+                print(f"✅ Planned 1 tafsir slide (complete, {len(verse_data['tafsir'])} chars)")
         else:
             print(f"⚠️  No tafsir available, skipping tafsir slide")
         
         # 4. Example slide(s) - check for overflow
-        example_text = self.generate_ayah_specific_example(verse_data)
-        example_config = CAIRO_FONTS['example']
-        
-        example_height = self.cairo_renderer.measure_text_height(
-            example_text, example_config['family'], example_config['size'],
-            example_config['max_width'], example_config.get('line_height', 1.6)
-        )
-        
         if example_height > max_text_height:
             print(f"⚠️  Example too long, splitting...")
             chunks = self.split_text_by_height(
@@ -998,40 +837,209 @@ class QuranPostGeneratorCairo:
                 example_config['size'], example_config['max_width'], example_config.get('line_height', 1.6)
             )
             for chunk in chunks:
-                # Create a modified verse_data with just this chunk
-                verse_data_chunk = {**verse_data, '_example_text_override': chunk}
-                slides.append(self.create_slide_example(verse_data_chunk))
-            print(f"✅ Created {len(chunks)} example slides")
+                specs.append({'kind': 'example', 'verse_data': verse_data, 'text': chunk})
+            print(f"✅ Planned {len(chunks)} example slides")
         else:
-            slides.append(self.create_slide_example(verse_data))
+            specs.append({'kind': 'example', 'verse_data': verse_data, 'text': example_text})
         
         # 5. Call to Action slide - always at end
-        slides.append(self.create_slide_cta())
-        print(f"✅ Added Call-to-Action slide")
+        specs.append({'kind': 'cta'})
+        
+        for spec in specs:
+            spec['seed'] = seed
+        return specs
+    
+    def render_cache_key(self, spec, swipe_hint, compositor):
+        """Render cache key for a slide (None when the cache is off)"""
+        if not self.render_cache.enabled:
+            return None
+        return RenderCache.make_key(self.theme_name, spec['kind'], self.slide_layers(spec),
+                                    swipe_hint, compositor)
+    
+    def render_slide_to_file(self, spec, swipe_hint, filename, compositor='pil'):
+        """
+        Render one planned slide and encode it to disk
+        
+        Args:
+            spec: Slide spec from plan_slides()
+            swipe_hint: Add the "Swipe →" hint (every slide except the CTA)
+            filename: Output PNG path
+            compositor: 'pil' (sprites composited in PIL) or 'cairo' (single surface)
+        
+        Returns:
+            Wall time in seconds (render + encode, or the copy on a render cache hit)
+        """
+        start = time.perf_counter()
+        
+        key = self.render_cache_key(spec, swipe_hint, compositor)
+        if key and self.render_cache.fetch(key, filename):
+            return time.perf_counter() - start
+        
+        if compositor == 'cairo':
+            slide = self.compose_slide_cairo(spec, swipe_hint=swipe_hint)
+        else:
+            slide = self.compose_slide(spec)
+            if swipe_hint:
+                slide = self.add_navigation_arrow(slide)
+        
+        slide.save(filename, quality=95, optimize=True)
+        if key:
+            self.render_cache.store(key, filename)
+        return time.perf_counter() - start
+    
+    def warm_static_layers(self, kinds=tuple(BASE_PLATE_LAYERS)):
+        """Render (and persist) every static sprite these slide kinds need, before workers start"""
+        for kind in kinds:
+            self.get_base_plate(kind)
+        if 'cta' in kinds:
+            for script, layer in self.slide_layers({'kind': 'cta'}):
+                if script == 'static':
+                    self.static_sprite(layer)
+        self.static_sprite(self.swipe_layer(), 'corner_label')
+    
+    def render_slides_parallel(self, jobs):
+        """
+        Render and encode slides concurrently, one process per core
+        
+        Workers are spawned (not forked - Pango/fontconfig may own threads) and each
+        builds its own renderer once. Slides found in the render cache are copied
+        first; static sprites are warmed for the rest so workers load them from
+        the sprite cache instead of re-shaping them.
+        
+        Args:
+            jobs: List of (spec, swipe_hint, filename)
         
-        # Add navigation arrows to all slides EXCEPT the last (CTA) slide
-        for i in range(len(slides) - 1):
-            slides[i] = self.add_navigation_arrow(slides[i])
-        print(f"✅ Added navigation arrows to {len(slides) - 1} slides")
+        Returns:
+            List of per-slide wall times in seconds, in job order
+        """
+        compositor = PARALLEL_RENDER['compositor']
+        
+        # Slides already in the render cache are copied here - only misses go to the pool
+        timings = [None] * len(jobs)
+        for i, (spec, swipe_hint, filename) in enumerate(jobs):
+            start = time.perf_counter()
+            key = self.render_cache_key(spec, swipe_hint, compositor)
+            if key and self.render_cache.fetch(key, filename):
+                timings[i] = time.perf_counter() - start
+        misses = [i for i, seconds in enumerate(timings) if seconds is None]
+        if not misses:
+            return timings
+        
+        self.warm_static_layers({jobs[i][0]['kind'] for i in misses})
+        
+        workers = min(len(misses), PARALLEL_RENDER['workers'] or os.cpu_count() or 1)
+        print(f"⚡ Rendering {len(misses)} slides on {workers} worker processes ({compositor} compositor)...")
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_render_worker,
+                                 initargs=(self.theme_name, self.render_cache.enabled,
+                                           run_grain_seed())) as pool:
+            futures = {
+                i: pool.submit(_render_slide_worker, *jobs[i], compositor)
+                for i in misses
+            }
+            # Collect in job order - carousel order never depends on finish order
+            for i, future in futures.items():
+                timings[i] = future.result()
+        return timings
+    
+    def generate_post(self, verse_data=None, render_mode=None, output_dir="output", seed=None):
+        """
+        Generate carousel post with dynamic overflow handling
+        
+        Args:
+            verse_data: Verse dict to render (default: next unposted verse)
+            render_mode: 'pil'      - base plate + one text sprite per layer, composited in PIL
+                         'cairo'    - every layer drawn on ONE Cairo surface, converted once
+                         'parallel' - all slides rendered + encoded concurrently (process pool)
+                         (default: RENDER_MODE from config)
+            output_dir: Directory for the slide PNGs
+            seed: Post seed (render_rng.post_seed) - default: from the verse key and
+                  the ledger's cycle for the next verse, cycle 1 for verse_data
+        
+        Returns:
+            List of saved slide filenames, in carousel order
+        """
+        render_mode = render_mode or RENDER_MODE
+        if render_mode not in ('pil', 'cairo', 'parallel'):
+            raise ValueError(f"Unknown render_mode '{render_mode}' (expected 'pil', 'cairo' or 'parallel')")
+        
+        if verse_data is None:
+            index, verse_data = self.get_next_verse()
+            self.save_posted_verse(index)
+            if seed is None:
+                seed = post_seed(verse_data['surah_number'], verse_data['ayah_number'], self.ledger.cycle)
+        
+        # Store verse info for caption generation
+        self.current_verse_info = verse_data
+        
+        print(f"\n📖 Generating post for Surah {verse_data['surah_number']}, Ayah {verse_data['ayah_number']}")
+        
+        specs = self.plan_slides(verse_data, seed)
         
-        # Save slides
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = "output"
         os.makedirs(output_dir, exist_ok=True)
         
-        filenames = []
-        for i, slide in enumerate(slides, 1):
-            filename = f"{output_dir}/quran_post_{timestamp}_slide{i}.png"
-            slide.save(filename, quality=95, optimize=True)
-            filenames.append(filename)
-            print(f"✅ Saved: {filename}")
+        # Navigation arrows on all slides EXCEPT the last (CTA) slide
+        jobs = [
+            (spec, i < len(specs) - 1, f"{output_dir}/quran_post_{timestamp}_slide{i + 1}.png")
+            for i, spec in enumerate(specs)
+        ]
+        
+        hits_before = self.render_cache.stats['hits']
+        start = time.perf_counter()
+        if render_mode == 'parallel':
+            timings = self.render_slides_parallel(jobs)
+        else:
+            timings = [
+                self.render_slide_to_file(spec, swipe_hint, filename, render_mode)
+                for spec, swipe_hint, filename in jobs
+            ]
+        wall_time = time.perf_counter() - start
+        
+        filenames = [filename for _, _, filename in jobs]
+        for (spec, _, filename), seconds in zip(jobs, timings):
+            print(f"✅ Saved: {filename} ({spec['kind']}, {seconds * 1000:.0f} ms)")
+        
+        print(f"⏱️  {len(filenames)} slides in {wall_time:.2f}s wall ({sum(timings):.2f}s summed, {render_mode} mode)")
+        reused = self.render_cache.stats['hits'] - hits_before
+        if reused:
+            print(f"🗂️  Render cache: {reused} of {len(filenames)} slides reused")
+        font_stats = font_cache_stats()
+        print(f"🔤 Font cache: {font_stats['hits']} hits / {font_stats['misses']} misses ({font_stats['size']} fonts)")
+        http_stats = pool_stats()['total']
+        if http_stats['requests']:
+            print(f"🌐 HTTP: {http_stats['requests']} requests over {http_stats['connections']} connections "
+                  f"({http_stats['reused']} reused)")
         
         return filenames
 
 
+# ===== PARALLEL RENDER WORKERS =====
+# One render-only generator per worker process, built once by the pool initializer
+
+_WORKER_GENERATOR = None
+
+
+def _init_render_worker(theme_name, use_cache=True, grain_seed=None):
+    """Process pool initializer: build this worker's renderer once (grain seeded like the parent's)"""
+    global _WORKER_GENERATOR, _RUN_GRAIN_SEED
+    _RUN_GRAIN_SEED = grain_seed
+    _WORKER_GENERATOR = QuranPostGeneratorCairo(theme_name, render_only=True, use_cache=use_cache)
+
+
+def _render_slide_worker(spec, swipe_hint, filename, compositor):
+    """Render + encode one slide in a worker process - returns wall time in seconds"""
+    return _WORKER_GENERATOR.render_slide_to_file(spec, swipe_hint, filename, compositor)
+
 def main():
     """Generate a post"""
-    generator = QuranPostGeneratorCairo(theme_name=DEFAULT_THEME)
+    parser = argparse.ArgumentParser(description="Generate the next verse's carousel")
+    parser.add_argument('--no-cache', action='store_true', help='Render every slide (skip the render cache)')
+    args = parser.parse_args()
+    
+    generator = QuranPostGeneratorCairo(theme_name=DEFAULT_THEME, use_cache=not args.no_cache)
     filenames = generator.generate_post()
     
     print(f"\n🎉 Successfully generated {len(filenames)} slides!")
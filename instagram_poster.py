@@ -120,38 +120,71 @@ class InstagramPoster:
             print(f"❌ Connection test failed: {e}")
             return False
     
-    def post_carousel(self, image_paths, caption):
-        """Post multiple images as carousel"""
+    @staticmethod
+    def prepare_carousel(image_paths):
+        """
+        Convert carousel slides to JPG (Instagram carousels only support JPG)
+        
+        Local work only - no login needed, so it can run before the upload is due.
+        
+        Args:
+            image_paths: Slide PNG paths, in carousel order
+        
+        Returns:
+            List of Paths to upload (temporary .jpg next to each .png), or None if a slide is missing
+        """
+        from pathlib import Path
+        from PIL import Image
+        
+        # Convert to Path objects for verification
+        paths = [Path(img) for img in image_paths]
+        
+        # Verify all files exist
+        for path in paths:
+            if not path.exists():
+                print(f"❌ Image not found: {path}")
+                return None
+        
+        jpg_paths = []
+        for path in paths:
+            if path.suffix.lower() == '.png':
+                jpg_path = path.with_suffix('.jpg')
+                # Convert PNG to JPG
+                img = Image.open(path)
+                # Convert RGBA to RGB (remove alpha channel)
+                if img.mode in ('RGBA', 'LA', 'P'):
+                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+                    rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+                    img = rgb_img
+                img.save(jpg_path, 'JPEG', quality=95)
+                jpg_paths.append(jpg_path)
+            else:
+                jpg_paths.append(path)
+        return jpg_paths
+    
+    def post_carousel(self, image_paths, caption, jpg_paths=None):
+        """
+        Post multiple images as carousel
+        
+        Args:
+            image_paths: Slide PNG paths, in carousel order
+            caption: Post caption
+            jpg_paths: Result of prepare_carousel(image_paths), if already converted
+        
+        Returns:
+            Media code (short URL slug) or None if failed
+        """
         try:
             from pathlib import Path
-            from PIL import Image
             
-            # Convert to Path objects for verification
             paths = [Path(img) for img in image_paths]
             
-            # Verify all files exist
-            for path in paths:
-                if not path.exists():
-                    print(f"❌ Image not found: {path}")
+            # Instagram carousels only support JPG format - convert PNG to JPG (unless prepared already)
+            if jpg_paths is None:
+                jpg_paths = self.prepare_carousel(image_paths)
+                if jpg_paths is None:
                     return None
             
-            # Instagram carousels only support JPG format - convert PNG to JPG
-            jpg_paths = []
-            for path in paths:
-                if path.suffix.lower() == '.png':
-                    jpg_path = path.with_suffix('.jpg')
-                    # Convert PNG to JPG
-                    img = Image.open(path)
-                    # Convert RGBA to RGB (remove alpha channel)
-                    if img.mode in ('RGBA', 'LA', 'P'):
-                        rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                        rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                        img = rgb_img
-                    img.save(jpg_path, 'JPEG', quality=95)
-                    jpg_paths.append(jpg_path)
-                else:
-                    jpg_paths.append(path)
-            
             print(f"📤 Uploading carousel with {len(jpg_paths)} slides...")
             
             # Upload as album/carousel
@@ -190,7 +223,98 @@ class InstagramPoster:
             
             return None
     
-    def share_to_story(self, image_path, post_url=None):
+    @staticmethod
+    def prepare_story_image(image_path):
+        """
+        Build the 1080x1920 story image ("New Post / Tap to view") from a carousel slide
+        
+        Local work only - no login needed, so it can run before the upload is due.
+        
+        Args:
+            image_path: Carousel slide to use as the story background
+        
+        Returns:
+            Path of the saved story image (str), or None if the slide is missing
+        """
+        from pathlib import Path
+        from PIL import Image, ImageDraw, ImageFont
+        
+        image_path = Path(image_path)
+        if not image_path.exists():
+            print(f"❌ Story image not found: {image_path}")
+            return None
+        
+        # Create proper story canvas (1080x1920 for Instagram stories)
+        # Load original carousel image (1080x1350)
+        carousel_img = Image.open(image_path)
+        
+        story_width = 1080
+        story_height = 1920
+        story_img = Image.new('RGB', (story_width, story_height), color=(0, 0, 0))
+        
+        # Center the carousel image vertically on story canvas
+        y_offset = (story_height - carousel_img.height) // 2
+        story_img.paste(carousel_img, (0, y_offset))
+        
+        # Add "Tap to view full post →" text at bottom with better styling
+        draw = ImageDraw.Draw(story_img)
+        
+        try:
+            # Try Montserrat first (professional, clean)
+            font_large = ImageFont.truetype("fonts/Montserrat-Bold.ttf", 100)  # EXTRA LARGE for visibility!
+            font_small = ImageFont.truetype("fonts/Montserrat-Regular.ttf", 75)  # EXTRA LARGE for visibility!
+        except:
+            try:
+                # Fallback to Helvetica
+                font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 100)
+                font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 75)
+            except:
+                # Last resort - system default but scaled up
+                font_large = ImageFont.load_default()
+                font_small = ImageFont.load_default()
+        
+        # Main text (removed emoji to avoid box characters)
+        main_text = "New Post"
+        sub_text = "Tap to view"
+        
+        # Get text dimensions
+        bbox_main = draw.textbbox((0, 0), main_text, font=font_large)
+        main_width = bbox_main[2] - bbox_main[0]
+        main_height = bbox_main[3] - bbox_main[1]
+        
+        bbox_sub = draw.textbbox((0, 0), sub_text, font=font_small)
+        sub_width = bbox_sub[2] - bbox_sub[0]
+        sub_height = bbox_sub[3] - bbox_sub[1]
+        
+        # Position at bottom with padding
+        main_x = (story_width - main_width) // 2
+        main_y = story_height - main_height - sub_height - 120
+        
+        sub_x = (story_width - sub_width) // 2
+        sub_y = main_y + main_height + 20
+        
+        # Draw text with outline for visibility
+        outline_color = (0, 0, 0)
+        text_color = (255, 255, 255)
+        
+        # Draw main text with outline
+        for adj_x in range(-3, 4):
+            for adj_y in range(-3, 4):
+                draw.text((main_x + adj_x, main_y + adj_y), main_text, font=font_large, fill=outline_color)
+        draw.text((main_x, main_y), main_text, font=font_large, fill=text_color)
+        
+        # Draw sub text with outline
+        for adj_x in range(-2, 3):
+            for adj_y in range(-2, 3):
+                draw.text((sub_x + adj_x, sub_y + adj_y), sub_text, font=font_small, fill=outline_color)
+        draw.text((sub_x, sub_y), sub_text, font=font_small, fill=(200, 200, 200))
+        
+        # Save story image
+        story_path = str(image_path).replace('.png', '_story.png')
+        story_img.save(story_path)
+        return story_path
+    
+    def share_to_story(self, image_path, post_url=None, story_path=None):
         """
         Share an image to Instagram Story
         Optionally add a link sticker to the feed post
@@ -198,87 +322,16 @@ class InstagramPoster:
         Args:
             image_path: Path to image for story background
             post_url: URL to feed post (adds link sticker if provided)
+            story_path: Result of prepare_story_image(image_path), if already built
         
         Returns:
             Story media pk or None if failed
         """
         try:
-            from pathlib import Path
-            from PIL import Image, ImageDraw, ImageFont
-            
-            image_path = Path(image_path)
-            if not image_path.exists():
-                print(f"❌ Story image not found: {image_path}")
-                return None
-            
-            # Create proper story canvas (1080x1920 for Instagram stories)
-            # Load original carousel image (1080x1350)
-            carousel_img = Image.open(image_path)
-            
-            story_width = 1080
-            story_height = 1920
-            story_img = Image.new('RGB', (story_width, story_height), color=(0, 0, 0))
-            
-            # Center the carousel image vertically on story canvas
-            y_offset = (story_height - carousel_img.height) // 2
-            story_img.paste(carousel_img, (0, y_offset))
-            
-            # Add "Tap to view full post →" text at bottom with better styling
-            draw = ImageDraw.Draw(story_img)
-            
-            try:
-                # Try Montserrat first (professional, clean)
-                font_large = ImageFont.truetype("fonts/Montserrat-Bold.ttf", 100)  # EXTRA LARGE for visibility!
-                font_small = ImageFont.truetype("fonts/Montserrat-Regular.ttf", 75)  # EXTRA LARGE for visibility!
-            except:
-                try:
-                    # Fallback to Helvetica
-                    font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 100)
-                    font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 75)
-                except:
-                    # Last resort - system default but scaled up
-                    font_large = ImageFont.load_default()
-                    font_small = ImageFont.load_default()
-            
-            # Main text (removed emoji to avoid box characters)
-            main_text = "New Post"
-            sub_text = "Tap to view"
-            
-            # Get text dimensions
-            bbox_main = draw.textbbox((0, 0), main_text, font=font_large)
-            main_width = bbox_main[2] - bbox_main[0]
-            main_height = bbox_main[3] - bbox_main[1]
-            
-            bbox_sub = draw.textbbox((0, 0), sub_text, font=font_small)
-            sub_width = bbox_sub[2] - bbox_sub[0]
-            sub_height = bbox_sub[3] - bbox_sub[1]
-            
-            # Position at bottom with padding
-            main_x = (story_width - main_width) // 2
-            main_y = story_height - main_height - sub_height - 120
-            
-            sub_x = (story_width - sub_width) // 2
-            sub_y = main_y + main_height + 20
-            
-            # Draw text with outline for visibility
-            outline_color = (0, 0, 0)
-            text_color = (255, 255, 255)
-            
-            # Draw main text with outline
-            for adj_x in range(-3, 4):
-                for adj_y in range(-3, 4):
-                    draw.text((main_x + adj_x, main_y + adj_y), main_text, font=font_large, fill=outline_color)
-            draw.text((main_x, main_y), main_text, font=font_large, fill=text_color)
-            
-            # Draw sub text with outline
-            for adj_x in range(-2, 3):
-                for adj_y in range(-2, 3):
-                    draw.text((sub_x + adj_x, sub_y + adj_y), sub_text, font=font_small, fill=outline_color)
-            draw.text((sub_x, sub_y), sub_text, font=font_small, fill=(200, 200, 200))
-            
-            # Save story image
-            story_path = str(image_path).replace('.png', '_story.png')
-            story_img.save(story_path)
+            if story_path is None:
+                story_path = self.prepare_story_image(image_path)
+                if story_path is None:
+                    return None
             
             print(f"📤 Uploading to story (1080x1920)...")
             
@@ -0,0 +1,138 @@
+"""
+JSON Cache - write-behind persistence for the dict caches (tafsir, legacy verses)
+✅ Inserts only mark the cache dirty - no full rewrite per fetched item
+✅ Dirty entries flushed together: after a short delay, every N inserts, and at exit
+✅ Atomic writes (temp file + fsync + os.replace) - a crash never leaves a torn file
+✅ One shared instance per file per process - fetchers can't overwrite each other
+"""
+
+import os
+import json
+import atexit
+import threading
+from config import CACHE_PERSISTENCE
+
+
+class WriteBehindCache:
+    """
+    Dict-like cache backed by a JSON file, persisted in batches
+
+    Reads and writes hit memory only. A background timer flushes the whole
+    file once `flush_interval` seconds after the first unsaved insert (or
+    immediately once `max_dirty` inserts are pending), and any remaining
+    entries are flushed at interpreter exit.
+    """
+
+    def __init__(self, cache_file, flush_interval=None, max_dirty=None, indent=None):
+        """
+        Args:
+            cache_file: JSON file ({"key": value}) to load from and persist to
+            flush_interval: Seconds to wait before writing unsaved entries
+            max_dirty: Unsaved inserts that trigger an immediate flush
+            indent: JSON indent for the file (None = compact)
+        """
+        self.cache_file = cache_file
+        self.flush_interval = CACHE_PERSISTENCE['flush_interval'] if flush_interval is None else flush_interval
+        self.max_dirty = max_dirty or CACHE_PERSISTENCE['max_dirty']
+        self.indent = CACHE_PERSISTENCE['indent'] if indent is None else indent
+
+        self.data = self._load()
+        self.dirty = 0
+        self.flushes = 0
+        self._lock = threading.RLock()
+        self._timer = None
+
+        atexit.register(self.flush)
+
+    def _load(self):
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not load {self.cache_file}: {e}")
+        return {}
+
+    # ===== DICT-STYLE ACCESS =====
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def items(self):
+        return self.data.items()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self.data[key] = value
+            self._mark_dirty()
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self.data[key]
+            self._mark_dirty()
+
+    # ===== PERSISTENCE =====
+
+    def _mark_dirty(self):
+        self.dirty += 1
+        if self.dirty >= self.max_dirty or self.flush_interval <= 0:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """
+        Write all unsaved entries now (no-op if nothing changed)
+
+        Returns:
+            True if the file is up to date afterwards
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.dirty:
+                return True
+
+            tmp_file = f"{self.cache_file}.tmp"
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, ensure_ascii=False, indent=self.indent)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.cache_file)
+            except OSError as e:
+                print(f"⚠️  Could not save {self.cache_file}: {e}")
+                return False
+
+            self.dirty = 0
+            self.flushes += 1
+            return True
+
+
+# Process-wide caches: absolute path -> WriteBehindCache
+_CACHES = {}
+
+
+def open_json_cache(cache_file):
+    """Get the shared write-behind cache for a JSON file (loaded on first use)"""
+    key = os.path.abspath(cache_file)
+    cache = _CACHES.get(key)
+    if cache is None:
+        cache = WriteBehindCache(cache_file)
+        _CACHES[key] = cache
+    return cache
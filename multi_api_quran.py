@@ -4,10 +4,15 @@ ROOT FIX: Never skips verses - tries multiple APIs until success
 """
 
 import requests
-import json
-import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, Optional, Tuple
+from config import API_SETTINGS
+import http_pool
+from provider_health import open_provider_health
+from surah_metadata import SURAHS, surah_fields
+from verse_store import open_verse_store
 
 
 class MultiAPIQuranFetcher:
@@ -17,11 +22,17 @@ class MultiAPIQuranFetcher:
     """
     
     def __init__(self):
-        self.cache_file = "quran_cache.json"
+        # Binary verse store (whole mushaf once quran_corpus.py has run), dict-style "surah:ayah" access
         self.cache = self._load_cache()
-        self.timeout = 30  # seconds
+        self.cache_file = self.cache.store_file
+        self.timeout = API_SETTINGS['request_timeout']  # seconds
+        self.mode = API_SETTINGS['mode']  # 'hedged' or 'sequential'
+        self._call_state = threading.local()  # Deadline of the hedged round this thread is serving
         
-        # Define all available APIs (in order of preference)
+        # Rolling success rate / latency + circuit breaker per API (persisted between runs)
+        self.health = open_provider_health()
+        
+        # Define all available APIs (default order of preference, re-ranked by health)
         self.apis = [
             {
                 "name": "Quran.com",
@@ -46,58 +57,16 @@ class MultiAPIQuranFetcher:
         # Surah names mapping (for APIs that don't provide names)
         self.surah_names = self._load_surah_names()
     
-    def _load_cache(self) -> dict:
-        """Load cached verses"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"⚠️  Cache load error: {e}")
-                return {}
-        return {}
+    def _load_cache(self):
+        """Open the verse store (migrates quran_cache.json on first use)"""
+        return open_verse_store()
     
     def _save_cache(self):
-        """Save verses to cache"""
-        try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"⚠️  Cache save error: {e}")
+        """Nothing to do - the verse store persists every verse as it is added"""
     
     def _load_surah_names(self) -> dict:
-        """Load surah names mapping"""
-        return {
-            1: "Al-Fatihah", 2: "Al-Baqarah", 3: "Ali 'Imran", 4: "An-Nisa",
-            5: "Al-Ma'idah", 6: "Al-An'am", 7: "Al-A'raf", 8: "Al-Anfal",
-            9: "At-Tawbah", 10: "Yunus", 11: "Hud", 12: "Yusuf",
-            13: "Ar-Ra'd", 14: "Ibrahim", 15: "Al-Hijr", 16: "An-Nahl",
-            17: "Al-Isra", 18: "Al-Kahf", 19: "Maryam", 20: "Ta-Ha",
-            21: "Al-Anbya", 22: "Al-Hajj", 23: "Al-Mu'minun", 24: "An-Nur",
-            25: "Al-Furqan", 26: "Ash-Shu'ara", 27: "An-Naml", 28: "Al-Qasas",
-            29: "Al-'Ankabut", 30: "Ar-Rum", 31: "Luqman", 32: "As-Sajdah",
-            33: "Al-Ahzab", 34: "Saba", 35: "Fatir", 36: "Ya-Sin",
-            37: "As-Saffat", 38: "Sad", 39: "Az-Zumar", 40: "Ghafir",
-            41: "Fussilat", 42: "Ash-Shuraa", 43: "Az-Zukhruf", 44: "Ad-Dukhan",
-            45: "Al-Jathiyah", 46: "Al-Ahqaf", 47: "Muhammad", 48: "Al-Fath",
-            49: "Al-Hujurat", 50: "Qaf", 51: "Adh-Dhariyat", 52: "At-Tur",
-            53: "An-Najm", 54: "Al-Qamar", 55: "Ar-Rahman", 56: "Al-Waqi'ah",
-            57: "Al-Hadid", 58: "Al-Mujadila", 59: "Al-Hashr", 60: "Al-Mumtahanah",
-            61: "As-Saf", 62: "Al-Jumu'ah", 63: "Al-Munafiqun", 64: "At-Taghabun",
-            65: "At-Talaq", 66: "At-Tahrim", 67: "Al-Mulk", 68: "Al-Qalam",
-            69: "Al-Haqqah", 70: "Al-Ma'arij", 71: "Nuh", 72: "Al-Jinn",
-            73: "Al-Muzzammil", 74: "Al-Muddaththir", 75: "Al-Qiyamah", 76: "Al-Insan",
-            77: "Al-Mursalat", 78: "An-Naba", 79: "An-Nazi'at", 80: "'Abasa",
-            81: "At-Takwir", 82: "Al-Infitar", 83: "Al-Mutaffifin", 84: "Al-Inshiqaq",
-            85: "Al-Buruj", 86: "At-Tariq", 87: "Al-A'la", 88: "Al-Ghashiyah",
-            89: "Al-Fajr", 90: "Al-Balad", 91: "Ash-Shams", 92: "Al-Layl",
-            93: "Ad-Duhaa", 94: "Ash-Sharh", 95: "At-Tin", 96: "Al-'Alaq",
-            97: "Al-Qadr", 98: "Al-Bayyinah", 99: "Az-Zalzalah", 100: "Al-'Adiyat",
-            101: "Al-Qari'ah", 102: "At-Takathur", 103: "Al-'Asr", 104: "Al-Humazah",
-            105: "Al-Fil", 106: "Quraysh", 107: "Al-Ma'un", 108: "Al-Kawthar",
-            109: "Al-Kafirun", 110: "An-Nasr", 111: "Al-Masad", 112: "Al-Ikhlas",
-            113: "Al-Falaq", 114: "An-Nas"
-        }
+        """Load surah names mapping (from the local surah metadata table)"""
+        return {surah.number: surah.name for surah in SURAHS}
     
     def get_verse(self, surah: int, ayah: int, max_cycles: int = 10) -> Optional[Dict]:
         """
@@ -113,28 +82,93 @@ class MultiAPIQuranFetcher:
         """
         cache_key = f"{surah}:{ayah}"
         
-        # Check cache first
+        # Check cache first (names always from the local surah table, whatever the provider said)
         if cache_key in self.cache:
             print(f"📦 Using cached verse {cache_key}")
-            return self.cache[cache_key]
+            return {**self.cache[cache_key], **surah_fields(surah)}
         
         print(f"\n🔍 Fetching verse {surah}:{ayah}...")
         
-        # Try each API with retries
+        if self.mode == 'hedged':
+            result = self._get_verse_hedged(surah, ayah, max_cycles)
+        else:
+            result = self._get_verse_sequential(surah, ayah, max_cycles)
+        
+        if result is None:
+            # All APIs exhausted all cycles
+            print(f"\n❌ CRITICAL: Could not fetch verse {surah}:{ayah} after {max_cycles} cycles")
+            print(f"   All APIs failed. Check network connection or API status.")
+            return None
+        
+        result.update(surah_fields(surah))
+        
+        # Cache successful result (appended to the verse store)
+        try:
+            self.cache.put(surah, ayah, result)
+        except OSError as e:
+            print(f"⚠️  Cache save error: {e}")
+        
+        return result
+    
+    @staticmethod
+    def _is_valid(result) -> bool:
+        """A provider response is usable only with both Arabic text and a real translation"""
+        return bool(
+            result and result.get('arabic') and result.get('translation')
+            and result['translation'] != 'Translation not available'
+        )
+    
+    def _ordered_apis(self):
+        """
+        Enabled APIs, fastest healthy first, tripped ones left out
+        
+        If every breaker is open, all enabled APIs are returned in their
+        default order - a verse is never given up without trying.
+        """
+        enabled = {api["name"]: api for api in self.apis if api["enabled"]}
+        ranked = self.health.rank(enabled)
+        
+        skipped = [name for name in enabled if name not in ranked]
+        if not ranked:
+            print(f"   ⚠️  Every API is tripped - trying them all anyway")
+            return list(enabled.values())
+        if skipped:
+            print(f"   ⏭️  Skipping tripped API(s): {', '.join(skipped)}")
+        return [enabled[name] for name in ranked]
+    
+    def _call_api(self, api_config, surah: int, ayah: int, deadline=None) -> Optional[Dict]:
+        """
+        Call one API and record the outcome + latency in the health tracker
+
+        Args:
+            deadline: time.perf_counter() value the call must finish by (hedged
+                      rounds) - its HTTP requests are cut short to fit (see _get)
+        """
+        self._call_state.deadline = deadline
+        self.health.begin(api_config["name"])  # Half-open: one trial at a time (TrialInFlight otherwise)
+        start = time.perf_counter()
+        try:
+            result = api_config["fetch_func"](surah, ayah)
+        except Exception:
+            self.health.record(api_config["name"], False, time.perf_counter() - start)
+            raise
+        self.health.record(api_config["name"], self._is_valid(result), time.perf_counter() - start)
+        return result
+    
+    def _get_verse_sequential(self, surah: int, ayah: int, max_cycles: int) -> Optional[Dict]:
+        """Try each API 3 times (with backoff) before moving to the next"""
         for cycle in range(max_cycles):
             if cycle > 0:
                 print(f"\n🔄 Starting cycle {cycle + 1}/{max_cycles} (trying all APIs again)...")
                 time.sleep(5)  # Wait before starting new cycle
             
-            for api_config in self.apis:
-                if not api_config["enabled"]:
-                    continue
-                
+            for api_config in self._ordered_apis():
                 api_name = api_config["name"]
-                fetch_func = api_config["fetch_func"]
                 
-                # Try this API 3 times before moving to next
+                # Try this API 3 times before moving to next (unless its breaker trips)
                 for attempt in range(3):
+                    if attempt > 0 and not self.health.allow(api_name):
+                        break
                     try:
                         if attempt > 0:
                             wait_time = 2 ** attempt  # Exponential backoff: 2s, 4s
@@ -143,15 +177,10 @@ class MultiAPIQuranFetcher:
                         
                         print(f"   🔄 Trying {api_name} (attempt {attempt + 1}/3)...")
                         
-                        result = fetch_func(surah, ayah)
+                        result = self._call_api(api_config, surah, ayah)
                         
-                        if result and result.get('arabic') and result.get('translation'):
+                        if self._is_valid(result):
                             print(f"   ✅ SUCCESS with {api_name}!")
-                            
-                            # Cache successful result
-                            self.cache[cache_key] = result
-                            self._save_cache()
-                            
                             return result
                         else:
                             print(f"   ⚠️  {api_name} returned incomplete data")
@@ -159,14 +188,107 @@ class MultiAPIQuranFetcher:
                     except Exception as e:
                         print(f"   ⚠️  {api_name} error (attempt {attempt + 1}): {str(e)[:50]}...")
                 
-                # API exhausted all retries, move to next API
-                print(f"   ❌ {api_name} failed after 3 attempts, trying next API...")
+                # API exhausted its retries (or tripped), move to next API
+                print(f"   ❌ {api_name} failed, trying next API...")
         
-        # All APIs exhausted all cycles
-        print(f"\n❌ CRITICAL: Could not fetch verse {surah}:{ayah} after {max_cycles} cycles")
-        print(f"   All APIs failed. Check network connection or API status.")
         return None
     
+    def _get_verse_hedged(self, surah: int, ayah: int, max_cycles: int) -> Optional[Dict]:
+        """Race the enabled APIs each cycle (see _hedged_round)"""
+        for cycle in range(max_cycles):
+            if cycle > 0:
+                print(f"\n🔄 Starting cycle {cycle + 1}/{max_cycles} (racing all APIs again)...")
+                time.sleep(API_SETTINGS['cycle_delay'])
+            
+            result = self._hedged_round(surah, ayah)
+            if result:
+                return result
+        
+        return None
+    
+    def _hedged_round(self, surah: int, ayah: int) -> Optional[Dict]:
+        """
+        One hedged round: start APIs in health order, hedge_delay apart
+        
+        The next API is started early as soon as one fails, and the first
+        valid response wins. Requests still running are abandoned (their
+        results are ignored), so the round never takes longer than the
+        deadline. Every request is capped at the time left before the
+        deadline and isn't retried, so abandoned threads finish by then
+        too and never hold up interpreter exit.
+        
+        Returns:
+            Verse dict, or None if every API failed or the deadline passed
+        """
+        apis = self._ordered_apis()
+        if not apis:
+            return None
+        
+        start = time.perf_counter()
+        deadline = start + API_SETTINGS['deadline']
+        pool = ThreadPoolExecutor(max_workers=len(apis), thread_name_prefix="hedge")
+        pending = {}
+        next_api = 0
+        next_start = start
+        
+        try:
+            while True:
+                now = time.perf_counter()
+                
+                # Start the next API when its hedge delay is up (or nothing is running)
+                if next_api < len(apis) and (now >= next_start or not pending):
+                    api_config = apis[next_api]
+                    print(f"   🔄 Starting {api_config['name']} (+{(now - start) * 1000:.0f} ms)...")
+                    future = pool.submit(self._call_api, api_config, surah, ayah, deadline)
+                    pending[future] = api_config["name"]
+                    next_api += 1
+                    next_start = now + API_SETTINGS['hedge_delay']
+                
+                if not pending:
+                    return None  # Every API answered and none was valid
+                
+                wake_at = min(deadline, next_start) if next_api < len(apis) else deadline
+                if now >= deadline:
+                    print(f"   ⏱️  Deadline ({API_SETTINGS['deadline']}s) reached, abandoning {len(pending)} request(s)")
+                    return None
+                
+                done, _ = wait(pending, timeout=max(0.0, wake_at - now), return_when=FIRST_COMPLETED)
+                for future in done:
+                    api_name = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"   ⚠️  {api_name} error: {str(e)[:50]}...")
+                        next_start = time.perf_counter()  # Hedge immediately
+                        continue
+                    
+                    if self._is_valid(result):
+                        print(f"   ✅ SUCCESS with {api_name} in {(time.perf_counter() - start) * 1000:.0f} ms!")
+                        return result
+                    print(f"   ⚠️  {api_name} returned incomplete data")
+                    next_start = time.perf_counter()
+        finally:
+            # Don't wait for slower providers - their threads finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _get(self, url, **kwargs):
+        """
+        GET through the shared pool, bounded by the current hedged round
+
+        Outside a hedged round this is a normal request (request_timeout,
+        transport retries). Inside one, the timeout is cut to the time left
+        before the deadline and retries are off - racing the other APIs is
+        the retry.
+        """
+        deadline = getattr(self._call_state, 'deadline', None)
+        if deadline is None:
+            return http_pool.get(url, timeout=self.timeout, **kwargs)
+
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise requests.Timeout(f"Hedged round deadline passed before {url}")
+        return http_pool.get(url, timeout=min(self.timeout, remaining), retry=False, **kwargs)
+    
     def _fetch_quran_com(self, surah: int, ayah: int) -> Optional[Dict]:
         """
         Fetch from Quran.com API v4
@@ -185,7 +307,7 @@ class MultiAPIQuranFetcher:
             'fields': 'text_uthmani'
         }
         
-        response = requests.get(url, params=params, timeout=self.timeout)
+        response = self._get(url, params=params)
         response.raise_for_status()
         data = response.json()
         
@@ -194,22 +316,17 @@ class MultiAPIQuranFetcher:
         # Fetch translation separately using AlQuran.cloud (more reliable for translations)
         # Quran.com v4 API translation endpoint structure changed, so use AlQuran.cloud for translations
         trans_url = f"https://api.alquran.cloud/v1/ayah/{surah}:{ayah}/en.sahih"
-        trans_response = requests.get(trans_url, timeout=self.timeout)
+        trans_response = self._get(trans_url)
         trans_response.raise_for_status()
         trans_data = trans_response.json()
         
         translation_text = trans_data['data']['text']
         
-        # Fetch surah info
-        chapter_url = f"https://api.quran.com/api/v4/chapters/{surah}"
-        chapter_response = requests.get(chapter_url, timeout=self.timeout)
-        chapter_data = chapter_response.json()
-        
+        # Surah names from the local metadata table (no chapter request)
         return {
             'arabic': arabic_text,
             'translation': translation_text,
-            'surah_name': chapter_data['chapter']['name_simple'],
-            'surah_name_arabic': chapter_data['chapter']['name_arabic'],
+            **surah_fields(surah),
             'surah_number': surah,
             'ayah_number': ayah,
             'source': 'Quran.com API (Arabic) + AlQuran.cloud (Translation)'
@@ -220,7 +337,7 @@ class MultiAPIQuranFetcher:
         # Fetch Arabic text (Quran Uthmani)
         arabic_url = f"https://api.alquran.cloud/v1/ayah/{surah}:{ayah}/quran-uthmani"
         
-        arabic_response = requests.get(arabic_url, timeout=self.timeout)
+        arabic_response = self._get(arabic_url)
         arabic_response.raise_for_status()
         arabic_data = arabic_response.json()
         
@@ -228,13 +345,11 @@ class MultiAPIQuranFetcher:
             raise Exception(f"API returned code {arabic_data['code']}")
         
         arabic_text = arabic_data['data']['text']
-        surah_name = arabic_data['data']['surah']['englishName']
-        surah_name_arabic = arabic_data['data']['surah']['name']
         
         # Fetch translation (Sahih International)
         trans_url = f"https://api.alquran.cloud/v1/ayah/{surah}:{ayah}/en.sahih"
         
-        trans_response = requests.get(trans_url, timeout=self.timeout)
+        trans_response = self._get(trans_url)
         trans_response.raise_for_status()
         trans_data = trans_response.json()
         
@@ -246,8 +361,7 @@ class MultiAPIQuranFetcher:
         return {
             'arabic': arabic_text,
             'translation': translation_text,
-            'surah_name': surah_name,
-            'surah_name_arabic': surah_name_arabic,
+            **surah_fields(surah),
             'surah_number': surah,
             'ayah_number': ayah,
             'source': 'AlQuran.cloud API'
@@ -257,7 +371,7 @@ class MultiAPIQuranFetcher:
         """Fetch from Quran-API.ir (Persian API with good Uthmani text)"""
         url = f"https://quranapi.ir/api/v2/ayat/{surah}:{ayah}"
         
-        response = requests.get(url, timeout=self.timeout)
+        response = self._get(url)
         response.raise_for_status()
         data = response.json()
         
@@ -269,8 +383,7 @@ class MultiAPIQuranFetcher:
         return {
             'arabic': ayah_data['text'],
             'translation': ayah_data.get('translation', {}).get('text', 'Translation not available'),
-            'surah_name': self.surah_names.get(surah, f"Surah {surah}"),
-            'surah_name_arabic': ayah_data.get('surah_name', ''),
+            **surah_fields(surah),
             'surah_number': surah,
             'ayah_number': ayah,
             'source': 'Quran-API.ir'
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Posting Ledger - which verses have been posted (replaces the posted_verses.json list)
+✅ One bit per ayah (780 bytes for all 6,236) instead of a growing index list
+✅ "Next unposted" cursor - next verse in O(1), no scan over the history
+✅ Cycle counter - starts over from 1:1 after the last ayah, keeps counting
+✅ Total post count stored directly (theme rotation reads one number)
+✅ Atomic updates (temp file + fsync + os.replace) - a crash never loses the ledger
+✅ One-shot migration from posted_verses.json
+
+Usage:
+    python posting_ledger.py              # Show progress
+    python posting_ledger.py --migrate    # Rebuild from posted_verses.json
+"""
+
+import os
+import json
+import base64
+import argparse
+from typing import Optional
+from config import POSTING_LEDGER
+from quran_data import TOTAL_VERSES
+from surah_metadata import verse_key
+
+
+LEDGER_VERSION = 1
+
+
+class PostingLedger:
+    """
+    Posted-verse bitset for the current cycle, plus cursor and counters
+
+    File (JSON, git tracked): {"version", "total", "cycle", "cursor",
+    "posted_count", "posted_in_cycle", "bits": base64 bitset}.
+    Bit i is set once global ayah index i has been posted (or skipped)
+    in the current cycle; `cursor` is the lowest index whose bit is clear.
+    """
+
+    def __init__(self, ledger_file=None, legacy_file=None, total=TOTAL_VERSES):
+        """
+        Args:
+            ledger_file: Ledger path (default: POSTING_LEDGER['file'])
+            legacy_file: Old posted_verses.json, imported if the ledger doesn't exist yet
+                         (default: POSTING_LEDGER['legacy_file'])
+            total: Number of verses in one cycle
+        """
+        self.ledger_file = ledger_file or POSTING_LEDGER['file']
+        self.legacy_file = legacy_file or POSTING_LEDGER['legacy_file']
+        self.total = total
+
+        self.bits = bytearray((total + 7) // 8)
+        self.cycle = 1
+        self.cursor = 0
+        self.posted_count = 0      # Posts ever made, across cycles (theme rotation)
+        self.posted_in_cycle = 0   # Bits set in the current cycle
+
+        if os.path.exists(self.ledger_file):
+            self._load()
+        elif os.path.exists(self.legacy_file):
+            migrated = self.migrate(self.legacy_file)
+            print(f"📦 Migrated {migrated} posted verses from {self.legacy_file} to {self.ledger_file}")
+
+    def _load(self):
+        with open(self.ledger_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') != LEDGER_VERSION or state.get('total') != self.total:
+            raise ValueError(f"{self.ledger_file} is not a v{LEDGER_VERSION} ledger for {self.total} verses")
+
+        self.bits = bytearray(base64.b64decode(state['bits']))
+        self.cycle = state['cycle']
+        self.cursor = state['cursor']
+        self.posted_count = state['posted_count']
+        self.posted_in_cycle = state['posted_in_cycle']
+
+    def save(self):
+        """Write the ledger atomically"""
+        state = {
+            'version': LEDGER_VERSION,
+            'total': self.total,
+            'cycle': self.cycle,
+            'cursor': self.cursor,
+            'posted_count': self.posted_count,
+            'posted_in_cycle': self.posted_in_cycle,
+            'bits': base64.b64encode(bytes(self.bits)).decode('ascii')
+        }
+        tmp_file = f"{self.ledger_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+            f.write('\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.ledger_file)
+
+    # ===== QUERIES =====
+
+    def is_posted(self, index: int) -> bool:
+        """True if the verse has been posted (or skipped) in the current cycle"""
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def next_index(self) -> Optional[int]:
+        """Lowest unposted verse index in this cycle (None once the cycle is complete)"""
+        return self.cursor if self.cursor < self.total else None
+
+    def peek(self, n: int):
+        """
+        The next n verse indices get_next_verse would post, in order
+
+        Continues into the next cycle (from 1:1) once this one runs out;
+        the ledger itself is not changed.
+        """
+        return [index for index, _ in self.upcoming(n)]
+
+    def upcoming(self, n: int):
+        """The next n posts as (verse index, cycle it is posted in) - see peek()"""
+        upcoming = []
+        index, cycle = self.cursor, self.cycle
+        while len(upcoming) < min(n, self.total):
+            if index >= self.total:
+                index, cycle = 0, cycle + 1
+            if cycle > self.cycle or not self.is_posted(index):
+                upcoming.append((index, cycle))
+            index += 1
+        return upcoming
+
+    # ===== UPDATES =====
+
+    def mark(self, index: int, post: bool = True):
+        """
+        Set a verse's bit and move the cursor past posted verses (not saved until save())
+
+        Args:
+            index: Global ayah index
+            post: Count it as a post (False = skipped because it couldn't be fetched)
+        """
+        if not self.is_posted(index):
+            self.bits[index >> 3] |= 1 << (index & 7)
+            self.posted_in_cycle += 1
+        if post:
+            self.posted_count += 1
+        while self.cursor < self.total and self.is_posted(self.cursor):
+            self.cursor += 1
+
+    def start_new_cycle(self):
+        """Clear the bitset and begin again from 1:1 (post count keeps growing)"""
+        self.bits = bytearray(len(self.bits))
+        self.cursor = 0
+        self.posted_in_cycle = 0
+        self.cycle += 1
+
+    def migrate(self, legacy_file) -> int:
+        """
+        Rebuild the ledger from a posted_verses.json index list and save it
+
+        Returns:
+            Number of verses imported
+        """
+        with open(legacy_file, 'r', encoding='utf-8') as f:
+            posted = json.load(f)
+
+        self.bits = bytearray(len(self.bits))
+        self.cursor = self.posted_in_cycle = self.posted_count = 0
+        for index in posted:
+            if 0 <= index < self.total:
+                self.mark(index)
+        self.posted_count = len(posted)  # Theme rotation continues where the list left off
+        self.save()
+        return self.posted_in_cycle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or rebuild the posting ledger")
+    parser.add_argument('--ledger', default=POSTING_LEDGER['file'],
+                        help=f"Ledger file (default: {POSTING_LEDGER['file']})")
+    parser.add_argument('--migrate', nargs='?', const=POSTING_LEDGER['legacy_file'], default=None,
+                        metavar='JSON', help=f"Rebuild from an index list (default: {POSTING_LEDGER['legacy_file']})")
+    args = parser.parse_args()
+
+    ledger = PostingLedger(args.ledger)
+    if args.migrate:
+        imported = ledger.migrate(args.migrate)
+        print(f"✅ Imported {imported} posted verses from {args.migrate}")
+
+    next_index = ledger.next_index()
+    next_verse = "cycle complete" if next_index is None else "%d:%d" % verse_key(next_index)
+    print(f"📊 Cycle {ledger.cycle}: {ledger.posted_in_cycle}/{ledger.total} verses, "
+          f"{ledger.posted_count} posts in total, next: {next_verse}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Provider Health - rolling success rate, latency and a circuit breaker per verse API
+✅ Last N outcomes per provider: success rate, p50/p95 latency
+✅ Breaker: closed → open (tripped, skipped) → half-open (one trial) → closed
+✅ Fastest healthy provider first - tripped ones cost nothing, not even a timeout
+✅ Persisted between runs (provider_health.json, written behind + atomically)
+
+Usage:
+    python provider_health.py            # Show the health table
+    python provider_health.py --reset    # Forget all outcomes and close every breaker
+"""
+
+import math
+import time
+import argparse
+import threading
+from typing import Dict, List, Optional
+from config import PROVIDER_HEALTH
+from json_cache import open_json_cache
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class TrialInFlight(Exception):
+    """A half-open provider already has its one trial request running"""
+
+
+def percentile(values, pct) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class ProviderHealth:
+    """
+    Health records for named providers, kept in a JSON file
+
+    Each record: {"state", "opened_at", "failures" (consecutive),
+    "outcomes": [[ok 0/1, latency ms], ...]} - the newest `window` outcomes.
+    An open breaker turns half-open once `cooldown` seconds have passed;
+    a single trial request is then let through (begin()), and its outcome
+    closes the breaker (success) or re-opens it (failure).
+    """
+
+    def __init__(self, health_file=None, clock=time.time):
+        """
+        Args:
+            health_file: JSON file to persist to (default: PROVIDER_HEALTH['file'])
+            clock: Wall-clock function (breaker cooldowns survive between runs)
+        """
+        self.health_file = health_file or PROVIDER_HEALTH['file']
+        self.records = open_json_cache(self.health_file)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._trials = set()  # Half-open providers with their trial request running (not persisted)
+
+    def _record(self, name) -> Dict:
+        return self.records.get(name) or {'state': CLOSED, 'opened_at': None, 'failures': 0, 'outcomes': []}
+
+    def _state(self, name) -> str:
+        """state() without the lock (caller holds it)"""
+        record = self._record(name)
+        if record['state'] == OPEN and self.clock() - record['opened_at'] >= PROVIDER_HEALTH['cooldown']:
+            record['state'] = HALF_OPEN
+            self.records[name] = record
+        return record['state']
+
+    def state(self, name) -> str:
+        """Breaker state, moving open → half-open once the cooldown is over"""
+        with self._lock:
+            return self._state(name)
+
+    def allow(self, name) -> bool:
+        """True unless the breaker is open or its half-open trial request is already running"""
+        with self._lock:
+            state = self._state(name)
+            return state == CLOSED or (state == HALF_OPEN and name not in self._trials)
+
+    def begin(self, name):
+        """
+        Claim a request to a provider (call right before sending it)
+
+        Half-open: only the first caller gets the trial; the claim is released
+        by the record() of its outcome. Closed - or open, when the caller is
+        trying tripped providers anyway - is always allowed.
+
+        Raises:
+            TrialInFlight: If the half-open trial is already taken
+        """
+        with self._lock:
+            if self._state(name) != HALF_OPEN:
+                return
+            if name in self._trials:
+                raise TrialInFlight(f"{name} is half-open and its trial request is already running")
+            self._trials.add(name)
+
+    def record(self, name, ok: bool, latency: float):
+        """
+        Add one request outcome and update the breaker
+
+        Args:
+            name: Provider name
+            ok: True if the provider returned usable data
+            latency: Seconds the request took
+        """
+        with self._lock:
+            self._trials.discard(name)
+            record = self._record(name)
+            record['outcomes'] = (record['outcomes'] + [[int(ok), round(latency * 1000)]])[-PROVIDER_HEALTH['window']:]
+
+            if ok:
+                record['failures'] = 0
+                if record['state'] != CLOSED:
+                    print(f"   🟢 {name} recovered - breaker closed")
+                record['state'], record['opened_at'] = CLOSED, None
+            else:
+                record['failures'] += 1
+                outcomes = record['outcomes']
+                success_rate = sum(o[0] for o in outcomes) / len(outcomes)
+                if (record['state'] == HALF_OPEN
+                        or record['failures'] >= PROVIDER_HEALTH['failure_threshold']
+                        or (len(outcomes) >= PROVIDER_HEALTH['min_samples']
+                            and success_rate < PROVIDER_HEALTH['min_success_rate'])):
+                    if record['state'] != OPEN:
+                        print(f"   🔴 {name} tripped - skipped for {PROVIDER_HEALTH['cooldown']}s")
+                    record['state'], record['opened_at'] = OPEN, self.clock()
+
+            self.records[name] = record
+
+    def stats(self, name) -> Dict:
+        """
+        Returns:
+            dict: 'state', 'samples', 'success_rate' (None if no samples),
+                  'p50' / 'p95' latency in ms of successful requests (None if none)
+        """
+        with self._lock:
+            state = self._state(name)
+            outcomes = list(self._record(name)['outcomes'])
+        latencies = [latency for ok, latency in outcomes if ok]
+        return {
+            'state': state,
+            'samples': len(outcomes),
+            'success_rate': sum(o[0] for o in outcomes) / len(outcomes) if outcomes else None,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95)
+        }
+
+    def rank(self, names) -> List[str]:
+        """
+        Providers to try, best first, without the tripped ones
+
+        Closed before half-open, then by expected cost: p50 latency divided by
+        success rate. Providers with no history sort first, in the given order.
+        """
+        def cost(name):
+            stats = self.stats(name)
+            if stats['p50'] is None:
+                return (stats['state'] != CLOSED, 0.0)
+            return (stats['state'] != CLOSED, stats['p50'] / max(stats['success_rate'], 0.05))
+
+        return sorted((name for name in names if self.allow(name)), key=cost)
+
+    def reset(self):
+        """Forget every provider's outcomes and close all breakers"""
+        with self._lock:
+            for name in list(self.records):
+                del self.records[name]
+            self._trials.clear()
+
+    def flush(self):
+        """Write pending changes now (otherwise written behind and at exit)"""
+        return self.records.flush()
+
+
+# Process-wide health trackers: file -> ProviderHealth
+_TRACKERS = {}
+
+
+def open_provider_health(health_file=None) -> ProviderHealth:
+    """Shared ProviderHealth for a file (every fetcher in the process sees the same breakers)"""
+    health_file = health_file or PROVIDER_HEALTH['file']
+    tracker = _TRACKERS.get(health_file)
+    if tracker is None:
+        tracker = ProviderHealth(health_file)
+        _TRACKERS[health_file] = tracker
+    return tracker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show verse provider health")
+    parser.add_argument('--file', default=PROVIDER_HEALTH['file'],
+                        help=f"Health file (default: {PROVIDER_HEALTH['file']})")
+    parser.add_argument('--reset', action='store_true', help='Forget all outcomes, close every breaker')
+    args = parser.parse_args()
+
+    health = ProviderHealth(args.file)
+    if args.reset:
+        health.reset()
+        health.flush()
+        print(f"✅ Reset {args.file}")
+        return
+
+    if not len(health.records):
+        print(f"📊 No provider history in {args.file} yet")
+        return
+
+    print(f"{'Provider':<16} {'State':<10} {'Success':>8} {'p50 ms':>8} {'p95 ms':>8} {'Samples':>8}")
+    for name in health.records:
+        stats = health.stats(name)
+        rate = f"{stats['success_rate']:.0%}" if stats['success_rate'] is not None else '-'
+        p50 = stats['p50'] if stats['p50'] is not None else '-'
+        p95 = stats['p95'] if stats['p95'] is not None else '-'
+        print(f"{name:<16} {stats['state']:<10} {rate:>8} {p50:>8} {p95:>8} {stats['samples']:>8}")
+    health.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,9 @@ Uses quran.com API v4 for accurate Uthmani script with full tashkeel
 """
 
 import requests
-import json
-import os
+from json_cache import open_json_cache
+import http_pool
+from surah_metadata import get_surah, surah_fields
 
 
 class QuranAPI:
@@ -17,22 +18,13 @@ class QuranAPI:
         self.cache = self.load_cache()
     
     def load_cache(self):
-        """Load cached verses to avoid repeated API calls"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        """Load cached verses to avoid repeated API calls (shared, write-behind)"""
+        return open_json_cache(self.cache_file)
     
     def save_cache(self):
-        """Save cache to file"""
-        try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"⚠️  Could not save cache: {e}")
+        """Write unsaved verses now (otherwise flushed in batches and at exit)"""
+        if not self.cache.flush():
+            print(f"⚠️  Could not save cache")
     
     def get_verse(self, surah, ayah):
         """
@@ -71,7 +63,7 @@ class QuranAPI:
                     'fields': 'text_uthmani',  # Get Uthmani script
                 }
                 
-                arabic_response = requests.get(arabic_url, params=arabic_params, timeout=timeout)
+                arabic_response = http_pool.get(arabic_url, params=arabic_params, timeout=timeout)
                 arabic_response.raise_for_status()
                 arabic_data = arabic_response.json()
                 
@@ -84,7 +76,7 @@ class QuranAPI:
                 trans_url = f"{self.base_url}/quran/translations/20"
                 trans_params = {'verse_key': verse_key}
                 
-                trans_response = requests.get(trans_url, params=trans_params, timeout=timeout)
+                trans_response = http_pool.get(trans_url, params=trans_params, timeout=timeout)
                 trans_response.raise_for_status()
                 trans_data = trans_response.json()
                 
@@ -98,27 +90,19 @@ class QuranAPI:
                     translation_text = re.sub(r'<[^>]+>', '', translation_text)  # Remove any other HTML tags
                     translation_text = translation_text.strip()
                 
-                # Get chapter (surah) info
-                chapter_url = f"{self.base_url}/chapters/{surah}"
-                chapter_response = requests.get(chapter_url, timeout=timeout)
-                chapter_data = chapter_response.json()
-                chapter_info = chapter_data['chapter']
-                
                 # Extract data
                 verse_data = {
                     'arabic': arabic_text,  # FULL Uthmani script with all harakat
                     'translation': translation_text,
-                    'surah_name': chapter_info['name_simple'],
-                    'surah_name_arabic': chapter_info['name_arabic'],
+                    **surah_fields(surah),  # Local surah table - no chapter request
                     'surah_number': surah,
                     'ayah_number': ayah,
                     'edition_arabic': 'Uthmani Tajweed (Quran.com)',
                     'edition_translation': 'Sahih International'
                 }
                 
-                # Cache it
+                # Cache it (persisted write-behind)
                 self.cache[cache_key] = verse_data
-                self.save_cache()
                 
                 print(f"✅ Fetched verse {cache_key}: {verse_data['surah_name']} {verse_data['ayah_number']}")
                 print(f"   Arabic preview: {arabic_text[:50]}...")
@@ -157,24 +141,21 @@ class QuranAPI:
         return None
     
     def get_surah_info(self, surah_number):
-        """Get information about a surah"""
+        """Get information about a surah (from the local surah metadata table)"""
         try:
-            url = f"{QURAN_API_BASE}/surah/{surah_number}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            return {
-                'number': data['data']['number'],
-                'name': data['data']['name'],
-                'english_name': data['data']['englishName'],
-                'english_translation': data['data']['englishNameTranslation'],
-                'revelation_type': data['data']['revelationType'],
-                'number_of_ayahs': data['data']['numberOfAyahs']
-            }
-        except Exception as e:
-            print(f"⚠️  Could not fetch surah info: {e}")
+            surah = get_surah(surah_number)
+        except ValueError as e:
+            print(f"⚠️  Could not get surah info: {e}")
             return None
+        
+        return {
+            'number': surah.number,
+            'name': surah.name_arabic,
+            'english_name': surah.name,
+            'english_translation': surah.translation,
+            'revelation_type': surah.revelation,
+            'number_of_ayahs': surah.ayahs
+        }
 
 
 # Test function
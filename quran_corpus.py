@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Quran Corpus - the whole mushaf (Arabic + translation) in the local verse store
+✅ Built in one shot from bulk endpoints (2 requests for all 6,236 verses)
+✅ Falls back to one request per surah if the full-mushaf download fails
+✅ Offline build from saved API responses (--fixture) for testing
+✅ Validated against QURAN_STRUCTURE before anything is written
+✅ Written into the verse store (O(1) lookup, no network at post time)
+
+Usage:
+    python quran_corpus.py                      # Download and fill quran_store.bin
+    python quran_corpus.py --if-missing         # Only download if verses are missing from the store
+    python quran_corpus.py --fixture fixtures/  # Build from quran-uthmani.json + en.sahih.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import unicodedata
+import requests
+import http_pool
+from config import QURAN_CORPUS, VERSE_STORE
+from quran_data import QURAN_STRUCTURE, TOTAL_VERSES
+from surah_metadata import surah_fields
+from verse_store import open_verse_store, VerseStoreError
+
+
+ALQURAN_CLOUD = "https://api.alquran.cloud/v1"
+CORPUS_SOURCE = "Local corpus (AlQuran.cloud)"
+
+# The Uthmani edition prefixes ayah 1 of every surah with the Basmala; only in
+# Al-Fatihah is it part of the verse (and At-Tawbah has none)
+BASMALA = "بِسْمِ ٱللَّهِ ٱلرَّحْمَٰنِ ٱلرَّحِيمِ"  # Exactly as the edition sends 1:1 (minus its BOM)
+BASMALA_VERSE_SURAHS = (1, 9)
+
+
+class CorpusError(Exception):
+    """Downloaded/fixture data doesn't match the expected mushaf structure"""
+
+
+# ===== BUILDING =====
+
+def _check_response(payload, what):
+    """Unwrap an AlQuran.cloud response envelope"""
+    if payload.get('code') != 200 or 'data' not in payload:
+        raise CorpusError(f"{what}: API returned code {payload.get('code')}")
+    return payload['data']
+
+
+def fetch_edition(edition, timeout=120):
+    """
+    Download one whole edition (all 114 surahs) in a single request
+
+    Args:
+        edition: AlQuran.cloud edition identifier (e.g. 'quran-uthmani', 'en.sahih')
+        timeout: Request timeout in seconds (the full mushaf is a few MB)
+
+    Returns:
+        list of surah dicts, each with 'number', 'englishName', 'name', 'ayahs'
+    """
+    response = http_pool.get(f"{ALQURAN_CLOUD}/quran/{edition}", timeout=timeout)
+    response.raise_for_status()
+    return _check_response(response.json(), edition)['surahs']
+
+
+def fetch_surah(surah, editions, timeout=30):
+    """
+    Download one surah in several editions with a single request
+
+    Returns:
+        dict: edition identifier -> surah dict (same shape as fetch_edition items)
+    """
+    response = http_pool.get(f"{ALQURAN_CLOUD}/surah/{surah}/editions/{','.join(editions)}",
+                            timeout=timeout)
+    response.raise_for_status()
+    data = _check_response(response.json(), f"surah {surah}")
+    return {item['edition']['identifier']: item for item in data}
+
+
+def fetch_editions_by_surah(editions, retries=3):
+    """
+    Fallback: download every surah separately (114 requests instead of 2)
+
+    Returns:
+        dict: edition identifier -> list of surah dicts
+    """
+    result = {edition: [] for edition in editions}
+
+    for surah, _ in QURAN_STRUCTURE:
+        for attempt in range(retries):
+            try:
+                by_edition = fetch_surah(surah, editions)
+                break
+            except (requests.RequestException, CorpusError, ValueError) as e:
+                if attempt == retries - 1:
+                    raise
+                wait_time = 2 ** (attempt + 1)
+                print(f"   ⚠️  Surah {surah} failed ({str(e)[:50]}), retrying in {wait_time}s...")
+                time.sleep(wait_time)
+
+        for edition in editions:
+            result[edition].append(by_edition[edition])
+        print(f"   ✅ Surah {surah}/114", end='\r')
+
+    print()
+    return result
+
+
+def load_fixture(fixture_dir, editions):
+    """
+    Load editions from saved /v1/quran/<edition> responses (offline build)
+
+    Each file is <fixture_dir>/<edition>.json, either the full API envelope
+    or just its 'data' object.
+    """
+    result = {}
+    for edition in editions:
+        path = os.path.join(fixture_dir, f"{edition}.json")
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        data = _check_response(payload, path) if 'code' in payload else payload
+        result[edition] = data['surahs']
+    return result
+
+
+def _is_mark(char):
+    """Harakat, sukun, shadda, small alef... (combining marks)"""
+    return unicodedata.category(char) == 'Mn'
+
+
+_BASMALA_LETTERS = ''.join(char for char in BASMALA if not _is_mark(char))
+
+
+def strip_basmala(text, surah, ayah):
+    """
+    Remove the Basmala the API prepends to ayah 1 (kept for 1:1, which it is)
+
+    Compared on letters only, so sukun forms (U+0652 / U+06E1) and the
+    order of stacked marks (shadda + fatha) don't stop a match.
+    """
+    text = text.lstrip('\ufeff')
+    if ayah != 1 or surah in BASMALA_VERSE_SURAHS:
+        return text
+
+    matched = 0
+    for i, char in enumerate(text):
+        if _is_mark(char):
+            continue
+        if matched == len(_BASMALA_LETTERS):
+            return text[i:].lstrip() if char.isspace() else text
+        if char != _BASMALA_LETTERS[matched]:
+            return text
+        matched += 1
+    return text  # Nothing after the Basmala - leave the ayah as it is
+
+
+def build_corpus(arabic_surahs, translation_surahs):
+    """
+    Merge and validate two editions into the compact corpus structure
+
+    Args:
+        arabic_surahs: Surah dicts of the Arabic edition
+        translation_surahs: Surah dicts of the translation edition
+
+    Returns:
+        dict: {'surahs': [[name, name_arabic, ayah_count], ...],
+               'verses': [[arabic, translation], ...]}  (verses in mushaf order,
+               Basmala stripped from ayah 1 except in Al-Fatihah)
+
+    Raises:
+        CorpusError: If a surah or ayah is missing, extra or out of order
+    """
+    if len(arabic_surahs) != len(QURAN_STRUCTURE) or len(translation_surahs) != len(QURAN_STRUCTURE):
+        raise CorpusError(f"Expected {len(QURAN_STRUCTURE)} surahs, got "
+                          f"{len(arabic_surahs)} Arabic / {len(translation_surahs)} translation")
+
+    surahs = []
+    verses = []
+    for (surah, total_ayahs), arabic, translation in zip(QURAN_STRUCTURE, arabic_surahs, translation_surahs):
+        if arabic['number'] != surah or translation['number'] != surah:
+            raise CorpusError(f"Surah {surah} out of order")
+        if len(arabic['ayahs']) != total_ayahs or len(translation['ayahs']) != total_ayahs:
+            raise CorpusError(f"Surah {surah}: expected {total_ayahs} ayahs, got "
+                              f"{len(arabic['ayahs'])} Arabic / {len(translation['ayahs'])} translation")
+
+        surahs.append([arabic['englishName'], arabic['name'], total_ayahs])
+        for ayah, (arabic_ayah, translation_ayah) in enumerate(zip(arabic['ayahs'], translation['ayahs']), 1):
+            if arabic_ayah['numberInSurah'] != ayah or translation_ayah['numberInSurah'] != ayah:
+                raise CorpusError(f"Verse {surah}:{ayah} out of order")
+            arabic_text = strip_basmala(arabic_ayah['text'], surah, ayah)
+            if not arabic_text.strip() or not translation_ayah['text'].strip():
+                raise CorpusError(f"Verse {surah}:{ayah} has empty text")
+            verses.append([arabic_text, translation_ayah['text']])
+
+    assert len(verses) == TOTAL_VERSES
+    return {'surahs': surahs, 'verses': verses}
+
+
+def store_corpus(corpus, store, overwrite=False):
+    """
+    Write a built corpus into the verse store
+
+    Args:
+        corpus: Compact corpus dict (see build_corpus)
+        store: VerseStore to fill
+        overwrite: Replace verses already in the store (default keeps them,
+                   e.g. Quran.com text cached by earlier posts)
+
+    Returns:
+        Number of verses written
+    """
+    batch = []
+    index = 0
+    for surah, (_, _, total_ayahs) in enumerate(corpus['surahs'], 1):
+        for ayah in range(1, total_ayahs + 1):
+            if overwrite or not store.has_index(index):
+                arabic, translation = corpus['verses'][index]
+                batch.append((surah, ayah, {
+                    'arabic': arabic,
+                    'translation': translation,
+                    **surah_fields(surah),  # Same names as every other source
+                    'surah_number': surah,
+                    'ayah_number': ayah,
+                    'source': CORPUS_SOURCE
+                }))
+            index += 1
+
+    store.put_many(batch)
+    return len(batch)
+
+
+def download_corpus(arabic_edition, translation_edition, fixture_dir=None):
+    """
+    Get both editions: fixture, else full-mushaf bulk download, else per-surah
+
+    Returns:
+        Compact corpus dict (see build_corpus)
+    """
+    editions = [arabic_edition, translation_edition]
+
+    if fixture_dir:
+        print(f"📂 Loading fixture editions from {fixture_dir}")
+        data = load_fixture(fixture_dir, editions)
+    else:
+        try:
+            print(f"🌐 Downloading full mushaf ({' + '.join(editions)})...")
+            data = {edition: fetch_edition(edition) for edition in editions}
+        except (requests.RequestException, CorpusError, ValueError, KeyError) as e:
+            print(f"⚠️  Bulk download failed ({str(e)[:60]}), falling back to one request per surah")
+            data = fetch_editions_by_surah(editions)
+
+    return build_corpus(data[arabic_edition], data[translation_edition])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download the whole Quran into the local verse store")
+    parser.add_argument('--store', default=VERSE_STORE['file'],
+                        help=f"Verse store file (default: {VERSE_STORE['file']})")
+    parser.add_argument('--fixture', default=None,
+                        help='Directory with saved <edition>.json responses (offline build)')
+    parser.add_argument('--if-missing', action='store_true',
+                        help='Do nothing if the store already holds every verse')
+    parser.add_argument('--overwrite', action='store_true', help='Replace verses already in the store')
+    args = parser.parse_args()
+
+    try:
+        store = open_verse_store(args.store)
+    except VerseStoreError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.if_missing and store.count() == TOTAL_VERSES:
+        print(f"📦 All {TOTAL_VERSES} verses already in {args.store}")
+        return
+
+    start = time.perf_counter()
+    try:
+        corpus = download_corpus(QURAN_CORPUS['arabic_edition'], QURAN_CORPUS['translation_edition'],
+                                 fixture_dir=args.fixture)
+    except (requests.RequestException, CorpusError, OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not build corpus: {e}")
+        sys.exit(1)
+
+    with store:
+        written = store_corpus(corpus, store, overwrite=args.overwrite)
+    size_kb = os.path.getsize(args.store) / 1024
+    print(f"✅ {written} of {len(corpus['verses'])} verses written → "
+          f"{args.store} ({size_kb:.0f} KB, {time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
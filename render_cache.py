@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Render Cache - finished slide PNGs, content-addressed by everything that drew them
+✅ Key = hash of the slide's layers (verse text, tafsir, example...), theme, kind,
+   swipe hint, compositor and a fingerprint of the render config, renderer code
+   and bundled font files
+✅ Hit = the encoded PNG copied out, no render and no encode
+✅ Size-bounded on disk: least recently used slides evicted first
+✅ Atomic writes (temp file + os.replace) - concurrent workers never see torn PNGs
+
+Usage:
+    python render_cache.py            # Show cache size
+    python render_cache.py --clear    # Delete every cached slide
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import argparse
+import config
+from config import RENDER_CACHE
+
+
+# Bump when slide rendering changes in a way neither the config nor the hashed sources capture
+RENDER_CACHE_VERSION = 1
+
+# Settings that change how a slide looks
+FINGERPRINT_SETTINGS = (
+    'IMAGE_WIDTH', 'IMAGE_HEIGHT', 'THEMES', 'CAIRO_FONTS', 'CAIRO_LAYOUT', 'HEADING_TEXTS',
+    'PATTERN_SETTINGS', 'ENABLE_HIGHLIGHTING', 'HIGHLIGHT_MAX_WORDS',
+    'USE_ACCENT_COLOR_FOR_HIGHLIGHTS', 'USE_CURLY_QUOTES', 'BOLD_QUOTE_MARKS',
+    'WATERMARK', 'WATERMARK_OPACITY'
+)
+
+# Renderer sources - editing one invalidates every cached slide
+FINGERPRINT_SOURCES = ('generate_post_cairo.py', 'cairo_renderer.py', 'background_engine.py', 'sprite_cache.py')
+
+# Bundled fonts (setup_fonts.sh installs them for Pango)
+FONTS_DIR = 'fonts'
+FONT_EXTENSIONS = ('.ttf', '.otf')
+
+_FINGERPRINT = None
+
+
+def _squash(name):
+    return ''.join(char for char in name.lower() if char.isalnum())
+
+
+def font_files(fonts_dir=None, families=None):
+    """
+    Bundled font files of the families the slides use
+
+    Args:
+        fonts_dir: Directory searched recursively (default: FONTS_DIR next to this file)
+        families: Font family names (default: every family in CAIRO_FONTS)
+
+    Returns:
+        Sorted paths whose file name starts with a family name ("Product Sans"
+        → ProductSans-Bold.ttf). Families not bundled (system fonts) match nothing.
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    fonts_dir = fonts_dir or os.path.join(base_dir, FONTS_DIR)
+    if families is None:
+        families = {font['family'] for font in config.CAIRO_FONTS.values()}
+    prefixes = tuple(_squash(family) for family in families)
+
+    paths = []
+    for root, _, names in os.walk(fonts_dir):
+        for name in names:
+            if name.lower().endswith(FONT_EXTENSIONS) and _squash(name).startswith(prefixes):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def config_fingerprint() -> str:
+    """Hash of the render settings, renderer sources and font files (computed once per process)"""
+    global _FINGERPRINT
+    if _FINGERPRINT is None:
+        digest = hashlib.sha256()
+        settings = {name: getattr(config, name, None) for name in FINGERPRINT_SETTINGS}
+        digest.update(json.dumps({'version': RENDER_CACHE_VERSION, 'settings': settings},
+                                 sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in FINGERPRINT_SOURCES:
+            try:
+                with open(os.path.join(base_dir, name), 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(name.encode('utf-8'))
+
+        for path in font_files():
+            digest.update(os.path.relpath(path, base_dir).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _FINGERPRINT = digest.hexdigest()
+    return _FINGERPRINT
+
+
+class RenderCache:
+    """Directory of slide PNGs named by content hash, trimmed to a byte budget (LRU)"""
+
+    def __init__(self, cache_dir=None, max_bytes=None, enabled=None):
+        """
+        Args:
+            cache_dir: Directory for <key>.png files (default: RENDER_CACHE['dir'])
+            max_bytes: Size budget (default: RENDER_CACHE['max_mb'] MB)
+            enabled: False = every lookup misses and nothing is stored (default: RENDER_CACHE['enabled'])
+        """
+        self.cache_dir = cache_dir or RENDER_CACHE['dir']
+        self.max_bytes = max_bytes if max_bytes is not None else RENDER_CACHE['max_mb'] * 1024 * 1024
+        self.enabled = RENDER_CACHE['enabled'] if enabled is None else enabled
+        self.size = None  # Bytes on disk, scanned on the first store
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+
+    @staticmethod
+    def make_key(theme_name, kind, layers, swipe_hint, compositor):
+        """
+        Stable key for one slide
+
+        Args:
+            theme_name: Theme the slide is drawn in
+            kind: Slide kind (selects the base plate)
+            layers: Body text layers from slide_layers() - the slide's content
+            swipe_hint: Whether the "Swipe →" hint is drawn
+            compositor: 'pil' or 'cairo'
+        """
+        payload = json.dumps(
+            {'config': config_fingerprint(), 'theme': theme_name, 'kind': kind, 'layers': layers,
+             'swipe_hint': bool(swipe_hint), 'compositor': compositor},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def fetch(self, key, filename) -> bool:
+        """
+        Copy a cached slide to filename
+
+        Returns:
+            True on a hit (the slide is marked most recently used), False on a miss
+        """
+        if not self.enabled:
+            return False
+
+        path = self._path(key)
+        try:
+            shutil.copyfile(path, filename)
+            os.utime(path)  # mtime = last use, for LRU eviction
+        except OSError:
+            self.stats['misses'] += 1
+            return False
+
+        self.stats['hits'] += 1
+        return True
+
+    def store(self, key, filename):
+        """Add a freshly encoded slide, then evict old slides if over budget"""
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        tmp_file = f"{path}.tmp-{os.getpid()}"
+        try:
+            replaced = os.path.getsize(path)  # Same key stored again (e.g. another worker's copy)
+        except OSError:
+            replaced = 0
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            shutil.copyfile(filename, tmp_file)
+            os.replace(tmp_file, path)
+        except OSError as e:
+            print(f"⚠️  Could not cache slide {key[:8]}: {e}")
+            return
+
+        self.stats['stored'] += 1
+        if self.size is None:
+            self.size = self.disk_usage()
+        else:
+            self.size += os.path.getsize(path) - replaced
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """[(mtime, size, path)] of cached slides"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.png'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue  # Evicted by another process meanwhile
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def disk_usage(self) -> int:
+        """Bytes of cached slides on disk"""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes=None) -> int:
+        """
+        Delete least recently used slides until the cache fits the budget
+
+        Args:
+            max_bytes: Budget to trim to (default: self.max_bytes; 0 = clear)
+
+        Returns:
+            Number of slides deleted
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+
+        evicted = 0
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+            evicted += 1
+
+        self.size = total
+        self.stats['evicted'] += evicted
+        return evicted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or clear the rendered slide cache")
+    parser.add_argument('--dir', default=RENDER_CACHE['dir'], help=f"Cache directory (default: {RENDER_CACHE['dir']})")
+    parser.add_argument('--clear', action='store_true', help='Delete every cached slide')
+    args = parser.parse_args()
+
+    cache = RenderCache(args.dir)
+    if args.clear:
+        print(f"🧹 Deleted {cache.evict(0)} cached slides from {args.dir}")
+
+    entries = cache._entries()
+    print(f"📊 {len(entries)} slides cached in {args.dir}, "
+          f"{sum(size for _, size, _ in entries) / (1024 * 1024):.1f}/{RENDER_CACHE['max_mb']} MB")
+
+
+if __name__ == "__main__":
+    main()
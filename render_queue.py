@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Render Queue - the next N carousels pre-rendered, so a scheduled post only uploads
+✅ Same verse order as get_next_verse (read from the posting ledger, never written by refills)
+✅ Each entry: slides + verse data + caption, published atomically
+✅ Post time: dequeue = copy slides into output/ and mark the verse posted
+✅ Entries the ledger has moved past are dropped on the next refill
+✅ Queue miss (empty, stale or unfetchable verse) → create_post renders inline as before
+
+Usage:
+    python render_queue.py --refill              # Top the queue up to RENDER_QUEUE['depth']
+    python render_queue.py --refill --depth 10
+    python render_queue.py                       # Show what's queued
+"""
+
+import os
+import json
+import time
+import shutil
+import argparse
+from datetime import datetime
+from typing import Dict, Optional
+from config import (RENDER_QUEUE, RENDER_MODE, PARALLEL_RENDER, DEFAULT_THEME,
+                    ROTATION_THEMES, THEMES)
+from quran_data import get_all_verses
+from posting_ledger import PostingLedger
+from render_rng import post_seed
+from batch_render import MANIFEST_FILE, clean_partial_dirs
+
+
+class RenderQueue:
+    """
+    Spool directory of ready-to-post carousels, keyed by global ayah index
+
+    <spool>/<index>/manifest.json holds the verse data, caption, theme and
+    slide file names; the slides sit next to it.
+    """
+
+    def __init__(self, spool_dir=None, ledger_file=None):
+        """
+        Args:
+            spool_dir: Queue directory (default: RENDER_QUEUE['dir'])
+            ledger_file: Posting ledger that decides the order (default: POSTING_LEDGER['file'])
+        """
+        self.spool_dir = spool_dir or RENDER_QUEUE['dir']
+        self.ledger_file = ledger_file
+
+    def _entry_dir(self, index):
+        return os.path.join(self.spool_dir, f"{index:04d}")
+
+    def _manifest(self, index) -> Optional[Dict]:
+        """Manifest of a published entry (None if not queued)"""
+        try:
+            with open(os.path.join(self._entry_dir(index), MANIFEST_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def queued(self):
+        """Indices of published entries, in ayah order"""
+        if not os.path.isdir(self.spool_dir):
+            return []
+        return sorted(int(name) for name in os.listdir(self.spool_dir)
+                      if name.isdigit() and self._manifest(int(name)) is not None)
+
+    # ===== REFILL (off the posting path) =====
+
+    def refill(self, depth=None, theme=DEFAULT_THEME, caption_func=None, compositor=None,
+               use_cache=True) -> int:
+        """
+        Render the next `depth` carousels that aren't queued yet
+
+        Args:
+            depth: Carousels to keep ready (default: RENDER_QUEUE['depth'])
+            theme: Theme name, or 'rotate' = ROTATION_THEMES continued from the ledger's post count
+            caption_func: caption_func(verse_data) -> caption stored with the entry (None = at post time)
+            compositor: 'pil' or 'cairo' (default: RENDER_MODE, or PARALLEL_RENDER's compositor)
+            use_cache: Reuse finished slides from the render cache (False = render every slide)
+
+        Returns:
+            Number of carousels rendered
+        """
+        depth = depth or RENDER_QUEUE['depth']
+        compositor = compositor or (RENDER_MODE if RENDER_MODE in ('pil', 'cairo') else PARALLEL_RENDER['compositor'])
+        ledger = PostingLedger(self.ledger_file)
+        cycles = dict(ledger.upcoming(depth))
+        upcoming = list(cycles)
+
+        os.makedirs(self.spool_dir, exist_ok=True)
+        clean_partial_dirs(self.spool_dir)
+        for index in self.queued():
+            if index not in upcoming:
+                shutil.rmtree(self._entry_dir(index), ignore_errors=True)  # Already posted
+
+        missing = [(offset, index) for offset, index in enumerate(upcoming)
+                   if self._manifest(index) is None]
+        print(f"📚 Render queue: {len(upcoming) - len(missing)}/{len(upcoming)} ready, "
+              f"{len(missing)} to render")
+        if not missing:
+            return 0
+
+        from generate_post_cairo import QuranPostGeneratorCairo
+
+        # Verse data fetched together (verse + tafsir pipeline), then rendered one by one
+        verses_meta = get_all_verses()
+        fetcher = QuranPostGeneratorCairo(DEFAULT_THEME)
+        verses = fetcher.fetch_many_verse_data([verses_meta[index] for _, index in missing])
+
+        generators = {}
+        rendered = 0
+        for (offset, index), verse_data in zip(missing, verses):
+            if not verse_data:
+                print(f"⚠️  Could not fetch verse #{index + 1}, left for the posting run")
+                continue
+
+            theme_name = theme
+            if theme == 'rotate':
+                theme_name = ROTATION_THEMES[(ledger.posted_count + offset) % len(ROTATION_THEMES)]
+            generator = generators.get(theme_name)
+            if generator is None:
+                generator = QuranPostGeneratorCairo(theme_name, render_only=True, use_cache=use_cache)
+                generators[theme_name] = generator
+
+            start = time.perf_counter()
+            seed = post_seed(verse_data['surah_number'], verse_data['ayah_number'], cycles[index])
+            self._publish(index, verse_data, theme_name, generator, compositor,
+                          caption_func(verse_data) if caption_func else None, seed)
+            rendered += 1
+            print(f"✅ Queued {verse_data['surah_number']}:{verse_data['ayah_number']} "
+                  f"({theme_name}, {time.perf_counter() - start:.1f}s)")
+
+        return rendered
+
+    def _publish(self, index, verse_data, theme_name, generator, compositor, caption, seed):
+        """Render into a private .tmp- directory, then rename it into the queue"""
+        tmp_dir = os.path.join(self.spool_dir, f".tmp-{index:04d}-{os.getpid()}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        specs = generator.plan_slides(verse_data, seed)
+        slides = []
+        for i, spec in enumerate(specs, 1):
+            filename = f"slide{i}.png"
+            # Navigation arrows on all slides EXCEPT the last (CTA) slide
+            generator.render_slide_to_file(spec, i < len(specs), os.path.join(tmp_dir, filename), compositor)
+            slides.append(filename)
+
+        manifest = {
+            'index': index,
+            'theme': theme_name,
+            'caption': caption,
+            'seed': seed,
+            'slides': slides,
+            'rendered_at': datetime.now().isoformat(timespec='seconds'),
+            'verse_data': verse_data
+        }
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        final_dir = self._entry_dir(index)
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(tmp_dir, final_dir)
+
+    # ===== DEQUEUE (the posting path) =====
+
+    def dequeue(self, output_dir="output") -> Optional[Dict]:
+        """
+        Take the carousel for the ledger's next verse, if it is ready
+
+        Copies its slides into output_dir (named like generate_post's files),
+        marks the verse posted in the ledger and removes the entry.
+
+        Returns:
+            {'index', 'verse_data', 'caption', 'theme', 'slides': [paths]}, or None on a queue miss
+        """
+        ledger = PostingLedger(self.ledger_file)
+        if ledger.next_index() is None:
+            print("🎉 All 6,236 verses posted! Starting over from beginning...")
+            ledger.start_new_cycle()
+        index = ledger.next_index()
+
+        manifest = self._manifest(index)
+        if manifest is None:
+            return None
+
+        entry_dir = self._entry_dir(index)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(output_dir, exist_ok=True)
+        slide_paths = []
+        for i, name in enumerate(manifest['slides'], 1):
+            path = f"{output_dir}/quran_post_{timestamp}_slide{i}.png"
+            shutil.copyfile(os.path.join(entry_dir, name), path)
+            slide_paths.append(path)
+
+        ledger.mark(index)
+        ledger.save()
+        shutil.rmtree(entry_dir, ignore_errors=True)
+
+        return {
+            'index': index,
+            'verse_data': manifest['verse_data'],
+            'caption': manifest['caption'],
+            'theme': manifest['theme'],
+            'slides': slide_paths
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render the next carousels to post")
+    parser.add_argument('--dir', default=RENDER_QUEUE['dir'], help=f"Queue directory (default: {RENDER_QUEUE['dir']})")
+    parser.add_argument('--refill', action='store_true', help='Render carousels missing from the queue')
+    parser.add_argument('--depth', type=int, default=RENDER_QUEUE['depth'],
+                        help=f"Carousels to keep ready (default: {RENDER_QUEUE['depth']})")
+    parser.add_argument('--theme', default=DEFAULT_THEME,
+                        help=f"Theme name ({', '.join(THEMES)}) or 'rotate'")
+    parser.add_argument('--no-cache', action='store_true', help='Render every slide (skip the render cache)')
+    args = parser.parse_args()
+
+    if args.theme != 'rotate' and args.theme not in THEMES:
+        parser.error(f"Unknown theme '{args.theme}'")
+
+    queue = RenderQueue(args.dir)
+    if args.refill:
+        from create_post import generate_dynamic_caption
+        start = time.perf_counter()
+        rendered = queue.refill(args.depth, theme=args.theme, caption_func=generate_dynamic_caption,
+                                use_cache=not args.no_cache)
+        print(f"🎉 Rendered {rendered} carousel(s) in {time.perf_counter() - start:.1f}s")
+
+    verses = get_all_verses()
+    keys = [f"{verses[index]['surah']}:{verses[index]['ayah']}" for index in queue.queued()]
+    print(f"📊 {len(keys)} carousel(s) queued: {', '.join(keys) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
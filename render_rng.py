@@ -0,0 +1,55 @@
+"""
+Render RNG - every random choice in a post, derived from one per-post seed
+✅ Seed = hash of verse key + posting cycle (same verse, same cycle → same post)
+✅ Each decision gets its own generator, derived from (seed, purpose, content) -
+   independent of slide order, render mode and which process renders it
+✅ random.Random for choices/samples, numpy Generator for array noise
+✅ Byte-reproducible slides → the render cache can reuse them
+"""
+
+import random
+import hashlib
+import numpy as np
+
+
+def derive_seed(*parts) -> int:
+    """Stable 64-bit seed from any values (not Python's per-process hash())"""
+    payload = '\x1f'.join(str(part) for part in parts)
+    return int.from_bytes(hashlib.sha256(payload.encode('utf-8')).digest()[:8], 'big')
+
+
+def post_seed(surah, ayah, cycle=1) -> int:
+    """
+    Seed for one post
+
+    Args:
+        surah: Surah number
+        ayah: Ayah number
+        cycle: Posting cycle (posting_ledger) - a verse looks different each time round
+    """
+    return derive_seed('post', surah, ayah, cycle)
+
+
+class PostRNG:
+    """Source of the random decisions for one post"""
+
+    def __init__(self, seed):
+        """
+        Args:
+            seed: Post seed from post_seed() (any int works)
+        """
+        self.seed = seed
+
+    def random(self, *context) -> random.Random:
+        """
+        Generator for one decision
+
+        Args:
+            context: What is being decided, e.g. ('highlight', text) - the
+                     same context always draws the same values
+        """
+        return random.Random(derive_seed(self.seed, *context))
+
+    def numpy(self, *context) -> np.random.Generator:
+        """NumPy generator for one decision (args as random())"""
+        return np.random.default_rng(derive_seed(self.seed, *context))
@@ -0,0 +1,128 @@
+"""
+Sprite Cache - pre-rasterized static text layers
+✅ Headings, watermark, attribution, CTA and "Swipe →" shaped ONCE, not per slide
+✅ Keyed by the full layer spec (text, font, size, colour, alignment, position)
+✅ Persisted as PNG + offsets so the next scheduled run skips shaping too
+✅ Atomic writes (temp file + os.replace) - a killed run never leaves a torn index
+"""
+
+import os
+import json
+import hashlib
+import cairocffi as cairo
+from cairo_renderer import TextSprite
+
+
+# Bump when sprite rendering changes in a way the layer spec doesn't capture
+SPRITE_CACHE_VERSION = 1
+
+
+class SpriteCache:
+    """In-memory + on-disk cache of TextSprites for text that never changes between posts"""
+
+    def __init__(self, cache_dir="sprite_cache", persist=True):
+        """
+        Args:
+            cache_dir: Directory for sprite PNGs and index.json
+            persist: If False, cache in memory only (nothing read from / written to disk)
+        """
+        self.cache_dir = cache_dir
+        self.persist = persist
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.sprites = {}  # key -> TextSprite (or None for text with no ink)
+        self.index = self.load_index() if persist else {}  # key -> {'x': int, 'y': int}
+        self.stats = {'memory': 0, 'disk': 0, 'rendered': 0}
+
+    @staticmethod
+    def make_key(kind, layer, width, height):
+        """
+        Stable key for a sprite
+
+        Args:
+            kind: Which renderer call produces it (e.g. 'english', 'corner_label')
+            layer: Renderer kwargs (text, font, size, colour, alignment, ...)
+            width: Canvas width the sprite is positioned on
+            height: Canvas height the sprite is positioned on
+        """
+        payload = json.dumps(
+            {'version': SPRITE_CACHE_VERSION, 'kind': kind, 'canvas': [width, height], 'layer': layer},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def load_index(self):
+        """Load sprite offsets from disk"""
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return {}
+        return {}
+
+    def save_index(self):
+        """Write sprite offsets atomically"""
+        tmp_file = f"{self.index_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            print(f"⚠️  Could not save sprite cache index: {e}")
+
+    def get(self, key, render):
+        """
+        Get a sprite, rendering it only if neither memory nor disk has it
+
+        Args:
+            key: Key from make_key()
+            render: Zero-argument callable returning a TextSprite (or None)
+
+        Returns:
+            TextSprite or None
+        """
+        if key in self.sprites:
+            self.stats['memory'] += 1
+            return self.sprites[key]
+
+        sprite = self._load(key)
+        if sprite is not None:
+            self.stats['disk'] += 1
+        else:
+            sprite = render()
+            self.stats['rendered'] += 1
+            self._store(key, sprite)
+
+        self.sprites[key] = sprite
+        return sprite
+
+    def _load(self, key):
+        """Read a persisted sprite (None if missing or unreadable)"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+
+        try:
+            surface = cairo.ImageSurface.create_from_png(os.path.join(self.cache_dir, f"{key}.png"))
+        except (OSError, cairo.CairoError):
+            return None
+
+        return TextSprite(surface, entry['x'], entry['y'])
+
+    def _store(self, key, sprite):
+        """Persist a freshly rendered sprite"""
+        if not self.persist or sprite is None:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            png_file = os.path.join(self.cache_dir, f"{key}.png")
+            tmp_file = f"{png_file}.tmp"
+            sprite.surface.write_to_png(tmp_file)
+            os.replace(tmp_file, png_file)
+        except (OSError, cairo.CairoError) as e:
+            print(f"⚠️  Could not save sprite {key[:8]}: {e}")
+            return
+
+        self.index[key] = {'x': sprite.x, 'y': sprite.y}
+        self.save_index()
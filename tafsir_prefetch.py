@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tafsir Prefetch - download tafsir for a verse range into the compressed tafsir store
+✅ Bounded parallelism - at most N documents in flight (pooled keep-alive sessions)
+✅ Keeps ONLY the configured author from each multi-author document
+✅ Resumable: ayahs already in the store are skipped, failures retried next run
+✅ Records written in batches (one fsync pair per batch, not per ayah)
+
+Usage:
+    python tafsir_prefetch.py                         # Whole Quran
+    python tafsir_prefetch.py --from 2:1 --to 2:286   # One range
+    python tafsir_prefetch.py --limit 500             # At most 500 downloads this run
+    python tafsir_prefetch.py --import-cache          # Import tafsir_cache.json first
+    python tafsir_prefetch.py --stats                 # How many ayahs are stored
+"""
+
+import os
+import sys
+import time
+import argparse
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import http_pool
+from config import TAFSIR_SETTINGS
+from auto_tafsir_fetcher import TAFSIR_API, extract_tafsir
+from quran_data import TOTAL_VERSES, verse_index
+from surah_metadata import verse_key
+from tafsir_store import TafsirStore
+from verse_store import VerseStoreError, parse_key
+
+
+def download_tafsir(surah, ayah, author=None, timeout=15):
+    """
+    Download one ayah's tafsir document and keep only one author
+
+    Returns:
+        Tafsir text, or '' if the author has none for this ayah
+
+    Raises:
+        requests.RequestException / ValueError on network or parse errors
+    """
+    response = http_pool.get(f"{TAFSIR_API}/tafsir/{surah}_{ayah}.json", timeout=timeout)
+    if response.status_code == 404:
+        return ''  # No document for this ayah
+    response.raise_for_status()
+    return extract_tafsir(response.json(), author) or ''
+
+
+def prefetch(store, indices, workers=None, limit=None, force=False, fetch=download_tafsir):
+    """
+    Fill the store for the given ayahs with a bounded worker pool
+
+    Args:
+        store: TafsirStore
+        indices: Iterable of global ayah indices (see quran_data.verse_index)
+        workers: Downloads in flight at once (default TAFSIR_SETTINGS['workers'])
+        limit: Max downloads this run (None = no limit)
+        force: Re-download ayahs that are already stored
+        fetch: fetch(surah, ayah) -> text ('' = none); exceptions count as failures
+
+    Returns:
+        dict: 'stored', 'empty', 'failed', 'skipped' counts
+    """
+    workers = workers or TAFSIR_SETTINGS['workers']
+    batch_size = TAFSIR_SETTINGS['batch_size']
+    stats = {'stored': 0, 'empty': 0, 'failed': 0, 'skipped': 0}
+
+    todo = []
+    for index in indices:
+        if not force and store.has_index(index):
+            stats['skipped'] += 1
+        else:
+            todo.append(index)
+    todo = iter(todo[:limit] if limit is not None else todo)
+
+    batch = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        while True:
+            # Keep the pool busy without queueing the whole range at once
+            for index in islice(todo, workers * 2 - len(pending)):
+                surah, ayah = verse_key(index)
+                pending[pool.submit(fetch, surah, ayah)] = (surah, ayah)
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                surah, ayah = pending.pop(future)
+                try:
+                    text = future.result()
+                except Exception as e:
+                    stats['failed'] += 1
+                    print(f"⚠️  {surah}:{ayah}: {type(e).__name__}: {e}")
+                    continue
+                batch.append((surah, ayah, text))
+                stats['stored' if text else 'empty'] += 1
+
+            if len(batch) >= batch_size:
+                store.put_many(batch)
+                batch = []
+                print(f"📚 {stats['stored'] + stats['empty']} ayahs stored "
+                      f"({stats['failed']} failed)")
+
+    store.put_many(batch)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch tafsir into the compressed tafsir store")
+    parser.add_argument('--store', default=TAFSIR_SETTINGS['store'],
+                        help=f"Tafsir store file (default: {TAFSIR_SETTINGS['store']})")
+    parser.add_argument('--from', dest='start', default='1:1', help='First ayah (surah:ayah)')
+    parser.add_argument('--to', dest='end', default='114:6', help='Last ayah (surah:ayah)')
+    parser.add_argument('--workers', type=int, default=TAFSIR_SETTINGS['workers'],
+                        help=f"Downloads in flight (default: {TAFSIR_SETTINGS['workers']})")
+    parser.add_argument('--limit', type=int, default=None, help='Max downloads this run')
+    parser.add_argument('--force', action='store_true', help='Re-download ayahs already stored')
+    parser.add_argument('--import-cache', nargs='?', const='tafsir_cache.json', default=None,
+                        metavar='JSON', help='Import a JSON tafsir cache first (default: tafsir_cache.json)')
+    parser.add_argument('--stats', action='store_true', help='Only show store statistics')
+    args = parser.parse_args()
+
+    try:
+        first, last = verse_index(*parse_key(args.start)), verse_index(*parse_key(args.end))
+    except ValueError as e:
+        print(f"❌ Invalid range: {e}")
+        sys.exit(1)
+
+    try:
+        store = TafsirStore(args.store)
+    except VerseStoreError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    with store:
+        if args.import_cache and os.path.exists(args.import_cache):
+            imported = store.import_json(args.import_cache)
+            print(f"📦 Imported {imported} tafsir entries from {args.import_cache}")
+
+        if not args.stats:
+            start = time.perf_counter()
+            stats = prefetch(store, range(first, last + 1), workers=args.workers,
+                             limit=args.limit, force=args.force)
+            print(f"✅ {stats['stored']} stored, {stats['empty']} without tafsir, "
+                  f"{stats['failed']} failed, {stats['skipped']} already stored "
+                  f"({time.perf_counter() - start:.1f}s)")
+
+        print(f"📊 {store.store_file}: {store.count()}/{TOTAL_VERSES} ayahs, "
+              f"{os.path.getsize(store.store_file) // 1024} KB")
+
+
+if __name__ == "__main__":
+    main()
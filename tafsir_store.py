@@ -0,0 +1,46 @@
+"""
+Tafsir Store - compressed per-ayah tafsir corpus (same layout as the verse store)
+✅ One record per ayah, zlib-compressed - the whole corpus stays a few MB
+✅ Fixed offset index - a lookup reads and inflates ONE record, never the whole file
+✅ Remembers ayahs that have no tafsir for the author (no refetching them)
+✅ Imports the old tafsir_cache.json
+
+Filled in bulk by tafsir_prefetch.py; read by AutoTafsirFetcher.
+"""
+
+import zlib
+from typing import Optional
+from config import TAFSIR_SETTINGS
+from verse_store import VerseStore
+
+
+TAFSIR_MAGIC = b'NFQTAFSR'
+
+
+class TafsirStore(VerseStore):
+    """
+    Tafsir text keyed by global ayah index
+
+    Values are plain strings. An empty string means "fetched, but the
+    author has no tafsir for this ayah" - distinct from a missing slot (None).
+    """
+
+    MAGIC = TAFSIR_MAGIC
+    KIND = 'tafsir'
+
+    def __init__(self, store_file=None):
+        """
+        Args:
+            store_file: Path of the store (default: TAFSIR_SETTINGS['store'])
+        """
+        super().__init__(store_file or TAFSIR_SETTINGS['store'])
+
+    def _encode(self, text) -> bytes:
+        return zlib.compress((text or '').encode('utf-8'), 9)
+
+    def _decode(self, payload: bytes) -> str:
+        return zlib.decompress(payload).decode('utf-8')
+
+    def get(self, surah: int, ayah: int) -> Optional[str]:
+        """Tafsir text for surah:ayah ('' = known to have none, None = not stored)"""
+        return super().get(surah, ayah)
@@ -0,0 +1,129 @@
+"""
+Test Background Engine
+Checks the NumPy gradient against the old per-row loop and grain reproducibility
+"""
+
+import sys
+import numpy as np
+from PIL import Image, ImageDraw
+from background_engine import (
+    hex_to_rgb, get_gradient_background, GrainTextureBank
+)
+from config import THEMES
+
+
+def test_gradient_matches_line_loop():
+    """Test 1: Broadcast gradient is pixel-identical to the ImageDraw.line loop"""
+    print("\n" + "="*70)
+    print("TEST 1: Gradient matches legacy per-row drawing")
+    print("="*70)
+
+    width, height = 120, 150
+    for theme_name, theme in THEMES.items():
+        legacy = Image.new('RGB', (width, height))
+        draw = ImageDraw.Draw(legacy)
+        color1 = hex_to_rgb(theme['bg_colors'][0])
+        color2 = hex_to_rgb(theme['bg_colors'][1])
+        for y in range(height):
+            factor = y / height
+            fill = tuple(int(color1[i] * (1 - factor) + color2[i] * factor) for i in range(3))
+            draw.line([(0, y), (width, y)], fill=fill)
+
+        fast = get_gradient_background(theme['bg_colors'], width, height)
+        assert np.array_equal(np.asarray(legacy), np.asarray(fast)), theme_name
+        print(f"   ✅ {theme_name}")
+
+
+def test_gradient_cache_returns_copies():
+    """Test 2: Cached gradient can be drawn on without corrupting the cache"""
+    print("\n" + "="*70)
+    print("TEST 2: Gradient cache hands out copies")
+    print("="*70)
+
+    colors = THEMES['teal_gold']['bg_colors']
+    first = get_gradient_background(colors, 64, 64)
+    first.paste((255, 0, 0), (0, 0, 64, 64))
+    second = get_gradient_background(colors, 64, 64)
+
+    assert second.getpixel((0, 0)) == hex_to_rgb(colors[0])
+    print("   ✅ Cache unaffected by caller edits")
+
+
+def test_grain_seed_is_reproducible():
+    """Test 3: Same seed gives byte-identical grain, different seeds differ"""
+    print("\n" + "="*70)
+    print("TEST 3: Seeded grain is reproducible")
+    print("="*70)
+
+    base = get_gradient_background(THEMES['sage_cream']['bg_colors'], 300, 200)
+
+    first = GrainTextureBank(noise=40, tiles=2, tile_size=64, seed=7).apply(base, 0.3)
+    second = GrainTextureBank(noise=40, tiles=2, tile_size=64, seed=7).apply(base, 0.3)
+    other = GrainTextureBank(noise=40, tiles=2, tile_size=64, seed=8).apply(base, 0.3)
+
+    assert first.size == base.size and first.mode == 'RGB'
+    assert np.array_equal(np.asarray(first), np.asarray(second))
+    assert not np.array_equal(np.asarray(first), np.asarray(other))
+    print("   ✅ Seed 7 twice → identical, seed 8 → different")
+
+
+def test_grain_blend_strength():
+    """Test 4: Integer blend keeps the mean and scales spread with intensity"""
+    print("\n" + "="*70)
+    print("TEST 4: Grain blend strength")
+    print("="*70)
+
+    base = Image.new('RGB', (256, 256), (128, 128, 128))
+    bank = GrainTextureBank(noise=40, tiles=2, tile_size=64, seed=1)
+
+    untouched = np.asarray(bank.apply(base, 0.0))
+    grained = np.asarray(bank.apply(base, 0.3)).astype(float)
+
+    assert np.array_equal(untouched, np.asarray(base))
+    assert abs(grained.mean() - 128) < 2
+    assert 8 < grained.std() < 16  # ~0.3 * 40
+    print(f"   ✅ mean={grained.mean():.1f}, std={grained.std():.1f}")
+
+
+def test_grain_frame_wraps_tile():
+    """Test 5: Wrapped frame equals the tile repeated over the frame, then offset"""
+    print("\n" + "="*70)
+    print("TEST 5: Grain frame wraps the uint8 tile")
+    print("="*70)
+
+    bank = GrainTextureBank(noise=40, tiles=2, tile_size=64, seed=3)
+    width, height, dy, dx = 150, 100, 17, 60
+    tiled = np.tile(bank.tiles[1], (height // 64 + 2, width // 64 + 2, 1))
+    expected = tiled[dy:dy + height, dx:dx + width]
+
+    frame = bank.grain_frame(1, dy, dx, width, height)
+    assert frame.dtype == np.uint8 and np.array_equal(frame, expected)
+    assert not hasattr(bank, '_plates')  # No full-frame plates kept per bank
+    print(f"   ✅ {width}x{height} frame from a 64px tile at offset ({dy}, {dx})")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_gradient_matches_line_loop,
+        test_gradient_cache_returns_copies,
+        test_grain_seed_is_reproducible,
+        test_grain_blend_strength,
+        test_grain_frame_wraps_tile,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,151 @@
+"""
+Test Batch Renderer
+Resume behaviour: partial directories cleaned, finished verses skipped, --force re-renders
+(a stand-in generator writes the slides; workers run as threads in this process - no Cairo)
+"""
+
+import os
+import sys
+import types
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import batch_render
+from batch_render import MANIFEST_FILE, clean_partial_dirs, is_done, verse_dir
+
+
+class StubGenerator:
+    """Stands in for QuranPostGeneratorCairo: two slides per verse, bytes tagged with a run number"""
+
+    run = 0
+    rendered = []
+
+    def __init__(self, theme_name=None, render_only=False, use_cache=True):
+        self.theme_name = theme_name
+
+    def fetch_many_verse_data(self, metas):
+        return [{'surah_number': m['surah'], 'ayah_number': m['ayah'], 'surah_name': 'Al-Fatihah'}
+                for m in metas]
+
+    def warm_static_layers(self):
+        pass
+
+    def plan_slides(self, verse_data):
+        StubGenerator.rendered.append((verse_data['surah_number'], verse_data['ayah_number']))
+        return [{'kind': 'arabic'}, {'kind': 'cta'}]
+
+    def render_slide_to_file(self, spec, swipe_hint, filename, compositor='pil'):
+        with open(filename, 'w') as f:
+            f.write(f"run {StubGenerator.run} {spec['kind']}")
+        return 0.0
+
+
+class InlinePool(ThreadPoolExecutor):
+    """ProcessPoolExecutor stand-in: same arguments, threads in this process"""
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None, initargs=()):
+        super().__init__(max_workers=max_workers, initializer=initializer, initargs=initargs)
+
+
+def run_batch(output_dir, start, end, force=False):
+    """batch_render() with the stub generator and the inline pool"""
+    saved = (sys.modules.get('generate_post_cairo'), batch_render.ProcessPoolExecutor)
+    sys.modules['generate_post_cairo'] = types.SimpleNamespace(QuranPostGeneratorCairo=StubGenerator)
+    batch_render.ProcessPoolExecutor = InlinePool
+    batch_render._WORKER_GENERATORS.clear()
+    StubGenerator.run += 1
+    StubGenerator.rendered = []
+    try:
+        return batch_render.batch_render(start, end, workers=2, output_dir=output_dir, force=force)
+    finally:
+        if saved[0] is None:
+            del sys.modules['generate_post_cairo']
+        else:
+            sys.modules['generate_post_cairo'] = saved[0]
+        batch_render.ProcessPoolExecutor = saved[1]
+        batch_render._WORKER_GENERATORS.clear()
+
+
+def slide_text(output_dir, surah, ayah):
+    with open(os.path.join(verse_dir(output_dir, surah, ayah), 'slide1.png')) as f:
+        return f.read()
+
+
+def test_partial_dirs_removed():
+    """Test 1: .tmp- directories from a crashed run are removed, published ones kept"""
+    print("\n" + "="*70)
+    print("TEST 1: Partial directories")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, '.tmp-001_002-4242'))
+        os.makedirs(os.path.join(tmp, '.tmp-001_003-4243'))
+        os.makedirs(verse_dir(tmp, 1, 1))
+        with open(os.path.join(verse_dir(tmp, 1, 1), MANIFEST_FILE), 'w') as f:
+            f.write('{}')
+
+        assert clean_partial_dirs(tmp) == 2
+        assert os.listdir(tmp) == ['001_001']
+        assert is_done(tmp, 1, 1) and not is_done(tmp, 1, 2)
+        assert clean_partial_dirs(os.path.join(tmp, 'missing')) == 0
+        print("   ✅ 2 partial directories removed, published verse kept")
+
+
+def test_resume_skips_done_verses():
+    """Test 2: A re-run renders only verses without a published manifest"""
+    print("\n" + "="*70)
+    print("TEST 2: Resume")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = run_batch(tmp, '1:1', '1:3')
+        assert first['rendered'] == 3 and first['skipped'] == 0
+        assert sorted(StubGenerator.rendered) == [(1, 1), (1, 2), (1, 3)]
+
+        os.makedirs(os.path.join(tmp, '.tmp-001_004-999'))  # Crashed mid-verse
+        second = run_batch(tmp, '1:1', '1:5')
+        assert second['rendered'] == 2 and second['skipped'] == 3
+        assert sorted(StubGenerator.rendered) == [(1, 4), (1, 5)]
+        assert not any(name.startswith('.tmp-') for name in os.listdir(tmp))
+        assert slide_text(tmp, 1, 1) == f"run {StubGenerator.run - 1} arabic"  # Untouched
+        print("   ✅ 3 done verses skipped, 2 rendered, partial directory cleaned")
+
+
+def test_force_replaces_done_verses():
+    """Test 3: force=True re-renders and replaces published carousels"""
+    print("\n" + "="*70)
+    print("TEST 3: --force")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_batch(tmp, '1:1', '1:2')
+        result = run_batch(tmp, '1:1', '1:2', force=True)
+        assert result['rendered'] == 2 and result['skipped'] == 0
+        assert slide_text(tmp, 1, 2) == f"run {StubGenerator.run} arabic"
+        assert sorted(os.listdir(verse_dir(tmp, 1, 2))) == [MANIFEST_FILE, 'slide1.png', 'slide2.png']
+        assert sorted(os.listdir(tmp)) == ['001_001', '001_002']
+        print("   ✅ Finished verses re-rendered in place")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_partial_dirs_removed,
+        test_resume_skips_done_verses,
+        test_force_replaces_done_verses,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,98 @@
+"""
+Test Cairo Pagination
+paginate_text (one LayoutIter pass) against the old word-by-word split_text_by_height loop
+(needs Cairo/Pango - renders nothing, only measures)
+"""
+
+import sys
+from cairo_renderer import CairoArabicRenderer
+
+
+# 39:53 - a long multibyte verse (UTF-8 byte offsets != str indices)
+ARABIC_VERSE = "قُلْ يَٰعِبَادِىَ ٱلَّذِينَ أَسْرَفُوا۟ عَلَىٰٓ أَنفُسِهِمْ لَا تَقْنَطُوا۟ مِن رَّحْمَةِ ٱللَّهِ ۚ إِنَّ ٱللَّهَ يَغْفِرُ ٱلذُّنُوبَ جَمِيعًا ۚ إِنَّهُۥ هُوَ ٱلْغَفُورُ ٱلرَّحِيمُ"
+LONG_ARABIC = f"۞  {' '.join([ARABIC_VERSE] * 4)}  ﴿٥٣﴾"
+LONG_TAFSIR = (
+    "In this verse Allah addresses those who have wronged themselves through sin, and forbids "
+    "them from despairing of His mercy. However great the sins, the door of repentance stays "
+    "open as long as a person lives - self-reliant/self-righteous attitudes aside, what is asked "
+    "is sincere regret, turning back to Allah and mending one's ways. Despair itself is a "
+    "trick of Satan, who wants the sinner to believe there is no way back. "
+) * 4
+
+# (name, text, font family, size, max width, line height)
+CASES = [
+    ('Arabic verse', LONG_ARABIC, "Amiri", 60, 900, 1.8),
+    ('English tafsir', LONG_TAFSIR, "Product Sans", 42, 880, 1.6),
+]
+
+
+def paginate_word_by_word(renderer, text, max_height, font_family, font_size, max_width, line_height):
+    """The old split_text_by_height loop: grow the page one word at a time, re-measuring each time"""
+    pages, current = [], []
+    for word in text.split():
+        candidate = ' '.join(current + [word])
+        if renderer.measure_text_height(candidate, font_family, font_size, max_width, line_height) <= max_height:
+            current.append(word)
+        else:
+            if current:
+                pages.append(' '.join(current))
+            current = [word]
+    if current:
+        pages.append(' '.join(current))
+    return pages
+
+
+def test_line_starts_on_word_boundaries():
+    """Test 1: Pango's UTF-8 byte offsets map onto word boundaries of the Python str"""
+    print("\n" + "="*70)
+    print("TEST 1: Byte offset → str index mapping")
+    print("="*70)
+
+    renderer = CairoArabicRenderer()
+    for name, text, family, size, width, line_height in CASES:
+        text = ' '.join(text.split())
+        lines = renderer.layout_metrics(text, family, size, width, line_height).lines
+        assert len(lines) > 3, name
+        for start, _, _ in lines[1:]:
+            assert 0 < start < len(text) and text[start - 1] in ' -/', (name, start, text[start - 5:start + 5])
+        print(f"   ✅ {name}: {len(lines)} line starts on word boundaries")
+
+
+def test_paginate_matches_word_loop():
+    """Test 2: paginate_text gives the same pages as the word-by-word loop"""
+    print("\n" + "="*70)
+    print("TEST 2: paginate_text == word-by-word loop")
+    print("="*70)
+
+    renderer = CairoArabicRenderer()
+    for name, text, family, size, width, line_height in CASES:
+        text = ' '.join(text.split())
+        for max_height in (250, 400, 700):
+            new = renderer.paginate_text(text, max_height, family, size, width, line_height)
+            old = paginate_word_by_word(renderer, text, max_height, family, size, width, line_height)
+            assert new == old, (name, max_height, len(new), len(old))
+        print(f"   ✅ {name}: same pages at 3 page heights")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_line_starts_on_word_boundaries,
+        test_paginate_matches_word_loop,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
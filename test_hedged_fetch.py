@@ -0,0 +1,194 @@
+"""
+Test Hedged Fetch
+MultiAPIQuranFetcher hedged rounds against fake providers: slow, failing, invalid (offline)
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+import http.server
+import requests
+from config import API_SETTINGS
+from provider_health import ProviderHealth
+from multi_api_quran import MultiAPIQuranFetcher
+
+
+VALID = {'arabic': 'ar', 'translation': 'en'}
+
+
+def slow(seconds, result=VALID):
+    def fetch(surah, ayah):
+        time.sleep(seconds)
+        return dict(result)
+    return fetch
+
+
+def failing(surah, ayah):
+    raise ConnectionError("down")
+
+
+def invalid(surah, ayah):
+    return {'arabic': 'ar', 'translation': 'Translation not available'}
+
+
+class HedgedFetcher:
+    """MultiAPIQuranFetcher in a temp dir with fake providers and short hedge settings"""
+
+    def __init__(self, providers, **settings):
+        self.providers = providers
+        self.settings = {'hedge_delay': 0.2, 'deadline': 2.0, **settings}
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)  # Verse store + health file are created in the working directory
+        self.saved = dict(API_SETTINGS)
+        API_SETTINGS.update(self.settings)
+
+        fetcher = MultiAPIQuranFetcher()
+        fetcher.health = ProviderHealth(os.path.join(self.tmp.name, 'health.json'))
+        fetcher.apis = [{"name": name, "priority": i, "fetch_func": fetch, "enabled": True}
+                        for i, (name, fetch) in enumerate(self.providers, 1)]
+        self.fetcher = fetcher
+        return fetcher
+
+    def __exit__(self, *exc):
+        for thread in threading.enumerate():
+            if thread.name.startswith('hedge'):
+                thread.join()  # Abandoned requests still record their outcome
+        self.fetcher.health.flush()
+        API_SETTINGS.clear()
+        API_SETTINGS.update(self.saved)
+        self.fetcher.cache.close()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+def timed_round(fetcher):
+    start = time.perf_counter()
+    result = fetcher._hedged_round(1, 1)
+    return result, time.perf_counter() - start
+
+
+def test_slow_provider_is_hedged():
+    """Test 1: A slow first provider doesn't hold the round - the hedge answers first"""
+    print("\n" + "="*70)
+    print("TEST 1: Slow provider")
+    print("="*70)
+
+    with HedgedFetcher([('Slow', slow(1.0, {'arabic': 'slow', 'translation': 'slow'})),
+                        ('Fast', slow(0.0))]) as fetcher:
+        result, elapsed = timed_round(fetcher)
+        assert result['arabic'] == 'ar'
+        assert 0.2 <= elapsed < 0.6, elapsed  # Started after hedge_delay, not after Slow finished
+        print(f"   ✅ Hedge won in {elapsed * 1000:.0f} ms")
+
+
+def test_failure_starts_next_provider_at_once():
+    """Test 2: Failing and invalid providers start the next one without waiting for hedge_delay"""
+    print("\n" + "="*70)
+    print("TEST 2: Failing / invalid providers")
+    print("="*70)
+
+    with HedgedFetcher([('Down', failing), ('Invalid', invalid), ('Working', slow(0.0))],
+                       hedge_delay=5.0) as fetcher:
+        result, elapsed = timed_round(fetcher)
+        assert result == VALID
+        assert elapsed < 1.0, elapsed
+        assert fetcher.health.stats('Down')['success_rate'] == 0.0
+        assert fetcher.health.stats('Invalid')['success_rate'] == 0.0
+        print(f"   ✅ Down → Invalid → Working in {elapsed * 1000:.0f} ms")
+
+    with HedgedFetcher([('Down', failing), ('Invalid', invalid)]) as fetcher:
+        result, elapsed = timed_round(fetcher)
+        assert result is None and elapsed < 1.0
+        print("   ✅ No valid provider → round gives up without waiting for the deadline")
+
+
+def test_deadline_ends_round():
+    """Test 3: Providers slower than the deadline are abandoned when it passes"""
+    print("\n" + "="*70)
+    print("TEST 3: Deadline")
+    print("="*70)
+
+    with HedgedFetcher([('Slow', slow(1.5)), ('Slower', slow(1.5))], deadline=0.5) as fetcher:
+        result, elapsed = timed_round(fetcher)
+        assert result is None
+        assert 0.5 <= elapsed < 1.0, elapsed
+        print(f"   ✅ Round ended after {elapsed * 1000:.0f} ms")
+
+
+class _SlowHandler(http.server.BaseHTTPRequestHandler):
+    """Answers after 2 s, counting requests"""
+    calls = 0
+
+    def do_GET(self):
+        _SlowHandler.calls += 1
+        time.sleep(2)
+        try:
+            self.send_response(200)
+            self.end_headers()
+        except OSError:
+            pass  # Client gave up
+
+    def log_message(self, *args):
+        pass
+
+
+def test_requests_capped_at_deadline():
+    """Test 4: HTTP requests inside a round time out at the deadline and aren't retried"""
+    print("\n" + "="*70)
+    print("TEST 4: Request timeout capped by the deadline")
+    print("="*70)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/verse"
+    try:
+        with HedgedFetcher([], deadline=0.5) as fetcher:
+            fetcher.apis = [{"name": "Local", "priority": 1, "enabled": True,
+                             "fetch_func": lambda surah, ayah: fetcher._get(url).json()}]
+            _SlowHandler.calls = 0
+            result, elapsed = timed_round(fetcher)
+            assert result is None and elapsed < 1.0, elapsed
+
+            # The abandoned request itself gave up at the deadline (not request_timeout × retries)
+            start = time.perf_counter()
+            try:
+                fetcher._call_api(fetcher.apis[0], 1, 1, deadline=start + 0.3)
+                assert False, "request should time out"
+            except requests.Timeout:
+                pass
+            assert time.perf_counter() - start < 1.0
+            assert _SlowHandler.calls == 2  # One per call, no transport retries
+            print(f"   ✅ Requests cut at the deadline, {_SlowHandler.calls} requests sent")
+    finally:
+        server.shutdown()
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_slow_provider_is_hedged,
+        test_failure_starts_next_provider_at_once,
+        test_deadline_ends_round,
+        test_requests_capped_at_deadline,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
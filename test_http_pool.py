@@ -0,0 +1,106 @@
+"""
+Test HTTP Pool
+Checks keep-alive reuse, per-host sessions and retry against a local HTTP server
+"""
+
+import sys
+import json
+import threading
+import http.server
+import http_pool
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Keep-alive JSON server; /flaky fails with 503 on every other request"""
+    protocol_version = 'HTTP/1.1'
+    flaky_calls = 0
+
+    def do_GET(self):
+        status = 200
+        if self.path == '/flaky':
+            _Handler.flaky_calls += 1
+            status = 503 if _Handler.flaky_calls % 2 else 200
+        body = json.dumps({'path': self.path}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_connections_are_reused():
+    """Test 1: Sequential requests to one host share one connection"""
+    print("\n" + "="*70)
+    print("TEST 1: Keep-alive reuse")
+    print("="*70)
+
+    http_pool.close_sessions()
+    server, base = start_server()
+    try:
+        for i in range(10):
+            assert http_pool.get(f"{base}/verse/{i}", timeout=5).json() == {'path': f"/verse/{i}"}
+
+        stats = http_pool.pool_stats()
+        assert stats[base] == {'requests': 10, 'connections': 1}
+        assert stats['total']['reused'] == 9
+        assert http_pool.get_session(f"{base}/other") is http_pool.get_session(base)
+        print(f"   ✅ 10 requests over {stats[base]['connections']} connection")
+    finally:
+        server.shutdown()
+        http_pool.close_sessions()
+
+
+def test_retryable_status_is_retried():
+    """Test 2: A 503 is retried by the adapter, the caller only sees the success (unless retry=False)"""
+    print("\n" + "="*70)
+    print("TEST 2: Central retry")
+    print("="*70)
+
+    http_pool.close_sessions()
+    server, base = start_server()
+    try:
+        _Handler.flaky_calls = 0
+        response = http_pool.get(f"{base}/flaky", timeout=5)
+        assert response.status_code == 200
+        assert _Handler.flaky_calls == 2
+
+        _Handler.flaky_calls = 0
+        assert http_pool.get(f"{base}/flaky", retry=False, timeout=5).status_code == 503
+        assert _Handler.flaky_calls == 1
+        print("   ✅ 503 → retried → 200, retry=False returns the 503")
+    finally:
+        server.shutdown()
+        http_pool.close_sessions()
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_connections_are_reused,
+        test_retryable_status_is_retried,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
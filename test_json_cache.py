@@ -0,0 +1,100 @@
+"""
+Test JSON Cache
+Checks write-behind batching, atomic flushes and the shared per-file instance
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from json_cache import WriteBehindCache, open_json_cache
+
+
+def test_inserts_are_batched():
+    """Test 1: Inserts don't touch the file until the timer or max_dirty fires"""
+    print("\n" + "="*70)
+    print("TEST 1: Write-behind batching")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'cache.json')
+        cache = WriteBehindCache(cache_file, flush_interval=0.2, max_dirty=10)
+
+        for i in range(5):
+            cache[f"1:{i}"] = f"text {i}"
+        assert not os.path.exists(cache_file) and cache.flushes == 0
+
+        time.sleep(0.5)
+        assert cache.flushes == 1 and cache.dirty == 0
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            assert len(json.load(f)) == 5
+
+        for i in range(5, 15):
+            cache[f"1:{i}"] = f"text {i}"
+        assert cache.flushes == 2  # max_dirty reached → flushed without waiting
+        cache.flush()
+        print(f"   ✅ 15 inserts → {cache.flushes} file writes")
+
+
+def test_flush_is_atomic_and_round_trips():
+    """Test 2: Flushed file reloads identically, no temp file left behind"""
+    print("\n" + "="*70)
+    print("TEST 2: Atomic flush")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'cache.json')
+        cache = WriteBehindCache(cache_file, flush_interval=60)
+        cache['2:255'] = "ٱللَّهُ لَآ إِلَـٰهَ إِلَّا هُوَ"
+        cache['1:1'] = "In the name of Allah"
+        del cache['1:1']
+        assert cache.flush()
+
+        assert os.listdir(tmp) == ['cache.json']
+        reloaded = WriteBehindCache(cache_file)
+        assert dict(reloaded.items()) == {'2:255': "ٱللَّهُ لَآ إِلَـٰهَ إِلَّا هُوَ"}
+        assert reloaded.flush() and reloaded.flushes == 0  # Nothing dirty → no write
+        print("   ✅ Reload matches, nothing rewritten when clean")
+
+
+def test_shared_instance_per_file():
+    """Test 3: Two fetchers on the same file share one cache"""
+    print("\n" + "="*70)
+    print("TEST 3: Shared instance")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'cache.json')
+        first = open_json_cache(cache_file)
+        second = open_json_cache(os.path.join(tmp, '.', 'cache.json'))
+        assert first is second
+        first['3:7'] = "shared"
+        assert second.get('3:7') == "shared"
+        first.flush()
+        print("   ✅ Same instance for the same path")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_inserts_are_batched,
+        test_flush_is_atomic_and_round_trips,
+        test_shared_instance_per_file,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,108 @@
+"""
+Test Posting Ledger
+Bitset + cursor bookkeeping, cycles, atomic saves and posted_verses.json migration
+"""
+
+import os
+import sys
+import json
+import tempfile
+from posting_ledger import PostingLedger
+from quran_data import TOTAL_VERSES
+
+
+def test_migrate_and_cursor():
+    """Test 1: Old index list imported; cursor is the first gap"""
+    print("\n" + "="*70)
+    print("TEST 1: Migration from posted_verses.json")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, 'posted_verses.json')
+        ledger_file = os.path.join(tmp, 'posting_ledger.json')
+        with open(legacy, 'w') as f:
+            json.dump([0, 1, 2, 4, 5], f)
+
+        ledger = PostingLedger(ledger_file, legacy)
+        assert os.path.exists(ledger_file)
+        assert ledger.posted_count == 5 and ledger.posted_in_cycle == 5
+        assert ledger.next_index() == 3
+
+        ledger.mark(3)
+        assert ledger.next_index() == 6  # Jumps over the already-posted 4 and 5
+        ledger.save()
+
+        reloaded = PostingLedger(ledger_file, legacy)  # Ledger exists → legacy list ignored
+        assert reloaded.next_index() == 6 and reloaded.posted_count == 6
+        assert reloaded.is_posted(4) and not reloaded.is_posted(6)
+        assert sorted(os.listdir(tmp)) == ['posted_verses.json', 'posting_ledger.json']  # No temp file left
+        print(f"   ✅ Cursor at {reloaded.next_index()}, {os.path.getsize(ledger_file)} bytes on disk")
+
+
+def test_skips_and_cycles():
+    """Test 2: Skipped verses don't count as posts; a full cycle wraps to 1:1"""
+    print("\n" + "="*70)
+    print("TEST 2: Skips and cycles")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = PostingLedger(os.path.join(tmp, 'posting_ledger.json'),
+                               os.path.join(tmp, 'missing.json'))
+        ledger.mark(0, post=False)
+        assert ledger.next_index() == 1 and ledger.posted_count == 0
+
+        for index in range(1, TOTAL_VERSES):
+            ledger.mark(index)
+        assert ledger.next_index() is None
+        assert ledger.posted_count == TOTAL_VERSES - 1
+
+        ledger.start_new_cycle()
+        assert ledger.cycle == 2 and ledger.next_index() == 0 and ledger.posted_in_cycle == 0
+        assert ledger.posted_count == TOTAL_VERSES - 1  # Theme rotation keeps counting
+        print("   ✅ Cycle 2 starts at 1:1, post count carried over")
+
+
+def test_peek_follows_posting_order():
+    """Test 3: peek(n) lists the next verses without changing the ledger, wrapping into the next cycle"""
+    print("\n" + "="*70)
+    print("TEST 3: Peek")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = PostingLedger(os.path.join(tmp, 'posting_ledger.json'),
+                               os.path.join(tmp, 'missing.json'))
+        for index in (0, 1, 3):
+            ledger.mark(index)
+        assert ledger.peek(3) == [2, 4, 5]
+        assert ledger.next_index() == 2 and ledger.posted_count == 3
+
+        for index in range(TOTAL_VERSES - 2):
+            ledger.mark(index)
+        assert ledger.peek(4) == [TOTAL_VERSES - 2, TOTAL_VERSES - 1, 0, 1]
+        assert [cycle for _, cycle in ledger.upcoming(4)] == [1, 1, 2, 2]  # Per-post seeds use the cycle
+        print(f"   ✅ Next: {ledger.peek(4)}")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_migrate_and_cursor,
+        test_skips_and_cycles,
+        test_peek_follows_posting_order,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,195 @@
+"""
+Test Provider Health
+Circuit breaker transitions, health ranking, persistence and fetcher routing (offline)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from config import PROVIDER_HEALTH
+from provider_health import ProviderHealth, TrialInFlight, percentile, CLOSED, OPEN, HALF_OPEN
+from json_cache import WriteBehindCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_transitions():
+    """Test 1: closed → open after consecutive failures → half-open after cooldown → closed/open"""
+    print("\n" + "="*70)
+    print("TEST 1: Breaker states")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clock = FakeClock()
+        health = ProviderHealth(os.path.join(tmp, 'health.json'), clock=clock)
+
+        for _ in range(PROVIDER_HEALTH['failure_threshold'] - 1):
+            health.record('A', False, 30.0)
+        assert health.state('A') == CLOSED
+        health.record('A', False, 30.0)
+        assert health.state('A') == OPEN and not health.allow('A')
+
+        clock.now += PROVIDER_HEALTH['cooldown']
+        assert health.state('A') == HALF_OPEN and health.allow('A')
+        health.record('A', False, 30.0)          # Trial failed → open again
+        assert health.state('A') == OPEN
+
+        clock.now += PROVIDER_HEALTH['cooldown']
+        health.record('A', True, 0.2)            # Trial succeeded → closed
+        assert health.state('A') == CLOSED
+        health.flush()
+        print("   ✅ closed → open → half-open → open → half-open → closed")
+
+
+def test_stats_and_ranking():
+    """Test 2: p50/p95 from successful requests; fastest healthy provider ranked first"""
+    print("\n" + "="*70)
+    print("TEST 2: Stats and ranking")
+    print("="*70)
+
+    assert percentile([5, 1, 4, 2, 3], 50) == 3 and percentile(list(range(1, 101)), 95) == 95
+    assert percentile([], 50) is None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        health = ProviderHealth(os.path.join(tmp, 'health.json'), clock=FakeClock())
+        for latency in (0.9, 1.0, 1.1):
+            health.record('Slow', True, latency)
+        for latency in (0.1, 0.2, 0.3):
+            health.record('Fast', True, latency)
+        for _ in range(PROVIDER_HEALTH['failure_threshold']):
+            health.record('Down', False, 30.0)
+
+        stats = health.stats('Fast')
+        assert stats['success_rate'] == 1.0 and stats['p50'] == 200 and stats['p95'] == 300
+        assert health.rank(['Slow', 'Down', 'Fast', 'New']) == ['New', 'Fast', 'Slow']
+        print(f"   ✅ Ranked: {health.rank(['Slow', 'Down', 'Fast', 'New'])}")
+
+        # Window is bounded and the state survives a restart
+        for _ in range(PROVIDER_HEALTH['window'] + 10):
+            health.record('Fast', True, 0.1)
+        assert health.flush()
+        reloaded = WriteBehindCache(os.path.join(tmp, 'health.json'))
+        assert len(reloaded['Fast']['outcomes']) == PROVIDER_HEALTH['window']
+        assert reloaded['Down']['state'] == OPEN
+        print("   ✅ Persisted, window bounded")
+
+
+def test_fetcher_skips_tripped_provider():
+    """Test 3: MultiAPIQuranFetcher never calls a tripped API while a healthy one exists"""
+    print("\n" + "="*70)
+    print("TEST 3: Fetcher routing")
+    print("="*70)
+
+    from multi_api_quran import MultiAPIQuranFetcher
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # Verse store is created in the working directory
+        try:
+            fetcher = MultiAPIQuranFetcher()
+            fetcher.health = ProviderHealth(os.path.join(tmp, 'health.json'), clock=FakeClock())
+            calls = []
+
+            def broken(surah, ayah):
+                calls.append('Broken')
+                raise ConnectionError("down")
+
+            def working(surah, ayah):
+                calls.append('Working')
+                return {'arabic': 'ar', 'translation': 'en'}
+
+            fetcher.apis = [
+                {"name": "Broken", "priority": 1, "fetch_func": broken, "enabled": True},
+                {"name": "Working", "priority": 2, "fetch_func": working, "enabled": True},
+            ]
+            fetcher.mode = 'sequential'
+
+            assert fetcher.get_verse(1, 1)['arabic'] == 'ar'
+            assert calls == ['Broken'] * PROVIDER_HEALTH['failure_threshold'] + ['Working']
+
+            calls.clear()
+            assert fetcher.get_verse(1, 2)['arabic'] == 'ar'
+            assert calls == ['Working'], calls  # Tripped API skipped, no timeout paid
+            fetcher.health.flush()
+            fetcher.cache.close()
+        finally:
+            os.chdir(cwd)
+        print("   ✅ Tripped API skipped on the next verse")
+
+
+def test_half_open_single_trial():
+    """Test 4: A half-open breaker lets exactly one trial request through until it resolves"""
+    print("\n" + "="*70)
+    print("TEST 4: One half-open trial")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clock = FakeClock()
+        health = ProviderHealth(os.path.join(tmp, 'health.json'), clock=clock)
+        for _ in range(PROVIDER_HEALTH['failure_threshold']):
+            health.record('A', False, 30.0)
+        clock.now += PROVIDER_HEALTH['cooldown']
+
+        # Concurrent hedged rounds race for the trial - one wins
+        claimed, barrier = [], threading.Barrier(8)
+
+        def claim():
+            barrier.wait()
+            try:
+                health.begin('A')
+                claimed.append(True)
+            except TrialInFlight:
+                pass
+
+        threads = [threading.Thread(target=claim) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(claimed) == 1
+        assert health.state('A') == HALF_OPEN and not health.allow('A')
+        assert health.rank(['A', 'B']) == ['B']
+
+        health.record('A', False, 30.0)          # Trial failed → open, claim released
+        assert health.state('A') == OPEN
+        clock.now += PROVIDER_HEALTH['cooldown']
+        health.begin('A')
+        health.record('A', True, 0.2)            # Trial succeeded → closed, no limit
+        health.begin('A')
+        health.begin('A')
+        assert health.state('A') == CLOSED and health.allow('A')
+        health.flush()
+        print("   ✅ 1 of 8 concurrent callers got the trial, released by its outcome")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_breaker_transitions,
+        test_stats_and_ranking,
+        test_fetcher_skips_tripped_provider,
+        test_half_open_single_trial,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,171 @@
+"""
+Test Quran Corpus
+Builds the corpus from a synthetic offline fixture and checks indexing/validation
+"""
+
+import os
+import sys
+import json
+import tempfile
+from quran_data import QURAN_STRUCTURE, TOTAL_VERSES, verse_index, get_all_verses
+from quran_corpus import load_fixture, build_corpus, store_corpus, strip_basmala, CorpusError
+from verse_store import VerseStore
+from surah_metadata import get_surah
+
+
+def make_edition(prefix):
+    """Fake /v1/quran/<edition> response: every ayah's text names its own key"""
+    surahs = []
+    for surah, total_ayahs in QURAN_STRUCTURE:
+        surahs.append({
+            'number': surah,
+            'englishName': f"Surah {surah}",
+            'name': f"سورة {surah}",
+            'ayahs': [{'numberInSurah': ayah, 'text': f"{prefix} {surah}:{ayah}"}
+                      for ayah in range(1, total_ayahs + 1)]
+        })
+    return {'code': 200, 'status': 'OK', 'data': {'surahs': surahs}}
+
+
+# The quran-uthmani edition's own 1:1 text (BOM dropped), copied from quran_cache.json
+API_BASMALA = "بِسْمِ ٱللَّهِ ٱلرَّحْمَٰنِ ٱلرَّحِيمِ"
+
+# Ayah 1 the way the edition sends it: BOM + Basmala + the verse
+API_TEXTS = {
+    (1, 1): f"\ufeff{API_BASMALA}",
+    (2, 1): f"\ufeff{API_BASMALA} الٓمٓ",
+    (9, 1): "\ufeffبَرَآءَةٌ مِّنَ ٱللَّهِ وَرَسُولِهِۦٓ",  # No Basmala before At-Tawbah
+    (112, 1): f"\ufeff{API_BASMALA} قُلْ هُوَ ٱللَّهُ أَحَدٌ",
+}
+
+
+def make_uthmani_edition():
+    """Fake quran-uthmani response: the API's own ayah 1 texts, Basmala prefix included"""
+    payload = make_edition('ar')
+    for (surah, ayah), text in API_TEXTS.items():
+        payload['data']['surahs'][surah - 1]['ayahs'][ayah - 1]['text'] = text
+    return payload
+
+
+def write_fixture(fixture_dir):
+    for edition, prefix in (('quran-uthmani', 'ar'), ('en.sahih', 'en')):
+        with open(os.path.join(fixture_dir, f"{edition}.json"), 'w', encoding='utf-8') as f:
+            json.dump(make_edition(prefix), f, ensure_ascii=False)
+
+
+def test_verse_index_matches_verse_list():
+    """Test 1: verse_index agrees with get_all_verses order"""
+    print("\n" + "="*70)
+    print("TEST 1: Global verse index")
+    print("="*70)
+
+    verses = get_all_verses()
+    assert len(verses) == TOTAL_VERSES == 6236
+    for i, verse in enumerate(verses):
+        assert verse_index(verse['surah'], verse['ayah']) == i
+
+    for bad in ((0, 1), (1, 8), (115, 1), (2, 0)):
+        try:
+            verse_index(*bad)
+            assert False, f"{bad} should be rejected"
+        except ValueError:
+            pass
+    print("   ✅ 6236 verses indexed, invalid keys rejected")
+
+
+def test_build_and_lookup_from_fixture():
+    """Test 2: Fixture build round-trips through the verse store"""
+    print("\n" + "="*70)
+    print("TEST 2: Build corpus from fixture")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_fixture(tmp)
+        data = load_fixture(tmp, ['quran-uthmani', 'en.sahih'])
+        corpus = build_corpus(data['quran-uthmani'], data['en.sahih'])
+
+        store_file = os.path.join(tmp, 'quran_store.bin')
+        with VerseStore(store_file) as store:
+            store.put(2, 255, {'arabic': 'cached', 'translation': 'cached'})
+            assert store_corpus(corpus, store) == TOTAL_VERSES - 1  # Existing verse kept
+
+        with VerseStore(store_file) as store:
+            assert store.count() == TOTAL_VERSES
+            assert store.get(2, 255)['arabic'] == 'cached'
+            for surah, ayah in ((1, 1), (9, 129), (114, 6)):
+                verse = store.get(surah, ayah)
+                assert verse['arabic'] == f"ar {surah}:{ayah}"
+                assert verse['translation'] == f"en {surah}:{ayah}"
+                assert verse['surah_name'] == get_surah(surah).name  # Local table, not the API's name
+                assert (verse['surah_number'], verse['ayah_number']) == (surah, ayah)
+            assert store.get(1, 8) is None
+        print(f"   ✅ {TOTAL_VERSES} verses, {os.path.getsize(store_file) // 1024} KB")
+
+
+def test_build_rejects_bad_structure():
+    """Test 3: Missing ayahs are caught before anything is written"""
+    print("\n" + "="*70)
+    print("TEST 3: Validation")
+    print("="*70)
+
+    arabic = make_edition('ar')['data']['surahs']
+    translation = make_edition('en')['data']['surahs']
+    translation[1]['ayahs'].pop()
+
+    try:
+        build_corpus(arabic, translation)
+        assert False, "short surah should be rejected"
+    except CorpusError as e:
+        print(f"   ✅ Rejected: {e}")
+
+
+def test_basmala_stripped():
+    """Test 4: Ayah 1 is stored without the API's Basmala prefix, except 1:1"""
+    print("\n" + "="*70)
+    print("TEST 4: Basmala")
+    print("="*70)
+
+    arabic = make_uthmani_edition()['data']['surahs']
+    corpus = build_corpus(arabic, make_edition('en')['data']['surahs'])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with VerseStore(os.path.join(tmp, 'quran_store.bin')) as store:
+            store_corpus(corpus, store)
+            assert store.get(2, 1)['arabic'] == "الٓمٓ"
+            assert store.get(1, 1)['arabic'] == API_BASMALA
+            assert store.get(9, 1)['arabic'] == "بَرَآءَةٌ مِّنَ ٱللَّهِ وَرَسُولِهِۦٓ"
+            assert store.get(112, 1)['arabic'] == "قُلْ هُوَ ٱللَّهُ أَحَدٌ"
+            assert store.get(2, 2)['arabic'] == "ar 2:2"
+
+    # Other mark encodings of the same Basmala: U+06E1 sukun, fatha before shadda
+    variant = API_BASMALA.replace('\u0652', '\u06e1').replace('\u0651\u064e', '\u064e\u0651')
+    assert variant != API_BASMALA
+    assert strip_basmala(f"{variant} الٓمٓ", 2, 1) == "الٓمٓ"
+    assert strip_basmala("بِسْمِكَ", 2, 1) == "بِسْمِكَ"  # Same letters, not the Basmala
+    print("   ✅ 2:1 stored as الٓمٓ, 1:1 keeps its Basmala")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_verse_index_matches_verse_list,
+        test_build_and_lookup_from_fixture,
+        test_build_rejects_bad_structure,
+        test_basmala_stripped,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
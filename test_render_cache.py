@@ -0,0 +1,147 @@
+"""
+Test Render Cache
+Key stability, hit/miss copies and LRU eviction (PNG files written by hand - no rendering)
+"""
+
+import os
+import sys
+import time
+import tempfile
+from render_cache import RenderCache, FINGERPRINT_SOURCES, font_files
+
+
+LAYERS = [('english', {'text': 'Indeed, with hardship comes ease.', 'font_size': 45,
+                       'text_color': (30, 30, 30), 'align': 'left'})]
+
+
+def write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_key_covers_render_inputs():
+    """Test 1: Same inputs → same key; any changed input → different key"""
+    print("\n" + "="*70)
+    print("TEST 1: Content-addressed keys")
+    print("="*70)
+
+    key = RenderCache.make_key('sage_cream', 'translation', LAYERS, True, 'pil')
+    assert key == RenderCache.make_key('sage_cream', 'translation', [list(LAYERS[0])], True, 'pil')
+
+    changed_text = [('english', dict(LAYERS[0][1], text='Indeed, with hardship comes ease!'))]
+    variants = [
+        RenderCache.make_key('teal_gold', 'translation', LAYERS, True, 'pil'),
+        RenderCache.make_key('sage_cream', 'tafsir', LAYERS, True, 'pil'),
+        RenderCache.make_key('sage_cream', 'translation', changed_text, True, 'pil'),
+        RenderCache.make_key('sage_cream', 'translation', LAYERS, False, 'pil'),
+        RenderCache.make_key('sage_cream', 'translation', LAYERS, True, 'cairo'),
+    ]
+    assert key not in variants and len(set(variants)) == len(variants)
+    print(f"   ✅ Stable key {key[:12]}…, {len(variants)} variants all distinct")
+
+
+def test_fetch_and_store():
+    """Test 2: Miss, store, then a hit copies the stored bytes; re-store and disabled cache"""
+    print("\n" + "="*70)
+    print("TEST 2: Fetch / store")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RenderCache(os.path.join(tmp, 'cache'), max_bytes=1024 * 1024, enabled=True)
+        key = RenderCache.make_key('sage_cream', 'translation', LAYERS, True, 'pil')
+        slide = os.path.join(tmp, 'slide1.png')
+        copy = os.path.join(tmp, 'slide1_again.png')
+
+        assert not cache.fetch(key, copy)
+        write_file(slide, b"rendered slide")
+        cache.store(key, slide)
+        assert cache.fetch(key, copy)
+        assert read_file(copy) == b"rendered slide"
+        assert cache.stats == {'hits': 1, 'misses': 1, 'stored': 1, 'evicted': 0}
+
+        disabled = RenderCache(os.path.join(tmp, 'cache'), enabled=False)
+        assert not disabled.fetch(key, copy)
+
+        # Storing the same key again replaces the file - the tracked size must not grow
+        for _ in range(3):
+            cache.store(key, slide)
+        assert cache.size == cache.disk_usage() == len(b"rendered slide")
+        print("   ✅ Miss → store → hit, re-store keeps the size, --no-cache bypasses the cache")
+
+
+def test_lru_eviction():
+    """Test 3: Over budget, the least recently used slides are deleted first"""
+    print("\n" + "="*70)
+    print("TEST 3: LRU eviction")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'cache')
+        cache = RenderCache(cache_dir, max_bytes=300, enabled=True)
+        slide = os.path.join(tmp, 'slide.png')
+        write_file(slide, b"x" * 100)
+
+        keys = [f"{i:064x}" for i in range(3)]
+        now = time.time()
+        for age, key in zip((30, 20, 10), keys):
+            cache.store(key, slide)
+            os.utime(os.path.join(cache_dir, f"{key}.png"), (now - age, now - age))
+
+        assert cache.fetch(keys[0], os.path.join(tmp, 'out.png'))  # Oldest becomes most recent
+        cache.store(f"{3:064x}", slide)                             # 400 bytes > 300
+
+        remaining = sorted(name[:-4] for name in os.listdir(cache_dir))
+        assert remaining == sorted([keys[0], keys[2], f"{3:064x}"]), remaining
+        assert cache.stats['evicted'] == 1 and cache.disk_usage() == 300
+        print(f"   ✅ Evicted the least recently used slide, {cache.disk_usage()} bytes kept")
+
+
+def test_fingerprint_covers_sprites_and_fonts():
+    """Test 4: Sprite rasterisation code and the configured fonts' files feed the fingerprint"""
+    print("\n" + "="*70)
+    print("TEST 4: Fingerprint inputs")
+    print("="*70)
+
+    assert 'sprite_cache.py' in FINGERPRINT_SOURCES
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'arabic'))
+        for name in ('arabic/Amiri-Regular.ttf', 'ProductSans-Bold.ttf', 'Lato-Regular.ttf', 'amiri.zip'):
+            write_file(os.path.join(tmp, name), b"font")
+        found = [os.path.relpath(path, tmp) for path in font_files(tmp, ['Amiri', 'Product Sans'])]
+        assert found == ['ProductSans-Bold.ttf', os.path.join('arabic', 'Amiri-Regular.ttf')], found
+
+    bundled = [os.path.basename(path) for path in font_files()]
+    assert 'Amiri-Regular.ttf' in bundled and 'ProductSans-Regular.ttf' in bundled
+    print(f"   ✅ sprite_cache.py + {len(bundled)} bundled font files fingerprinted")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_key_covers_render_inputs,
+        test_fetch_and_store,
+        test_lru_eviction,
+        test_fingerprint_covers_sprites_and_fonts,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,104 @@
+"""
+Test Render Queue
+Dequeue order, ledger update and stale-entry cleanup (entries written by hand - no rendering)
+"""
+
+import os
+import sys
+import json
+import tempfile
+from posting_ledger import PostingLedger
+from render_queue import RenderQueue
+from batch_render import MANIFEST_FILE
+
+
+def queue_entry(spool_dir, index, slides=2):
+    """Publish a fake carousel the way RenderQueue._publish lays it out"""
+    entry_dir = os.path.join(spool_dir, f"{index:04d}")
+    os.makedirs(entry_dir)
+    names = []
+    for i in range(1, slides + 1):
+        names.append(f"slide{i}.png")
+        with open(os.path.join(entry_dir, names[-1]), 'wb') as f:
+            f.write(f"png {index} {i}".encode())
+    manifest = {'index': index, 'theme': 'teal_gold', 'caption': f"caption {index}", 'slides': names,
+                'verse_data': {'surah_number': 1, 'ayah_number': index + 1}}
+    with open(os.path.join(entry_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+
+def test_dequeue_takes_next_verse():
+    """Test 1: Dequeue returns the ledger's next verse, copies slides, marks it posted"""
+    print("\n" + "="*70)
+    print("TEST 1: Dequeue")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_file = os.path.join(tmp, 'posting_ledger.json')
+        ledger = PostingLedger(ledger_file, os.path.join(tmp, 'missing.json'))
+        ledger.mark(0)
+        ledger.save()
+
+        spool = os.path.join(tmp, 'queue')
+        queue = RenderQueue(spool, ledger_file)
+        queue_entry(spool, 2)
+        assert queue.dequeue(os.path.join(tmp, 'output')) is None  # Verse 1 (index 1) not queued
+
+        queue_entry(spool, 1)
+        taken = queue.dequeue(os.path.join(tmp, 'output'))
+        assert taken['index'] == 1 and taken['caption'] == 'caption 1'
+        assert len(taken['slides']) == 2
+        with open(taken['slides'][1], 'rb') as f:
+            assert f.read() == b"png 1 2"
+        assert queue.queued() == [2]
+        assert PostingLedger(ledger_file).next_index() == 2
+        print(f"   ✅ Dequeued verse #2, {len(taken['slides'])} slides copied, ledger advanced")
+
+
+def test_refill_drops_posted_entries():
+    """Test 2: Entries the ledger has moved past are removed on refill"""
+    print("\n" + "="*70)
+    print("TEST 2: Stale entries")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_file = os.path.join(tmp, 'posting_ledger.json')
+        ledger = PostingLedger(ledger_file, os.path.join(tmp, 'missing.json'))
+        for index in range(3):
+            ledger.mark(index)
+        ledger.save()
+
+        spool = os.path.join(tmp, 'queue')
+        for index in range(1, 5):
+            queue_entry(spool, index)
+        os.makedirs(os.path.join(spool, '.tmp-0005-123'))  # Crashed refill
+
+        queue = RenderQueue(spool, ledger_file)
+        assert queue.refill(depth=2) == 0  # 3 and 4 already queued - nothing to render
+        assert queue.queued() == [3, 4]
+        assert sorted(os.listdir(spool)) == ['0003', '0004']
+        print("   ✅ Posted entries and partial renders removed")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_dequeue_takes_next_verse,
+        test_refill_drops_posted_entries,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
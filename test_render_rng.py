@@ -0,0 +1,66 @@
+"""
+Test Render RNG
+Per-post seeds and order-independent derived generators (no rendering)
+"""
+
+import sys
+from render_rng import PostRNG, post_seed
+
+
+def test_post_seed_per_verse_and_cycle():
+    """Test 1: Same verse + cycle → same seed; another verse or cycle → another seed"""
+    print("\n" + "="*70)
+    print("TEST 1: Post seed")
+    print("="*70)
+
+    seed = post_seed(2, 255, 1)
+    assert seed == post_seed(2, 255, 1) == post_seed(2, 255)
+    others = {post_seed(2, 255, 2), post_seed(2, 256, 1), post_seed(3, 255, 1)}
+    assert seed not in others and len(others) == 3
+    print(f"   ✅ 2:255 cycle 1 → {seed}")
+
+
+def test_decisions_independent_of_order():
+    """Test 2: A decision draws the same values whatever was drawn before it"""
+    print("\n" + "="*70)
+    print("TEST 2: Derived generators")
+    print("="*70)
+
+    words = list(range(20))
+    rng = PostRNG(post_seed(94, 5))
+    highlight = rng.random('highlight', 'Indeed, with hardship comes ease.').sample(words, 4)
+    example = rng.random('example').choice(words)
+    grain = rng.numpy('grain', 'sage_cream', 'tafsir').integers(256, size=3).tolist()
+
+    again = PostRNG(post_seed(94, 5))
+    assert again.numpy('grain', 'sage_cream', 'tafsir').integers(256, size=3).tolist() == grain
+    assert again.random('example').choice(words) == example
+    assert again.random('highlight', 'Indeed, with hardship comes ease.').sample(words, 4) == highlight
+
+    other_post = PostRNG(post_seed(94, 6))
+    assert other_post.random('highlight', 'Indeed, with hardship comes ease.').sample(words, 4) != highlight
+    print(f"   ✅ Highlights {highlight}, example {example}, grain {grain} - reproduced in reverse order")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_post_seed_per_verse_and_cycle,
+        test_decisions_independent_of_order,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
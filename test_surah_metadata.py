@@ -0,0 +1,106 @@
+"""
+Test Surah Metadata
+Checks the local surah table against known totals and boundaries
+"""
+
+import sys
+from surah_metadata import (
+    SURAHS, TOTAL_VERSES, MEDINAN, JUZ_STARTS, SAJDAH_VERSES, HIZB_QUARTER_STARTS, PAGE_STARTS,
+    get_surah, verse_index, verse_key, juz_of, is_sajdah, hizb_quarter_of, hizb_of, page_of
+)
+
+
+def test_table_totals():
+    """Test 1: 114 surahs, 6,236 verses, 28 Medinan surahs, contiguous offsets"""
+    print("\n" + "="*70)
+    print("TEST 1: Surah table")
+    print("="*70)
+
+    assert len(SURAHS) == 114 and TOTAL_VERSES == 6236
+    assert sum(1 for surah in SURAHS if surah.revelation == MEDINAN) == 28
+    assert [surah.number for surah in SURAHS] == list(range(1, 115))
+    for previous, surah in zip(SURAHS, SURAHS[1:]):
+        assert surah.offset == previous.offset + previous.ayahs
+    assert get_surah(2).ayahs == 286 and get_surah(2).name_arabic == "البقرة"
+    assert get_surah(2).translation == "The Cow" and all(surah.translation for surah in SURAHS)
+    assert get_surah(108).ayahs == 3  # Shortest surah
+    print("   ✅ 114 surahs, 6236 verses, offsets contiguous")
+
+
+def test_index_round_trip():
+    """Test 2: verse_key inverts verse_index for every verse"""
+    print("\n" + "="*70)
+    print("TEST 2: Global index round trip")
+    print("="*70)
+
+    for index in range(TOTAL_VERSES):
+        assert verse_index(*verse_key(index)) == index
+    assert verse_key(0) == (1, 1) and verse_key(TOTAL_VERSES - 1) == (114, 6)
+    print("   ✅ All 6236 verses round-trip")
+
+
+def test_juz_and_sajdah():
+    """Test 3: Juz boundaries and prostration verses"""
+    print("\n" + "="*70)
+    print("TEST 3: Juz + sajdah")
+    print("="*70)
+
+    assert len(JUZ_STARTS) == 30 and len(SAJDAH_VERSES) == 15
+    for juz, (surah, ayah) in enumerate(JUZ_STARTS, 1):
+        assert juz_of(surah, ayah) == juz
+        if juz > 1:
+            assert juz_of(*verse_key(verse_index(surah, ayah) - 1)) == juz - 1
+    assert juz_of(2, 255) == 3 and juz_of(114, 6) == 30
+    assert is_sajdah(32, 15) and not is_sajdah(32, 14)
+    print("   ✅ 30 juz starts, 15 sajdah verses")
+
+
+def test_hizb_and_page():
+    """Test 4: Hizb-quarter and page boundaries"""
+    print("\n" + "="*70)
+    print("TEST 4: Hizb + page")
+    print("="*70)
+
+    assert len(HIZB_QUARTER_STARTS) == 240 and len(PAGE_STARTS) == 604
+    for starts, lookup in ((HIZB_QUARTER_STARTS, hizb_quarter_of), (PAGE_STARTS, page_of)):
+        for number, (surah, ayah) in enumerate(starts, 1):
+            assert lookup(surah, ayah) == number
+            if number > 1:
+                assert lookup(*verse_key(verse_index(surah, ayah) - 1)) == number - 1
+
+    # Every juz is 8 hizb quarters; juz start pages of the Madani mushaf (~20 pages each)
+    juz_pages = [1, 22, 42, 62, 82, 102, 121, 142, 162, 182, 201, 222, 242, 262, 282,
+                 302, 322, 342, 362, 382, 402, 422, 442, 462, 482, 502, 522, 542, 562, 582]
+    for juz, (surah, ayah) in enumerate(JUZ_STARTS, 1):
+        assert hizb_quarter_of(surah, ayah) == 8 * (juz - 1) + 1
+        assert page_of(surah, ayah) == juz_pages[juz - 1]
+    assert hizb_of(2, 255) == 5 and hizb_of(114, 6) == 60
+    assert page_of(2, 255) == 42 and page_of(18, 1) == 293 and page_of(36, 1) == 440
+    assert page_of(67, 1) == 562 and page_of(114, 6) == 604
+    print("   ✅ 240 hizb quarters, 604 pages")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_table_totals,
+        test_index_round_trip,
+        test_juz_and_sajdah,
+        test_hizb_and_page,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
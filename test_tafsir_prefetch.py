@@ -0,0 +1,124 @@
+"""
+Test Tafsir Prefetch
+Compressed tafsir store, author extraction and the bounded prefetch job (offline)
+"""
+
+import os
+import sys
+import json
+import tempfile
+import threading
+from quran_data import TOTAL_VERSES, verse_index
+from tafsir_store import TafsirStore
+from tafsir_prefetch import prefetch
+from auto_tafsir_fetcher import extract_tafsir
+
+
+def test_store_round_trip():
+    """Test 1: Text is compressed on disk and read back per ayah"""
+    print("\n" + "="*70)
+    print("TEST 1: Compressed tafsir store")
+    print("="*70)
+
+    text = "This verse teaches patience and gratitude. " * 40
+    with tempfile.TemporaryDirectory() as tmp:
+        store_file = os.path.join(tmp, 'tafsir_store.bin')
+        with TafsirStore(store_file) as store:
+            store.put(2, 255, text)
+            store.put(1, 1, '')
+            empty_size = os.path.getsize(store_file)
+
+        with TafsirStore(store_file) as store:
+            assert store.get(2, 255) == text
+            assert store.get(1, 1) == ''          # Known to have no tafsir
+            assert store.get(1, 2) is None        # Never fetched
+            assert store.count() == 2
+        print(f"   ✅ {len(text)} chars stored in {empty_size - 16 - 16 * TOTAL_VERSES} bytes")
+
+        json_file = os.path.join(tmp, 'tafsir_cache.json')
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump({"3:1": "Alif Lam Meem", "2:255": "ignored"}, f)
+        with TafsirStore(store_file) as store:
+            assert store.import_json(json_file) == 1  # Stored ayahs kept
+            assert store.get(3, 1) == "Alif Lam Meem"
+        print("   ✅ JSON cache imported")
+
+
+def test_extract_author():
+    """Test 2: Only the configured author is kept, HTML stripped"""
+    print("\n" + "="*70)
+    print("TEST 2: Author extraction")
+    print("="*70)
+
+    data = {'tafsirs': [
+        {'author': 'Ibn Kathir', 'content': 'Long commentary'},
+        {'author': 'Tazkirul Quran', 'content': '<p>Short\n\n  commentary</p>'}
+    ]}
+    assert extract_tafsir(data) == 'Short commentary'
+    assert extract_tafsir(data, 'Ibn Kathir') == 'Long commentary'
+    assert extract_tafsir({'tafsirs': []}) is None
+    print("   ✅ Tazkirul entry extracted")
+
+
+def test_prefetch_bounded_and_resumable():
+    """Test 3: Prefetch skips stored ayahs, respects limit/workers, retries failures"""
+    print("\n" + "="*70)
+    print("TEST 3: Prefetch job")
+    print("="*70)
+
+    in_flight = [0, 0]  # current, peak
+    lock = threading.Lock()
+
+    def fake_fetch(surah, ayah):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        try:
+            if ayah == 3:
+                raise ConnectionError("offline")
+            return '' if ayah == 4 else f"tafsir {surah}:{ayah}"
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with TafsirStore(os.path.join(tmp, 'tafsir_store.bin')) as store:
+            store.put(2, 1, 'already here')
+            indices = range(verse_index(2, 1), verse_index(2, 286) + 1)
+
+            stats = prefetch(store, indices, workers=3, limit=10, fetch=fake_fetch)
+            assert stats == {'stored': 8, 'empty': 1, 'failed': 1, 'skipped': 1}, stats
+            assert in_flight[1] <= 3
+            assert store.get(2, 1) == 'already here'
+            assert store.get(2, 2) == 'tafsir 2:2'
+            assert store.get(2, 3) is None and store.get(2, 4) == ''
+
+            stats = prefetch(store, indices, workers=3, fetch=fake_fetch)
+            assert stats['skipped'] == 10 and stats['failed'] == 1  # 2:3 retried
+            assert store.get(2, 286) == 'tafsir 2:286'
+        print(f"   ✅ Peak {in_flight[1]} downloads in flight, resumed where it stopped")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_store_round_trip,
+        test_extract_author,
+        test_prefetch_bounded_and_resumable,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
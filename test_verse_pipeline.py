@@ -0,0 +1,116 @@
+"""
+Test Verse Pipeline
+Checks that verse + tafsir are fetched concurrently, merged, and bounded
+"""
+
+import sys
+import time
+import threading
+from verse_pipeline import VersePipeline
+
+
+class SlowVerseClient:
+    """Stands in for QuranAPI: fixed latency, records peak concurrency"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_verse(self, surah, ayah):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if ayah == 99:
+            return None
+        return {'arabic': f"ar {surah}:{ayah}", 'translation': f"en {surah}:{ayah}",
+                'surah_number': surah, 'ayah_number': ayah}
+
+
+class SlowTafsirClient:
+    def __init__(self, delay, fail=False):
+        self.delay = delay
+        self.fail = fail
+
+    def fetch_tafsir(self, surah, ayah):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("tafsir API down")
+        return f"tafsir {surah}:{ayah}"
+
+
+def test_verse_and_tafsir_overlap():
+    """Test 1: One ayah costs max(verse, tafsir), not the sum"""
+    print("\n" + "="*70)
+    print("TEST 1: Verse + tafsir fetched concurrently")
+    print("="*70)
+
+    pipeline = VersePipeline(SlowVerseClient(0.3), SlowTafsirClient(0.3))
+    start = time.perf_counter()
+    record = pipeline.fetch({'surah': 2, 'ayah': 255, 'theme': 'teal_gold'})
+    elapsed = time.perf_counter() - start
+
+    assert record['arabic'] == "ar 2:255" and record['tafsir'] == "tafsir 2:255"
+    assert record['theme'] == 'teal_gold'
+    assert elapsed < 0.5, f"took {elapsed:.2f}s"
+    print(f"   ✅ Merged record in {elapsed:.2f}s (serial would be 0.6s)")
+
+
+def test_many_bounded_and_ordered():
+    """Test 2: Many ayahs keep input order and never exceed the concurrency limit"""
+    print("\n" + "="*70)
+    print("TEST 2: Bounded fetch_many")
+    print("="*70)
+
+    verses = SlowVerseClient(0.1)
+    pipeline = VersePipeline(verses, SlowTafsirClient(0.05), concurrency=2)
+    metas = [{'surah': 1, 'ayah': ayah, 'theme': 'sage_cream'} for ayah in (1, 2, 99, 4, 5, 6)]
+    records = pipeline.fetch_many(metas)
+
+    assert [r and r['ayah_number'] for r in records] == [1, 2, None, 4, 5, 6]
+    assert verses.peak == 2, f"peak concurrency {verses.peak}"
+    print(f"   ✅ 6 ayahs, 1 missing → None, peak concurrency {verses.peak}")
+
+
+def test_tafsir_failure_falls_back():
+    """Test 3: A tafsir error keeps the verse (manual excerpt or None)"""
+    print("\n" + "="*70)
+    print("TEST 3: Tafsir failure")
+    print("="*70)
+
+    pipeline = VersePipeline(SlowVerseClient(0), SlowTafsirClient(0, fail=True))
+    with_excerpt = pipeline.fetch({'surah': 1, 'ayah': 1, 'theme': 't', 'tafsir_excerpt': 'manual'})
+    without = pipeline.fetch({'surah': 1, 'ayah': 2, 'theme': 't'})
+
+    assert with_excerpt['tafsir'] == 'manual'
+    assert without['tafsir'] is None and without['arabic'] == "ar 1:2"
+    print("   ✅ Verse kept, tafsir fell back")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_verse_and_tafsir_overlap,
+        test_many_bounded_and_ordered,
+        test_tafsir_failure_falls_back,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,135 @@
+"""
+Test Verse Store
+Checks lookups, persistence, crash safety and migration of the binary verse cache
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from verse_store import VerseStore, VerseStoreError, open_verse_store, SLOT, HEADER
+from quran_data import TOTAL_VERSES, verse_index
+
+
+def make_verse(surah, ayah):
+    return {
+        'arabic': f"آية {surah}:{ayah}",
+        'translation': f"Verse {surah}:{ayah}",
+        'surah_name': f"Surah {surah}",
+        'surah_name_arabic': f"سورة {surah}",
+        'surah_number': surah,
+        'ayah_number': ayah
+    }
+
+
+def test_put_get_and_reopen():
+    """Test 1: Stored verses survive reopening, dict-style access works"""
+    print("\n" + "="*70)
+    print("TEST 1: Put / get / reopen")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_file = os.path.join(tmp, 'store.bin')
+        with VerseStore(store_file) as store:
+            assert store.created and store.count() == 0
+            store.put(1, 1, make_verse(1, 1))
+            store['2:255'] = make_verse(2, 255)
+            store.put(1, 1, {**make_verse(1, 1), 'translation': 'updated'})
+
+        with VerseStore(store_file) as store:
+            assert not store.created
+            assert store.count() == len(store) == 2
+            assert store.get(1, 1)['translation'] == 'updated'
+            assert store['2:255'] == make_verse(2, 255)
+            assert '2:254' not in store and '0:1' not in store
+            assert store.get(115, 1) is None
+
+            del store['2:255']
+            assert '2:255' not in store
+            store.compact()
+            assert store.count() == 1 and store.get(1, 1)['translation'] == 'updated'
+        print("   ✅ 2 verses stored, updated, deleted, compacted")
+
+
+def test_torn_slot_is_a_miss():
+    """Test 2: A slot whose CRC doesn't match its record reads as not cached"""
+    print("\n" + "="*70)
+    print("TEST 2: Torn write detection")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_file = os.path.join(tmp, 'store.bin')
+        with VerseStore(store_file) as store:
+            store.put(3, 7, make_verse(3, 7))
+
+        slot_pos = HEADER.size + SLOT.size * verse_index(3, 7)
+        with open(store_file, 'r+b') as f:
+            f.seek(slot_pos)
+            offset, length, crc = SLOT.unpack(f.read(SLOT.size))
+            f.seek(slot_pos)
+            f.write(SLOT.pack(offset, length + 1, crc))
+
+        with VerseStore(store_file) as store:
+            assert store.get(3, 7) is None and '3:7' not in store
+        print("   ✅ Corrupt slot ignored")
+
+        with open(store_file, 'r+b') as f:
+            f.write(b'NOTASTOR')
+        try:
+            VerseStore(store_file)
+            assert False, "bad magic should be rejected"
+        except VerseStoreError:
+            print("   ✅ Foreign file rejected")
+
+
+def test_migration_and_flat_startup():
+    """Test 3: JSON cache is imported once; opening a full store stays cheap"""
+    print("\n" + "="*70)
+    print("TEST 3: Migration + startup cost")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, 'quran_cache.json')
+        with open(legacy, 'w', encoding='utf-8') as f:
+            json.dump({'1:1': make_verse(1, 1), '2:3': make_verse(2, 3), 'bad': {}}, f)
+
+        store_file = os.path.join(tmp, 'store.bin')
+        with open_verse_store(store_file, legacy) as store:
+            assert store.get(2, 3) == make_verse(2, 3) and store.count() == 2
+
+        with VerseStore(store_file) as store:
+            store.put_many((v['surah_number'], v['ayah_number'], v)
+                           for v in (make_verse(s, a) for s, a in [(2, i) for i in range(1, 287)]))
+
+        start = time.perf_counter()
+        with open_verse_store(store_file, legacy) as store:
+            verse = store.get(2, 286)
+        elapsed = time.perf_counter() - start
+        assert verse == make_verse(2, 286)
+        print(f"   ✅ Migrated 2 verses, reopen + lookup in {elapsed * 1000:.2f}ms")
+
+
+def run_all_tests():
+    """Run all tests"""
+    tests = [
+        test_put_get_and_reopen,
+        test_torn_slot_is_a_miss,
+        test_migration_and_flat_startup,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ {test.__name__} FAILED: {e}")
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -32,7 +32,22 @@ def verify_files():
         'auto_tafsir_fetcher.py',
         'instagram_poster.py',
         'quran_api.py',
+        'quran_corpus.py',
+        'surah_metadata.py',
+        'verse_store.py',
+        'json_cache.py',
+        'http_pool.py',
+        'verse_pipeline.py',
+        'tafsir_store.py',
+        'tafsir_prefetch.py',
+        'provider_health.py',
+        'posting_ledger.py',
+        'render_queue.py',
         'cairo_renderer.py',
+        'background_engine.py',
+        'sprite_cache.py',
+        'render_cache.py',
+        'render_rng.py',
         'font_manager.py',
         'requirements.txt',
         'get_instagram_session.py',
@@ -212,7 +227,7 @@ def verify_gitignore():
             "Excludes __pycache__": '__pycache__' in content,
             "Excludes output images": 'output/*.png' in content,
             "Excludes .env": '.env' in content,
-            "Mentions cache tracking": 'posted_verses.json' in content or 'tafsir_cache' in content,  # Should mention these are tracked
+            "Mentions cache tracking": 'posting_ledger.json' in content or 'posted_verses.json' in content or 'tafsir_cache' in content,  # Should mention these are tracked
         }
         
         all_ok = all(checks.values())
@@ -0,0 +1,106 @@
+"""
+Verse Pipeline - fetch verse text and tafsir concurrently
+✅ Verse (Arabic + translation + surah names) and tafsir fetched at the SAME time
+✅ One ayah or many - bounded by a concurrency limit (asyncio.Semaphore)
+✅ Returns ONE merged record per ayah (same shape generate_post always used)
+✅ Sync wrappers for existing callers - async is an implementation detail
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+from config import API_SETTINGS
+
+
+class VersePipeline:
+    """
+    Async fetch pipeline over the existing (blocking) clients
+
+    The clients keep their caches, pooled HTTP sessions and provider
+    fallback; each blocking call runs in a worker thread via
+    asyncio.to_thread, so the verse and tafsir round-trips overlap.
+    """
+
+    def __init__(self, api, tafsir_fetcher, concurrency=None):
+        """
+        Args:
+            api: Verse client with get_verse(surah, ayah) (QuranAPI / MultiAPIQuranFetcher)
+            tafsir_fetcher: Tafsir client with fetch_tafsir(surah, ayah) (AutoTafsirFetcher)
+            concurrency: Max ayahs in flight at once (default API_SETTINGS['pipeline_concurrency'])
+        """
+        self.api = api
+        self.tafsir_fetcher = tafsir_fetcher
+        self.concurrency = concurrency or API_SETTINGS['pipeline_concurrency']
+
+    @staticmethod
+    def merge(verse_meta, verse_data, api_tafsir):
+        """
+        Combine verse text, tafsir and verse metadata into one record
+
+        Priority for tafsir: API tafsir > manual 'tafsir_excerpt' from quran_data.py > None
+
+        Returns:
+            Merged verse_data dict, or None if the verse text is missing
+        """
+        if not verse_data:
+            return None
+
+        verse_data = dict(verse_data)  # Don't mutate the client's cached record
+        if api_tafsir:
+            verse_data['tafsir'] = api_tafsir
+        elif 'tafsir_excerpt' in verse_meta:
+            verse_data['tafsir'] = verse_meta['tafsir_excerpt']
+        else:
+            verse_data['tafsir'] = None
+
+        verse_data['theme'] = verse_meta['theme']
+        return verse_data
+
+    async def _fetch_tafsir(self, surah, ayah):
+        """Tafsir is optional - a failure must never sink the verse"""
+        try:
+            return await asyncio.to_thread(self.tafsir_fetcher.fetch_tafsir, surah, ayah)
+        except Exception as e:
+            print(f"⚠️  Tafsir fetch failed for {surah}:{ayah}: {type(e).__name__}: {e}")
+            return None
+
+    async def fetch_async(self, verse_meta, semaphore=None) -> Optional[Dict]:
+        """
+        Fetch one ayah's verse text and tafsir concurrently
+
+        Args:
+            verse_meta: Entry from get_all_verses() - {'surah', 'ayah', 'theme', ...}
+            semaphore: Shared limit when called from fetch_many_async
+
+        Returns:
+            Merged verse_data dict, or None if the verse could not be fetched
+        """
+        surah, ayah = verse_meta['surah'], verse_meta['ayah']
+        semaphore = semaphore or asyncio.Semaphore(1)
+
+        async with semaphore:
+            verse_data, api_tafsir = await asyncio.gather(
+                asyncio.to_thread(self.api.get_verse, surah, ayah),
+                self._fetch_tafsir(surah, ayah)
+            )
+
+        return self.merge(verse_meta, verse_data, api_tafsir)
+
+    async def fetch_many_async(self, verse_metas) -> List[Optional[Dict]]:
+        """
+        Fetch many ayahs, at most `concurrency` at a time
+
+        Returns:
+            Merged records in the same order as verse_metas (None where fetching failed)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(*(self.fetch_async(meta, semaphore) for meta in verse_metas))
+
+    # ===== SYNC API =====
+
+    def fetch(self, verse_meta) -> Optional[Dict]:
+        """Blocking wrapper around fetch_async (for non-async callers)"""
+        return asyncio.run(self.fetch_async(verse_meta))
+
+    def fetch_many(self, verse_metas) -> List[Optional[Dict]]:
+        """Blocking wrapper around fetch_many_async"""
+        return asyncio.run(self.fetch_many_async(list(verse_metas)))
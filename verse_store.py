@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Verse Store - compact binary verse cache (replaces quran_cache.json)
+✅ One fixed index slot per ayah - O(1) lookup by global ayah index
+✅ Memory-mapped reads - opening the store parses nothing, however full it is
+✅ Append-only data region - a new verse never rewrites the file
+✅ Crash-safe: record is fsynced before its slot, slots carry a CRC32
+✅ One-shot migration from the old quran_cache.json
+
+File layout:
+    header   16 bytes   magic, format version, slot count
+    index    16 bytes per ayah (6,236 slots): data offset, length, CRC32
+    data     UTF-8 JSON verse records, appended in arrival order
+
+Usage:
+    python verse_store.py --migrate            # Import quran_cache.json
+    python verse_store.py --stats              # Show how many verses are stored
+    python verse_store.py --compact            # Drop superseded records
+"""
+
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+import argparse
+import threading
+from typing import Dict, Optional
+from config import VERSE_STORE
+from quran_data import QURAN_STRUCTURE, TOTAL_VERSES, verse_index
+
+try:
+    import fcntl  # POSIX only - serialises appends from concurrent processes
+except ImportError:
+    fcntl = None
+
+
+STORE_MAGIC = b'NFQVERSE'
+STORE_VERSION = 1
+HEADER = struct.Struct('<8sHHI')   # magic, version, reserved, slot count
+SLOT = struct.Struct('<QII')       # data offset (0 = empty), length, CRC32
+
+
+class VerseStoreError(Exception):
+    """Store file is missing, corrupt or was written by another format version"""
+
+
+def parse_key(key):
+    """Parse "surah:ayah" into a (surah, ayah) tuple of ints"""
+    surah, ayah = key.split(':')
+    return int(surah), int(ayah)
+
+
+class VerseStore:
+    """
+    Binary verse cache keyed by global ayah index
+
+    Also behaves like the old cache dict for "surah:ayah" keys
+    (`key in store`, `store[key]`, `store[key] = verse`, `del store[key]`).
+
+    Subclasses store other per-ayah data in the same format by overriding
+    MAGIC / KIND and _encode / _decode (see TafsirStore).
+    """
+
+    MAGIC = STORE_MAGIC
+    KIND = 'verse'
+
+    def __init__(self, store_file=None):
+        """
+        Args:
+            store_file: Path of the store (created empty if it doesn't exist)
+        """
+        self.store_file = store_file or VERSE_STORE['file']
+        self.created = not os.path.exists(self.store_file)
+        if self.created:
+            self._create_empty(self.store_file)
+
+        self._lock = threading.RLock()  # Fetcher threads share one store
+        self._file = open(self.store_file, 'r+b')
+        self._map = None
+        self._remap()
+
+        magic, version, _, slots = HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC or version != STORE_VERSION or slots != TOTAL_VERSES:
+            self.close()
+            raise VerseStoreError(f"{self.store_file} is not a v{STORE_VERSION} {self.KIND} store")
+
+    def _encode(self, value) -> bytes:
+        """Record value -> stored bytes (compact UTF-8 JSON)"""
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def _decode(self, payload: bytes):
+        """Stored bytes -> record value"""
+        return json.loads(payload.decode('utf-8'))
+
+    def _create_empty(self, store_file):
+        """Write header + all-empty index atomically"""
+        tmp_file = f"{store_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(HEADER.pack(self.MAGIC, STORE_VERSION, 0, TOTAL_VERSES))
+            f.write(bytes(SLOT.size * TOTAL_VERSES))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, store_file)
+
+    def _remap(self):
+        """(Re)map the whole file - needed once appends grow it past the current mapping"""
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        """Unmap and close the store file"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ===== READS =====
+
+    def get_index(self, index: int) -> Optional[Dict]:
+        """
+        Verse record at a global ayah index (see quran_data.verse_index)
+
+        Returns:
+            Verse dict, or None if the slot is empty or fails its CRC check
+        """
+        payload = self._read_raw(index)
+        return None if payload is None else self._decode(payload)
+
+    def _read_raw(self, index):
+        """Stored bytes for a slot (None if empty or torn)"""
+        with self._lock:
+            offset, length, crc = SLOT.unpack_from(self._map, HEADER.size + SLOT.size * index)
+            if offset == 0:
+                return None
+
+            if offset + length > len(self._map):
+                self._remap()  # Appended (by us or another process) since we mapped
+                if offset + length > len(self._map):
+                    return None
+
+            payload = self._map[offset:offset + length]
+        if zlib.crc32(payload) != crc:
+            return None  # Torn write from a crash - treat as not cached
+        return payload
+
+    def get(self, surah: int, ayah: int) -> Optional[Dict]:
+        """Verse record for surah:ayah (None if not stored or not a real verse)"""
+        try:
+            index = verse_index(surah, ayah)
+        except ValueError:
+            return None
+        return self.get_index(index)
+
+    def has_index(self, index: int) -> bool:
+        """True if the slot is filled (doesn't read or verify the record)"""
+        with self._lock:  # put_many may be remapping the file
+            offset, _, _ = SLOT.unpack_from(self._map, HEADER.size + SLOT.size * index)
+        return offset != 0
+
+    def count(self) -> int:
+        """Number of filled slots"""
+        with self._lock:
+            return sum(1 for index in range(TOTAL_VERSES) if self.has_index(index))
+
+    # ===== WRITES =====
+
+    def put(self, surah: int, ayah: int, verse: Dict):
+        """
+        Append a verse record and point its slot at it
+
+        The record is fsynced before the 16-byte slot is written, so a crash
+        leaves either the old slot (verse still missing) or a complete record.
+        """
+        self.put_many([(surah, ayah, verse)])
+
+    def put_many(self, verses):
+        """
+        Append several verse records with one fsync for the data and one for the slots
+
+        Args:
+            verses: Iterable of (surah, ayah, verse dict)
+        """
+        self._append([(verse_index(surah, ayah), self._encode(verse)) for surah, ayah, verse in verses])
+
+    def _append(self, records):
+        """Write (index, payload bytes) records: data first + fsync, then slots + fsync"""
+        if not records:
+            return
+
+        with self._locked():
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            slots = []
+            for index, payload in records:
+                self._file.write(payload)
+                slots.append((index, SLOT.pack(offset, len(payload), zlib.crc32(payload))))
+                offset += len(payload)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+            for index, slot in slots:
+                self._file.seek(HEADER.size + SLOT.size * index)
+                self._file.write(slot)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def delete(self, surah: int, ayah: int):
+        """Empty a verse's slot (the old record stays in the data region until --compact)"""
+        with self._locked():
+            self._file.seek(HEADER.size + SLOT.size * verse_index(surah, ayah))
+            self._file.write(bytes(SLOT.size))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _locked(self):
+        return _FileLock(self._file, self._lock)
+
+    # ===== DICT-STYLE ACCESS ("surah:ayah" keys, like the old cache) =====
+
+    def __contains__(self, key):
+        try:
+            return self.get(*parse_key(key)) is not None
+        except ValueError:
+            return False
+
+    def __getitem__(self, key):
+        verse = self.get(*parse_key(key))
+        if verse is None:
+            raise KeyError(key)
+        return verse
+
+    def __setitem__(self, key, verse):
+        self.put(*parse_key(key), verse)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.delete(*parse_key(key))
+
+    def __len__(self):
+        return self.count()
+
+    # ===== MAINTENANCE =====
+
+    def import_json(self, json_file, overwrite=False) -> int:
+        """
+        Import a {"surah:ayah": verse} JSON cache (the old quran_cache.json format)
+
+        Args:
+            json_file: Path of the JSON cache
+            overwrite: Replace verses that are already stored
+
+        Returns:
+            Number of verses imported
+        """
+        with open(json_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+
+        batch = []
+        for key, verse in cache.items():
+            try:
+                surah, ayah = parse_key(key)
+                index = verse_index(surah, ayah)
+            except ValueError:
+                print(f"⚠️  Skipping invalid cache key {key!r}")
+                continue
+            if overwrite or not self.has_index(index):
+                batch.append((surah, ayah, verse))
+
+        self.put_many(batch)
+        return len(batch)
+
+    def compact(self):
+        """Rewrite the store without superseded/deleted records (atomic replace)"""
+        tmp_file = f"{self.store_file}.compact"
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+        with type(self)(tmp_file) as compacted:
+            records = ((index, self._read_raw(index)) for index in range(TOTAL_VERSES))
+            compacted._append([(index, payload) for index, payload in records if payload is not None])
+
+        with self._lock:
+            self._map.close()
+            self._file.close()
+            os.replace(tmp_file, self.store_file)
+            self._file = open(self.store_file, 'r+b')
+            self._map = None
+            self._remap()
+
+
+class _FileLock:
+    """Thread lock + exclusive advisory file lock while writing (file lock is a no-op without fcntl)"""
+
+    def __init__(self, file, thread_lock):
+        self.file = file
+        self.thread_lock = thread_lock
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.thread_lock.release()
+
+
+def open_verse_store(store_file=None, legacy_cache=None):
+    """
+    Open the verse store, migrating the old JSON cache the first time
+
+    Args:
+        store_file: Store path (default: VERSE_STORE['file'])
+        legacy_cache: Old JSON cache to import when the store is new
+                      (default: VERSE_STORE['legacy_cache'])
+
+    Returns:
+        VerseStore
+    """
+    store = VerseStore(store_file)
+    legacy_cache = legacy_cache or VERSE_STORE['legacy_cache']
+
+    if store.created and os.path.exists(legacy_cache):
+        try:
+            imported = store.import_json(legacy_cache)
+            print(f"📦 Migrated {imported} verses from {legacy_cache} to {store.store_file}")
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not migrate {legacy_cache}: {e}")
+
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the binary verse store")
+    parser.add_argument('--store', default=VERSE_STORE['file'],
+                        help=f"Store file (default: {VERSE_STORE['file']})")
+    parser.add_argument('--migrate', nargs='?', const=VERSE_STORE['legacy_cache'], default=None,
+                        metavar='JSON', help=f"Import a JSON cache (default: {VERSE_STORE['legacy_cache']})")
+    parser.add_argument('--overwrite', action='store_true', help='With --migrate: replace stored verses')
+    parser.add_argument('--compact', action='store_true', help='Drop superseded records')
+    parser.add_argument('--stats', action='store_true', help='Show store statistics')
+    args = parser.parse_args()
+
+    try:
+        store = VerseStore(args.store)
+    except VerseStoreError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    with store:
+        if args.migrate:
+            imported = store.import_json(args.migrate, overwrite=args.overwrite)
+            print(f"✅ Imported {imported} verses from {args.migrate}")
+
+        if args.compact:
+            before = os.path.getsize(store.store_file)
+            store.compact()
+            print(f"✅ Compacted {before // 1024} KB → {os.path.getsize(store.store_file) // 1024} KB")
+
+        if args.stats or not (args.migrate or args.compact):
+            stored = store.count()
+            complete = sum(
+                1 for surah, total_ayahs in QURAN_STRUCTURE
+                if all(store.has_index(verse_index(surah, ayah)) for ayah in range(1, total_ayahs + 1))
+            )
+            print(f"📊 {store.store_file}: {stored}/{TOTAL_VERSES} verses, "
+                  f"{complete}/{len(QURAN_STRUCTURE)} complete surahs, "
+                  f"{os.path.getsize(store.store_file) // 1024} KB")
+
+
+if __name__ == "__main__":
+    main()